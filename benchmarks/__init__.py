@@ -0,0 +1,6 @@
+"""Synthetic-catalog benchmarks for the admin API."""
+
+from benchmarks.catalog import CatalogSpec, generate_records, seed_database
+from benchmarks.runner import percentiles, run_benchmark
+
+__all__ = ["CatalogSpec", "generate_records", "percentiles", "run_benchmark", "seed_database"]
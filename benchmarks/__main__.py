@@ -0,0 +1,52 @@
+"""Command line entry point: ``python -m benchmarks [options]``."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from benchmarks.catalog import CatalogSpec
+from benchmarks.runner import run_benchmark
+
+
+def main(argv: list[str] | None = None) -> int:
+    defaults = CatalogSpec()
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark the admin API against a synthetic catalog.",
+    )
+    parser.add_argument("--tools", type=int, default=defaults.tools)
+    parser.add_argument("--folder-depth", type=int, default=defaults.folder_depth)
+    parser.add_argument("--folder-fanout", type=int, default=defaults.folder_fanout)
+    parser.add_argument("--labels", type=int, default=defaults.labels)
+    parser.add_argument("--labels-per-tool", type=int, default=defaults.labels_per_tool)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--db-path", type=Path, help="keep the seeded database at this path")
+    parser.add_argument("--output", type=Path, help="write the JSON report here, not stdout")
+    args = parser.parse_args(argv)
+
+    spec = CatalogSpec(
+        tools=args.tools,
+        folder_depth=args.folder_depth,
+        folder_fanout=args.folder_fanout,
+        labels=args.labels,
+        labels_per_tool=args.labels_per_tool,
+        seed=args.seed,
+    )
+    report = run_benchmark(
+        spec, iterations=args.iterations, page_size=args.page_size, db_path=args.db_path
+    )
+    text = json.dumps(report, indent=2)
+    if args.output is None:
+        sys.stdout.write(text + "\n")
+    else:
+        args.output.write_text(text + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,145 @@
+"""Seeded generator for synthetic catalogs.
+
+Catalogs are produced as records in the NDJSON import format (see
+``mcp_admin.transfer``), so the same data can be loaded straight into a
+database or posted to ``/api/import``.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator
+
+from mcp_admin.db import apply_migrations, get_connection, transaction
+from mcp_admin.transfer import import_records, parse_record
+
+VERBS = (
+    "archive",
+    "create",
+    "delete",
+    "export",
+    "fetch",
+    "list",
+    "merge",
+    "notify",
+    "publish",
+    "search",
+    "send",
+    "sync",
+    "tag",
+    "update",
+    "watch",
+)
+NOUNS = (
+    "account",
+    "calendar",
+    "contact",
+    "document",
+    "draft",
+    "event",
+    "file",
+    "invoice",
+    "issue",
+    "label",
+    "message",
+    "order",
+    "report",
+    "thread",
+    "user",
+)
+AREAS = (
+    "billing",
+    "crm",
+    "devops",
+    "finance",
+    "gmail",
+    "hr",
+    "marketing",
+    "ops",
+    "sales",
+    "security",
+    "support",
+    "workspace",
+)
+
+
+@dataclass(frozen=True)
+class CatalogSpec:
+    tools: int = 1000
+    folder_depth: int = 3
+    folder_fanout: int = 4
+    labels: int = 40
+    labels_per_tool: int = 2
+    seed: int = 0
+
+    @property
+    def folders(self) -> int:
+        return sum(self.folder_fanout**level for level in range(1, self.folder_depth + 1))
+
+
+def generate_records(spec: CatalogSpec) -> Iterator[dict]:
+    """Yield folders, labels, tools and tool labels, parents before children."""
+    rng = random.Random(spec.seed)
+
+    folder_ids: list[int] = []
+    level = [1]
+    next_id = 2
+    for _ in range(spec.folder_depth):
+        children = []
+        for parent_id in level:
+            for _ in range(spec.folder_fanout):
+                yield {
+                    "type": "folder",
+                    "id": next_id,
+                    "name": f"{rng.choice(AREAS)}-{next_id}",
+                    "parentId": parent_id,
+                }
+                children.append(next_id)
+                next_id += 1
+        folder_ids.extend(children)
+        level = children
+    folder_ids = folder_ids or [1]
+
+    # Each label hangs under the root or an earlier label, giving uneven depth.
+    label_ids: list[int] = []
+    for label_id in range(2, spec.labels + 2):
+        yield {
+            "type": "label",
+            "id": label_id,
+            "name": f"{rng.choice(AREAS)}-{rng.choice(NOUNS)}-{label_id}",
+            "parentId": rng.choice([1, *label_ids[-8:]]),
+        }
+        label_ids.append(label_id)
+
+    for tool_id in range(1, spec.tools + 1):
+        verb, noun = rng.choice(VERBS), rng.choice(NOUNS)
+        yield {
+            "type": "tool",
+            "id": tool_id,
+            "name": f"{rng.choice(AREAS)}_{verb}_{noun}_{tool_id}",
+            "description": f"{verb.title()} a {noun} in {rng.choice(AREAS)}.",
+            "enabled": rng.random() > 0.1,
+            "folderId": rng.choice(folder_ids),
+        }
+    for tool_id in range(1, spec.tools + 1):
+        count = min(spec.labels_per_tool, len(label_ids))
+        for label_id in sorted(rng.sample(label_ids, count)):
+            yield {"type": "tool_label", "toolId": tool_id, "labelId": label_id}
+
+
+def seed_database(db_path: str | Path, spec: CatalogSpec) -> dict[str, int]:
+    """Create the schema at ``db_path`` and load a generated catalog into it."""
+    conn = get_connection(db_path)
+    try:
+        apply_migrations(conn)
+        records = [
+            parse_record(line_number, json.dumps(record))
+            for line_number, record in enumerate(generate_records(spec), start=1)
+        ]
+        with transaction(conn):
+            return import_records(conn, records)
+    finally:
+        conn.close()
@@ -0,0 +1,119 @@
+"""Drive the admin API against a synthetic catalog and report latency percentiles."""
+
+from __future__ import annotations
+
+import math
+import platform
+import random
+import sqlite3
+import tempfile
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Callable
+
+import httpx
+from fastapi.testclient import TestClient
+
+from benchmarks.catalog import AREAS, VERBS, CatalogSpec, seed_database
+from mcp_admin.api import create_app
+
+OPERATIONS = ("list", "filter", "create", "move", "delete")
+
+
+def percentiles(samples: list[float]) -> dict[str, float | int]:
+    """Summarize samples (in seconds) as nearest-rank percentiles in milliseconds."""
+    ordered = sorted(samples)
+    if not ordered:
+        return {"count": 0}
+
+    def rank(percent: float) -> float:
+        index = max(0, math.ceil(percent / 100 * len(ordered)) - 1)
+        return round(ordered[index] * 1000, 3)
+
+    return {
+        "count": len(ordered),
+        "mean_ms": round(sum(ordered) / len(ordered) * 1000, 3),
+        "p50_ms": rank(50),
+        "p95_ms": rank(95),
+        "p99_ms": rank(99),
+        "max_ms": round(ordered[-1] * 1000, 3),
+    }
+
+
+def _timed(
+    samples: list[float], request: Callable[..., httpx.Response], url: str, **kwargs: object
+) -> dict:
+    start = time.perf_counter()
+    response = request(url, **kwargs)
+    samples.append(time.perf_counter() - start)
+    if response.is_error:
+        raise RuntimeError(f"Benchmark request failed: {response.status_code} {response.text}")
+    return response.json() if response.content else {}
+
+
+def run_benchmark(
+    spec: CatalogSpec,
+    *,
+    iterations: int = 100,
+    page_size: int = 100,
+    db_path: str | Path | None = None,
+) -> dict:
+    """Seed a catalog, then time each operation ``iterations`` times.
+
+    Reads run first against a quiet catalog; the write phase then creates,
+    moves and deletes one tool per iteration, leaving the catalog size as it
+    was. Without ``db_path`` the database lives in a temporary directory.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(db_path) if db_path is not None else Path(tmp) / "catalog.db"
+        start = time.perf_counter()
+        seeded = seed_database(path, spec)
+        seed_seconds = time.perf_counter() - start
+        samples: dict[str, list[float]] = {operation: [] for operation in OPERATIONS}
+        rng = random.Random(spec.seed + 1)
+        with TestClient(create_app(db_path=path)) as client:
+            folder_ids = [folder["id"] for folder in client.get("/api/folders").json()]
+            label_ids = [label["id"] for label in client.get("/api/labels").json()]
+            filters: list[Callable[[], dict]] = [
+                lambda: {"search": rng.choice(VERBS)},
+                lambda: {"folderPath": rng.choice(AREAS)},
+                lambda: {"labels": str(rng.choice(label_ids)), "includeDescendants": "true"},
+            ]
+
+            cursor = None
+            for iteration in range(iterations):
+                params: dict = {"limit": page_size}
+                if cursor:
+                    params["after"] = cursor
+                page = _timed(samples["list"], client.get, "/api/tools", params=params)
+                cursor = page["nextCursor"]
+                params = {"limit": page_size, **filters[iteration % len(filters)]()}
+                _timed(samples["filter"], client.get, "/api/tools", params=params)
+
+            for iteration in range(iterations):
+                body = {
+                    "name": f"bench_tool_{iteration}",
+                    "folderId": rng.choice(folder_ids),
+                    "labelIds": rng.sample(label_ids, min(spec.labels_per_tool, len(label_ids))),
+                }
+                tool = _timed(samples["create"], client.post, "/api/tools", json=body)
+                url = f"/api/tools/{tool['id']}"
+                target = {"folderId": rng.choice(folder_ids)}
+                _timed(samples["move"], client.post, f"{url}/move", json=target)
+                _timed(samples["delete"], client.delete, url)
+
+    return {
+        "spec": asdict(spec),
+        "folders": spec.folders,
+        "iterations": iterations,
+        "pageSize": page_size,
+        "seeded": seeded,
+        "seedSeconds": round(seed_seconds, 3),
+        "environment": {
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+        },
+        "operations": {operation: percentiles(samples[operation]) for operation in OPERATIONS},
+    }
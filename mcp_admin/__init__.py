@@ -1,6 +1,6 @@
 """Administration and serving of MCP tools."""
 
-from .db import get_connection, apply_migrations
+from .db import ConnectionManager, get_connection, apply_migrations
 
 
 from typing import Any
@@ -11,5 +11,5 @@ def create_app(*args: Any, **kwargs: Any):
 
     return _create_app(*args, **kwargs)
 
-__all__ = ["get_connection", "apply_migrations", "create_app"]
+__all__ = ["ConnectionManager", "get_connection", "apply_migrations", "create_app"]
 """Core package for MCP admin tooling."""
@@ -1,16 +1,52 @@
 from __future__ import annotations
 
+import base64
+import binascii
+import hashlib
+import itertools
+import json
 from pathlib import Path
 import sqlite3
-from typing import List, Optional
-
-from fastapi import FastAPI, HTTPException, Response
+import time
+from typing import Callable, Iterable, List, Literal, Optional, Sequence
+
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from pydantic import BaseModel, Field
 
-from mcp_admin.db import apply_migrations, get_connection
-from mcp_admin.repositories import FolderRepository, LabelRepository, ToolRepository
+from mcp_admin.cache import CatalogCache
+from mcp_admin.db import (
+    DEFAULT_BUSY_TIMEOUT_MS,
+    DEFAULT_CACHE_SIZE,
+    DEFAULT_SLOW_QUERY_MS,
+    ConnectionManager,
+    QueryStats,
+    SlowQueryLog,
+    apply_migrations,
+    track_queries,
+)
+from mcp_admin.metrics import MetricFamily, install_metrics, route_template
+from mcp_admin.profiling import install_profiler
+from mcp_admin.repositories import (
+    FolderRepository,
+    LabelRepository,
+    ToolQuery,
+    ToolRepository,
+)
 
 from mcp_admin.tools.registry import ToolNode, discover_tools, get_label_path, toggle_tool
+from mcp_admin.transfer import (
+    RECORD_TYPES,
+    ImportFormatError,
+    Record,
+    export_lines,
+    import_records,
+    iter_lines,
+    parse_record,
+)
 
 DEFAULT_TOOL_DEFS: List[dict] = [
     {
@@ -29,6 +65,14 @@ DEFAULT_TOOL_DEFS: List[dict] = [
 ]
 
 
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+MAX_BULK_OPERATIONS = 5000
+IMPORT_CHUNK_SIZE = 500
+# Facet results cached per catalog generation; keys come from client filters.
+FACET_CACHE_SIZE = 256
+
+
 class ToggleRequest(BaseModel):
     enabled: bool
 
@@ -55,42 +99,42 @@ class MoveToolRequest(BaseModel):
     folderId: int | None = None
 
 
+class CopyFolderRequest(BaseModel):
+    parentId: int | None = None
+
+
+class BulkToolOperation(BaseModel):
+    op: Literal["create", "update", "delete", "move"]
+    id: int | None = None
+    name: str | None = Field(default=None, min_length=1)
+    description: str | None = None
+    enabled: bool | None = None
+    folderId: int | None = None
+    labelIds: List[int] | None = None
+
+
+class BulkToolRequest(BaseModel):
+    operations: List[BulkToolOperation] = Field(min_length=1, max_length=MAX_BULK_OPERATIONS)
+
+
 def _load_folders(conn: sqlite3.Connection) -> list[dict]:
     rows = conn.execute(
         """
-        SELECT folders.id, folders.name, folder_tree.parent_id
+        SELECT folders.id, folders.name, folder_tree.parent_id, folder_tree.path
         FROM folders
         JOIN folder_tree ON folder_tree.folder_id = folders.id
         ORDER BY folders.name;
         """
     ).fetchall()
-    folder_map: dict[int, dict] = {
-        row["id"]: {
+    return [
+        {
             "id": row["id"],
             "name": row["name"],
             "parentId": row["parent_id"],
+            "path": row["path"],
         }
         for row in rows
-    }
-    path_cache: dict[int, str] = {}
-
-    def build_path(folder_id: int) -> str:
-        if folder_id in path_cache:
-            return path_cache[folder_id]
-        folder = folder_map.get(folder_id)
-        if folder is None:
-            return ""
-        if folder["parentId"] is None:
-            path_cache[folder_id] = folder["name"]
-            return folder["name"]
-        parent_path = build_path(folder["parentId"])
-        path_cache[folder_id] = f"{parent_path} / {folder['name']}"
-        return path_cache[folder_id]
-
-    for folder_id, folder in folder_map.items():
-        folder["path"] = build_path(folder_id)
-
-    return list(folder_map.values())
+    ]
 
 
 def _load_labels(conn: sqlite3.Connection) -> list[dict]:
@@ -112,58 +156,205 @@ def _load_labels(conn: sqlite3.Connection) -> list[dict]:
     ]
 
 
-def _load_tool_labels(conn: sqlite3.Connection) -> dict[int, list[dict]]:
-    rows = conn.execute(
-        """
-        SELECT tool_labels.tool_id, labels.id, labels.name
-        FROM tool_labels
-        JOIN labels ON labels.id = tool_labels.label_id
-        ORDER BY labels.name;
-        """
-    ).fetchall()
+def _load_tool_labels(conn: sqlite3.Connection, tool_ids: list[int]) -> dict[int, list[dict]]:
     labels: dict[int, list[dict]] = {}
-    for row in rows:
+    for row in ToolRepository(conn).list_labels_for(tool_ids):
         labels.setdefault(row["tool_id"], []).append({"id": row["id"], "name": row["name"]})
     return labels
 
 
+# Output field -> the tools columns it is rendered from.
+TOOL_FIELDS: dict[str, tuple[str, ...]] = {
+    "id": ("id",),
+    "name": ("name",),
+    "description": ("description",),
+    "enabled": ("enabled",),
+    "folderId": ("folder_id",),
+    "folderPath": ("folder_id",),
+    "labels": ("id",),
+    "labelIds": ("id",),
+}
+LABEL_FIELDS = frozenset({"labels", "labelIds"})
+
+
+_TOOL_RENDERERS: dict[str, Callable[[sqlite3.Row, dict, dict], object]] = {
+    "id": lambda row, paths, labels: row["id"],
+    "name": lambda row, paths, labels: row["name"],
+    "description": lambda row, paths, labels: row["description"] or "",
+    "enabled": lambda row, paths, labels: bool(row["enabled"]),
+    "folderId": lambda row, paths, labels: row["folder_id"],
+    "folderPath": lambda row, paths, labels: paths.get(row["folder_id"]) or "Unassigned",
+    "labels": lambda row, paths, labels: labels.get(row["id"], []),
+    "labelIds": lambda row, paths, labels: [label["id"] for label in labels.get(row["id"], [])],
+}
+
+
 def _serialize_tool(
     row: sqlite3.Row,
     *,
     folder_paths: dict[int, str],
     tool_labels: dict[int, list[dict]],
+    fields: Iterable[str] = TOOL_FIELDS,
 ) -> dict:
-    labels = tool_labels.get(row["id"], [])
-    return {
-        "id": row["id"],
-        "name": row["name"],
-        "description": row["description"] or "",
-        "enabled": bool(row["enabled"]),
-        "folderId": row["folder_id"],
-        "folderPath": folder_paths.get(row["folder_id"]) or "Unassigned",
-        "labels": labels,
-        "labelIds": [label["id"] for label in labels],
-    }
+    return {name: _TOOL_RENDERERS[name](row, folder_paths, tool_labels) for name in fields}
 
 
-def _fetch_tool(
+def _serialize_tools(
     conn: sqlite3.Connection,
-    tool_id: int,
+    rows: list[sqlite3.Row],
     *,
-    folder_paths: dict[int, str],
-    tool_labels: dict[int, list[dict]],
-) -> dict | None:
-    row = conn.execute(
-        """
-        SELECT id, name, description, enabled, folder_id
-        FROM tools
-        WHERE id = ?;
-        """,
-        (tool_id,),
-    ).fetchone()
+    catalog: CatalogCache | None = None,
+    fields: Sequence[str] = tuple(TOOL_FIELDS),
+) -> list[dict]:
+    folder_paths: dict[int, str] = {}
+    tool_labels: dict[int, list[dict]] = {}
+    # Lookups run only for the fields that need them.
+    want_paths = "folderPath" in fields
+    want_labels = not LABEL_FIELDS.isdisjoint(fields)
+    folder_repo = FolderRepository(conn)
+    if catalog is None:
+        # Inside a write transaction: the rows may not be committed yet, so
+        # they must not reach the shared cache.
+        if want_paths:
+            folder_paths = folder_repo.paths(list({row["folder_id"] for row in rows}))
+        if want_labels:
+            tool_labels = _load_tool_labels(conn, [row["id"] for row in rows])
+    else:
+        if want_paths:
+            folder_paths = catalog.get_many(
+                "folder_paths",
+                {row["folder_id"] for row in rows},
+                folder_repo.paths,
+            )
+        if want_labels:
+            tool_labels = catalog.get_many(
+                "tool_labels",
+                [row["id"] for row in rows],
+                lambda tool_ids: _load_tool_labels(conn, tool_ids),
+                default=[],
+            )
+    return [
+        _serialize_tool(row, folder_paths=folder_paths, tool_labels=tool_labels, fields=fields)
+        for row in rows
+    ]
+
+
+def _parse_fields(value: str) -> list[str]:
+    fields = list(dict.fromkeys(part.strip() for part in value.split(",") if part.strip()))
+    unknown = [name for name in fields if name not in TOOL_FIELDS]
+    if not fields or unknown:
+        raise ValueError(", ".join(unknown))
+    return fields
+
+
+def _load_facets(conn: sqlite3.Connection, query: ToolQuery) -> dict:
+    repo = ToolRepository(conn)
+    return {
+        "folders": [
+            {"id": row["folder_id"], "count": row["direct"], "total": row["total"]}
+            for row in repo.folder_counts(query)
+        ],
+        "labels": [
+            {"id": row["label_id"], "count": row["direct"], "total": row["total"]}
+            for row in repo.label_counts(query)
+        ],
+    }
+
+
+def _fetch_tool(conn: sqlite3.Connection, tool_id: int) -> dict | None:
+    row = ToolRepository(conn).get(tool_id)
     if row is None:
         return None
-    return _serialize_tool(row, folder_paths=folder_paths, tool_labels=tool_labels)
+    return _serialize_tools(conn, [row])[0]
+
+
+def _bulk_errors(
+    conn: sqlite3.Connection,
+    run: list[tuple[int, BulkToolOperation]],
+) -> dict[int, str]:
+    tool_ids = {operation.id for _, operation in run if operation.id is not None}
+    folder_ids = {operation.folderId or 1 for _, operation in run}
+    label_ids = {label_id for _, operation in run for label_id in operation.labelIds or []}
+    known_tools = ToolRepository(conn).existing_ids(tool_ids)
+    known_folders = FolderRepository(conn).existing_ids(folder_ids)
+    known_labels = LabelRepository(conn).existing_ids(label_ids)
+    errors: dict[int, str] = {}
+    for index, operation in run:
+        if operation.op != "create" and operation.id not in known_tools:
+            errors[index] = "Tool not found"
+        elif operation.op in ("create", "update") and operation.name is None:
+            errors[index] = "Tool name is required"
+        elif operation.op != "delete" and (operation.folderId or 1) not in known_folders:
+            errors[index] = "Folder not found"
+        elif not known_labels.issuperset(operation.labelIds or []):
+            errors[index] = "Label not found"
+        elif operation.op == "delete":
+            # Later ops in the run see the tool as gone, so a repeated delete fails.
+            known_tools.discard(operation.id)
+    return errors
+
+
+def _apply_bulk(conn: sqlite3.Connection, operations: list[BulkToolOperation]) -> list[dict]:
+    """Apply operations in order, batching each run of the same kind into executemany calls.
+
+    Invalid operations are reported and skipped; the caller owns the transaction.
+    """
+    repo = ToolRepository(conn)
+    results: list[dict] = []
+    for op, group in itertools.groupby(enumerate(operations), key=lambda item: item[1].op):
+        run = list(group)
+        errors = _bulk_errors(conn, run)
+        valid = [(index, operation) for index, operation in run if index not in errors]
+        if op == "create":
+            tool_ids = repo.create_many(
+                [
+                    (
+                        operation.name,
+                        operation.description or "",
+                        True if operation.enabled is None else operation.enabled,
+                        operation.folderId or 1,
+                    )
+                    for _, operation in valid
+                ]
+            )
+        else:
+            tool_ids = [operation.id for _, operation in valid]
+        if op == "update":
+            repo.update_many(
+                [
+                    (
+                        operation.id,
+                        operation.name,
+                        operation.description,
+                        operation.enabled,
+                        operation.folderId,
+                    )
+                    for _, operation in valid
+                ]
+            )
+        elif op == "delete":
+            repo.delete_many(tool_ids)
+        elif op == "move":
+            repo.move_many(
+                [(operation.id, operation.folderId or 1) for _, operation in valid]
+            )
+        if op in ("create", "update"):
+            repo.set_labels_many(
+                [
+                    (tool_id, operation.labelIds)
+                    for tool_id, (_, operation) in zip(tool_ids, valid, strict=True)
+                    if operation.labelIds is not None
+                ]
+            )
+        ids = dict(zip((index for index, _ in valid), tool_ids, strict=True))
+        for index, _ in run:
+            if index in errors:
+                results.append(
+                    {"index": index, "op": op, "status": "error", "error": errors[index]}
+                )
+            else:
+                results.append({"index": index, "op": op, "status": "ok", "id": ids[index]})
+    return results
 
 
 def _parse_label_filter(label_ids: str | None) -> list[int]:
@@ -177,34 +368,193 @@ def _parse_label_filter(label_ids: str | None) -> list[int]:
     return parsed
 
 
+def _encode_cursor(key: tuple[str | float, int], version: str | None = None) -> str:
+    values = [*key, version] if version is not None else list(key)
+    payload = json.dumps(values, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[tuple[str | float, int], str | None]:
+    """Return the sort key and, for search cursors, the catalog version."""
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        decoded = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError) as exc:
+        raise ValueError("Invalid cursor") from exc
+    if (
+        not isinstance(decoded, list)
+        or len(decoded) not in (2, 3)
+        or not isinstance(decoded[0], (str, float))
+        or not isinstance(decoded[1], int)
+        or isinstance(decoded[1], bool)
+        # bm25 ranks shift with every write, so search cursors carry the
+        # catalog version they were issued at; name cursors never do.
+        or (len(decoded) == 3) != isinstance(decoded[0], float)
+        or (len(decoded) == 3 and not isinstance(decoded[2], str))
+    ):
+        raise ValueError("Invalid cursor")
+    return (decoded[0], decoded[1]), decoded[2] if len(decoded) == 3 else None
+
+
+def _catalog_etag(version: str, request: Request) -> str:
+    query = "&".join(sorted(f"{key}={value}" for key, value in request.query_params.multi_items()))
+    digest = hashlib.sha256(f"{request.url.path}?{query}".encode("utf-8")).hexdigest()[:16]
+    return f'"{version}-{digest}"'
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return any(candidate == "*" or candidate.removeprefix("W/") == etag for candidate in candidates)
+
+
+SERVER_TIMING_STATEMENTS = 3
+
+
+def _timing_description(text: str, limit: int = 80) -> str:
+    # Header-safe quoted-string: one line, ASCII, no quotes or backslashes.
+    text = " ".join(text.split()).replace('"', "'").replace("\\", "/")
+    text = text.encode("ascii", "replace").decode("ascii")
+    return text if len(text) <= limit else f"{text[: limit - 3]}..."
+
+
+def _server_timing(stats: QueryStats, elapsed: float) -> str:
+    metrics = [
+        f"app;dur={elapsed * 1000:.2f}",
+        f'db;dur={stats.seconds * 1000:.2f};'
+        f'desc="{stats.count} {"query" if stats.count == 1 else "queries"}"',
+    ]
+    for position, statement in enumerate(stats.slowest(SERVER_TIMING_STATEMENTS), start=1):
+        metrics.append(
+            f"sql-{position};dur={statement.seconds * 1000:.2f};"
+            f'desc="{_timing_description(statement.sql)}"'
+        )
+    return ", ".join(metrics)
+
+
+class _QueryTimingMiddleware:
+    """Adds a Server-Timing header with per-request SQL time and logs slow statements.
+
+    Statements that run after the response starts, such as a streamed export,
+    miss the header but still reach the slow-query log.
+    """
+
+    def __init__(self, app: ASGIApp, *, slow_log: SlowQueryLog) -> None:
+        self.app = app
+        self.slow_log = slow_log
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        start = time.perf_counter()
+        with track_queries() as stats:
+
+            async def send_with_timing(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    elapsed = time.perf_counter() - start
+                    MutableHeaders(scope=message).append(
+                        "Server-Timing", _server_timing(stats, elapsed)
+                    )
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                route = f"{scope['method']} {route_template(scope) or scope['path']}"
+                self.slow_log.record(stats, route=route)
+
+
+def _pool_metrics(db: ConnectionManager) -> list[MetricFamily]:
+    stats = db.stats()
+    return [
+        ("mcp_admin_db_readers", "gauge", "Open read-only connections.", {(): stats["readers"]}),
+        (
+            "mcp_admin_db_transactions_total",
+            "counter",
+            "Write transactions started.",
+            {(): stats["transactions"]},
+        ),
+        (
+            "mcp_admin_db_write_wait_seconds_total",
+            "counter",
+            "Time spent waiting for the writer connection.",
+            {(): stats["write_wait_seconds"]},
+        ),
+    ]
+
+
 def create_app(
     definitions: Optional[List[dict]] = None,
     *,
     db_path: str | Path = ":memory:",
+    busy_timeout_ms: int = DEFAULT_BUSY_TIMEOUT_MS,
+    cache_size: int = DEFAULT_CACHE_SIZE,
+    sql_timing: bool = False,
+    slow_query_ms: float = DEFAULT_SLOW_QUERY_MS,
+    profile_rate: float | None = None,
 ) -> FastAPI:
     app = FastAPI(title="MCP Admin")
     tool_definitions = DEFAULT_TOOL_DEFS if definitions is None else definitions
     app.state.root = discover_tools(tool_definitions)
-    conn = get_connection(db_path, check_same_thread=False)
-    apply_migrations(conn)
-    app.state.conn = conn
+    db = ConnectionManager(
+        db_path,
+        busy_timeout_ms=busy_timeout_ms,
+        cache_size=cache_size,
+        instrumented=sql_timing,
+    )
+    with db.writer() as conn:
+        apply_migrations(conn)
+    app.state.db = db
+    catalog = CatalogCache()
+    db.on_change(catalog.bump)
+    app.state.catalog = catalog
 
     @app.on_event("shutdown")
     def shutdown() -> None:
-        app.state.conn.close()
-
-    def folder_paths() -> dict[int, str]:
-        folders = _load_folders(conn)
-        return {folder["id"]: folder["path"] for folder in folders}
+        app.state.db.close()
+
+    metrics = install_metrics(app)
+    metrics.add_collector(lambda: _pool_metrics(db))
+    if profile_rate is not None:
+        install_profiler(app, sample_rate=profile_rate, path="/api/debug/profile")
+
+    if sql_timing:
+        slow_log = SlowQueryLog(slow_query_ms)
+        app.state.slow_queries = slow_log
+        app.add_middleware(_QueryTimingMiddleware, slow_log=slow_log)
+
+        @app.get("/api/debug/slow-queries")
+        def slow_queries() -> dict:
+            return {"thresholdMs": slow_log.threshold_ms, "queries": slow_log.entries()}
+
+    def not_modified(request: Request, response: Response) -> Response | None:
+        # Read the version before querying so a concurrent write yields a stale
+        # ETag (and a later refetch) rather than a fresh ETag on old data.
+        etag = _catalog_etag(catalog.version, request)
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+        response.headers.update(headers)
+        return None
 
     @app.get("/health")
     def health() -> dict:
         return {"status": "ok"}
 
+    # The encoded /tools body with the cached tree it was rendered from.
+    tools_body: list[tuple[dict | None, bytes]] = [(None, b"")]
+
     @app.get("/tools")
-    def list_tools() -> dict:
+    def list_tools() -> Response:
         root: ToolNode = app.state.root
-        return {"tools": [child.to_dict() for child in root.children]}
+        tree = root.to_dict()
+        rendered_from, content = tools_body[0]
+        if rendered_from is not tree:
+            content = json.dumps({"tools": tree["children"]}).encode("utf-8")
+            tools_body[0] = (tree, content)
+        return Response(content=content, media_type="application/json")
 
     @app.post("/tools/{tool_name}/enable")
     def set_tool_enabled(tool_name: str, request: ToggleRequest) -> dict:
@@ -222,247 +572,340 @@ def create_app(
         return {"labels": labels}
 
     @app.get("/api/folders")
-    def list_folders() -> list[dict]:
-        return _load_folders(conn)
+    def list_folders(request: Request, response: Response) -> list[dict]:
+        if (cached := not_modified(request, response)) is not None:
+            return cached
+        return catalog.get("folders", lambda: _load_folders(db.reader()))
 
     @app.post("/api/folders")
     def create_folder(request: FolderRequest) -> dict:
-        parent_id = request.parentId or 1
-        repo = FolderRepository(conn)
-        try:
-            folder_id = repo.create(request.name, parent_id)
-        except sqlite3.IntegrityError as exc:
-            raise HTTPException(status_code=400, detail="Parent folder not found") from exc
-        row = repo.get(folder_id)
-        if row is None:
-            raise HTTPException(status_code=500, detail="Folder creation failed")
-        return {
-            "id": row["id"],
-            "name": row["name"],
-            "parentId": row["parent_id"],
-        }
-
-    @app.put("/api/folders/{folder_id}")
-    def update_folder(folder_id: int, request: FolderRequest) -> dict:
-        repo = FolderRepository(conn)
-        row = repo.get(folder_id)
-        if row is None:
-            raise HTTPException(status_code=404, detail="Folder not found")
-        repo.update(folder_id, request.name)
-        if request.parentId is not None and request.parentId != row["parent_id"]:
+        with db.transaction() as conn:
+            parent_id = request.parentId or 1
+            repo = FolderRepository(conn)
             try:
-                repo.move(folder_id, request.parentId)
-            except ValueError as exc:
-                raise HTTPException(status_code=400, detail=str(exc)) from exc
+                folder_id = repo.create(request.name, parent_id)
             except sqlite3.IntegrityError as exc:
                 raise HTTPException(status_code=400, detail="Parent folder not found") from exc
-        updated = repo.get(folder_id)
-        return {
-            "id": updated["id"],
-            "name": updated["name"],
-            "parentId": updated["parent_id"],
-        }
+            row = repo.get(folder_id)
+            if row is None:
+                raise HTTPException(status_code=500, detail="Folder creation failed")
+            return {
+                "id": row["id"],
+                "name": row["name"],
+                "parentId": row["parent_id"],
+            }
+
+    @app.put("/api/folders/{folder_id}")
+    def update_folder(folder_id: int, request: FolderRequest) -> dict:
+        with db.transaction() as conn:
+            repo = FolderRepository(conn)
+            row = repo.get(folder_id)
+            if row is None:
+                raise HTTPException(status_code=404, detail="Folder not found")
+            repo.update(folder_id, request.name)
+            if request.parentId is not None and request.parentId != row["parent_id"]:
+                try:
+                    repo.move(folder_id, request.parentId)
+                except ValueError as exc:
+                    raise HTTPException(status_code=400, detail=str(exc)) from exc
+                except sqlite3.IntegrityError as exc:
+                    raise HTTPException(status_code=400, detail="Parent folder not found") from exc
+            updated = repo.get(folder_id)
+            return {
+                "id": updated["id"],
+                "name": updated["name"],
+                "parentId": updated["parent_id"],
+            }
 
     @app.delete("/api/folders/{folder_id}", response_class=Response, status_code=204)
     def delete_folder(folder_id: int) -> Response:
-        repo = FolderRepository(conn)
-        row = repo.get(folder_id)
-        if row is None:
-            raise HTTPException(status_code=404, detail="Folder not found")
-        try:
-            repo.delete(folder_id)
-        except sqlite3.IntegrityError as exc:
-            raise HTTPException(status_code=400, detail="Cannot delete root folder") from exc
-        return Response(status_code=204)
+        with db.transaction() as conn:
+            repo = FolderRepository(conn)
+            row = repo.get(folder_id)
+            if row is None:
+                raise HTTPException(status_code=404, detail="Folder not found")
+            try:
+                repo.delete(folder_id)
+            except sqlite3.IntegrityError as exc:
+                raise HTTPException(status_code=400, detail="Cannot delete root folder") from exc
+            return Response(status_code=204)
+
+    @app.post("/api/folders/{folder_id}/copy")
+    def copy_folder(folder_id: int, request: CopyFolderRequest) -> dict:
+        with db.transaction() as conn:
+            repo = FolderRepository(conn)
+            row = repo.get(folder_id)
+            if row is None:
+                raise HTTPException(status_code=404, detail="Folder not found")
+            parent_id = request.parentId or row["parent_id"] or 1
+            try:
+                copy_id = repo.copy(folder_id, parent_id)
+            except sqlite3.IntegrityError as exc:
+                raise HTTPException(status_code=400, detail="Parent folder not found") from exc
+            copy_row = repo.get(copy_id)
+            if copy_row is None:
+                raise HTTPException(status_code=500, detail="Folder copy failed")
+            return {
+                "id": copy_row["id"],
+                "name": copy_row["name"],
+                "parentId": copy_row["parent_id"],
+            }
 
     @app.get("/api/labels")
-    def list_labels() -> list[dict]:
-        return _load_labels(conn)
+    def list_labels(request: Request, response: Response) -> list[dict]:
+        if (cached := not_modified(request, response)) is not None:
+            return cached
+        return catalog.get("labels", lambda: _load_labels(db.reader()))
 
     @app.post("/api/labels")
     def create_label(request: LabelRequest) -> dict:
-        parent_id = request.parentId or 1
-        repo = LabelRepository(conn)
-        try:
-            label_id = repo.create(request.name, parent_id)
-        except sqlite3.IntegrityError as exc:
-            raise HTTPException(status_code=400, detail="Parent label not found") from exc
-        row = repo.get(label_id)
-        if row is None:
-            raise HTTPException(status_code=500, detail="Label creation failed")
-        return {
-            "id": row["id"],
-            "name": row["name"],
-            "parentId": row["parent_id"],
-        }
-
-    @app.put("/api/labels/{label_id}")
-    def update_label(label_id: int, request: LabelRequest) -> dict:
-        repo = LabelRepository(conn)
-        row = repo.get(label_id)
-        if row is None:
-            raise HTTPException(status_code=404, detail="Label not found")
-        repo.update(label_id, request.name)
-        if request.parentId is not None and request.parentId != row["parent_id"]:
+        with db.transaction() as conn:
+            parent_id = request.parentId or 1
+            repo = LabelRepository(conn)
             try:
-                repo.move(label_id, request.parentId)
-            except ValueError as exc:
-                raise HTTPException(status_code=400, detail=str(exc)) from exc
+                label_id = repo.create(request.name, parent_id)
             except sqlite3.IntegrityError as exc:
                 raise HTTPException(status_code=400, detail="Parent label not found") from exc
-        updated = repo.get(label_id)
-        return {
-            "id": updated["id"],
-            "name": updated["name"],
-            "parentId": updated["parent_id"],
-        }
+            row = repo.get(label_id)
+            if row is None:
+                raise HTTPException(status_code=500, detail="Label creation failed")
+            return {
+                "id": row["id"],
+                "name": row["name"],
+                "parentId": row["parent_id"],
+            }
+
+    @app.put("/api/labels/{label_id}")
+    def update_label(label_id: int, request: LabelRequest) -> dict:
+        with db.transaction() as conn:
+            repo = LabelRepository(conn)
+            row = repo.get(label_id)
+            if row is None:
+                raise HTTPException(status_code=404, detail="Label not found")
+            repo.update(label_id, request.name)
+            if request.parentId is not None and request.parentId != row["parent_id"]:
+                try:
+                    repo.move(label_id, request.parentId)
+                except ValueError as exc:
+                    raise HTTPException(status_code=400, detail=str(exc)) from exc
+                except sqlite3.IntegrityError as exc:
+                    raise HTTPException(status_code=400, detail="Parent label not found") from exc
+            updated = repo.get(label_id)
+            return {
+                "id": updated["id"],
+                "name": updated["name"],
+                "parentId": updated["parent_id"],
+            }
 
     @app.delete("/api/labels/{label_id}", response_class=Response, status_code=204)
     def delete_label(label_id: int) -> Response:
-        repo = LabelRepository(conn)
-        row = repo.get(label_id)
-        if row is None:
-            raise HTTPException(status_code=404, detail="Label not found")
-        try:
-            repo.delete(label_id)
-        except sqlite3.IntegrityError as exc:
-            raise HTTPException(status_code=400, detail="Cannot delete root label") from exc
-        return Response(status_code=204)
+        with db.transaction() as conn:
+            repo = LabelRepository(conn)
+            row = repo.get(label_id)
+            if row is None:
+                raise HTTPException(status_code=404, detail="Label not found")
+            try:
+                repo.delete(label_id)
+            except sqlite3.IntegrityError as exc:
+                raise HTTPException(status_code=400, detail="Cannot delete root label") from exc
+            return Response(status_code=204)
 
     @app.get("/api/tools")
     def list_tools(
+        request: Request,
+        response: Response,
         search: str | None = None,
         folderPath: str | None = None,
         labels: str | None = None,
-    ) -> list[dict]:
-        tool_rows = conn.execute(
-            """
-            SELECT id, name, description, enabled, folder_id
-            FROM tools
-            ORDER BY name;
-            """
-        ).fetchall()
-        folder_paths_map = folder_paths()
-        tool_labels = _load_tool_labels(conn)
-        tools = [
-            _serialize_tool(row, folder_paths=folder_paths_map, tool_labels=tool_labels)
-            for row in tool_rows
-        ]
-        if search:
-            lowered = search.lower()
-            tools = [
-                tool
-                for tool in tools
-                if lowered in tool["name"].lower()
-                or lowered in tool.get("description", "").lower()
-            ]
-        if folderPath:
-            lowered = folderPath.lower()
-            tools = [
-                tool
-                for tool in tools
-                if lowered in (tool.get("folderPath") or "").lower()
-            ]
+        includeDescendants: bool = False,
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+        after: str | None = None,
+        fields: str | None = None,
+    ) -> dict:
+        version = catalog.version
+        if (cached := not_modified(request, response)) is not None:
+            return cached
+        try:
+            selected = _parse_fields(fields) if fields is not None else list(TOOL_FIELDS)
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail="Invalid fields") from exc
+        try:
+            position, cursor_version = _decode_cursor(after) if after else (None, None)
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail="Invalid cursor") from exc
         try:
             label_filter = set(_parse_label_filter(labels))
         except ValueError as exc:
             raise HTTPException(status_code=400, detail="Invalid label filter") from exc
-        if label_filter:
-            tools = [
-                tool
-                for tool in tools
-                if label_filter.intersection({int(label_id) for label_id in tool["labelIds"]})
-            ]
-        return tools
-
-    @app.post("/api/tools")
-    def create_tool(request: ToolRequest) -> dict:
-        repo = ToolRepository(conn)
-        folder_id = request.folderId or 1
+        query = ToolQuery(
+            search=search,
+            folder_path=folderPath,
+            label_ids=sorted(label_filter),
+            include_descendant_labels=includeDescendants,
+            after=position,
+            # Read one extra row so we know whether another page exists.
+            limit=limit + 1,
+            columns=[column for name in selected for column in TOOL_FIELDS[name]],
+        )
+        # Search pages are ordered by bm25 rank, which any write can shift;
+        # rather than skip or repeat rows, make the client start over.
+        if query.ranked and cursor_version is not None and cursor_version != version:
+            raise HTTPException(
+                status_code=409, detail="Search results changed; restart from the first page"
+            )
+        conn = db.reader()
         try:
-            tool_id = repo.create(
-                request.name,
-                folder_id,
-                description=request.description,
-                enabled=request.enabled,
+            rows = ToolRepository(conn).list_matching(query)
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail="Invalid cursor") from exc
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = _encode_cursor(
+                query.sort_key(rows[-1]), version if query.ranked else None
             )
-        except sqlite3.IntegrityError as exc:
-            raise HTTPException(status_code=400, detail="Folder not found") from exc
-        conn.execute("DELETE FROM tool_labels WHERE tool_id = ?;", (tool_id,))
-        for label_id in request.labelIds:
-            repo.add_label(tool_id, int(label_id))
-        conn.commit()
-        tool_labels = _load_tool_labels(conn)
-        tool = _fetch_tool(
-            conn,
-            tool_id,
-            folder_paths=folder_paths(),
-            tool_labels=tool_labels,
+        return {
+            "tools": _serialize_tools(conn, rows, catalog=catalog, fields=selected),
+            "nextCursor": next_cursor,
+        }
+
+    @app.get("/api/tools/facets")
+    def tool_facets(
+        request: Request,
+        response: Response,
+        search: str | None = None,
+        folderPath: str | None = None,
+        labels: str | None = None,
+        includeDescendants: bool = False,
+    ) -> dict:
+        # Takes the /api/tools filters. "count" covers tools filed directly
+        # under a folder or label, "total" adds its descendants.
+        if (cached := not_modified(request, response)) is not None:
+            return cached
+        try:
+            label_filter = sorted(set(_parse_label_filter(labels)))
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail="Invalid label filter") from exc
+        query = ToolQuery(
+            search=search,
+            folder_path=folderPath,
+            label_ids=label_filter,
+            include_descendant_labels=includeDescendants,
+        )
+        return catalog.get_bounded(
+            "tool_facets",
+            (search, folderPath, tuple(label_filter), includeDescendants),
+            lambda: _load_facets(db.reader(), query),
+            maxsize=FACET_CACHE_SIZE,
         )
-        if tool is None:
-            raise HTTPException(status_code=500, detail="Tool creation failed")
-        return tool
+
+    @app.post("/api/tools")
+    def create_tool(request: ToolRequest) -> dict:
+        with db.transaction() as conn:
+            repo = ToolRepository(conn)
+            folder_id = request.folderId or 1
+            try:
+                tool_id = repo.create(
+                    request.name,
+                    folder_id,
+                    description=request.description,
+                    enabled=request.enabled,
+                )
+            except sqlite3.IntegrityError as exc:
+                raise HTTPException(status_code=400, detail="Folder not found") from exc
+            repo.set_labels(tool_id, request.labelIds)
+            tool = _fetch_tool(conn, tool_id)
+            if tool is None:
+                raise HTTPException(status_code=500, detail="Tool creation failed")
+            return tool
+
+    @app.post("/api/tools/bulk")
+    def bulk_tools(request: BulkToolRequest) -> dict:
+        with db.transaction() as conn:
+            results = _apply_bulk(conn, request.operations)
+        return {"results": results}
 
     @app.put("/api/tools/{tool_id}")
     def update_tool(tool_id: int, request: ToolRequest) -> dict:
-        repo = ToolRepository(conn)
-        row = repo.get(tool_id)
-        if row is None:
-            raise HTTPException(status_code=404, detail="Tool not found")
-        try:
-            repo.update(
-                tool_id,
-                request.name,
-                description=request.description,
-                enabled=request.enabled,
-                folder_id=request.folderId or row["folder_id"],
-            )
-        except sqlite3.IntegrityError as exc:
-            raise HTTPException(status_code=400, detail="Folder not found") from exc
-        conn.execute("DELETE FROM tool_labels WHERE tool_id = ?;", (tool_id,))
-        for label_id in request.labelIds:
-            repo.add_label(tool_id, int(label_id))
-        conn.commit()
-        tool_labels = _load_tool_labels(conn)
-        tool = _fetch_tool(
-            conn,
-            tool_id,
-            folder_paths=folder_paths(),
-            tool_labels=tool_labels,
-        )
-        if tool is None:
-            raise HTTPException(status_code=500, detail="Tool update failed")
-        return tool
+        with db.transaction() as conn:
+            repo = ToolRepository(conn)
+            row = repo.get(tool_id)
+            if row is None:
+                raise HTTPException(status_code=404, detail="Tool not found")
+            try:
+                repo.update(
+                    tool_id,
+                    request.name,
+                    description=request.description,
+                    enabled=request.enabled,
+                    folder_id=request.folderId or row["folder_id"],
+                )
+            except sqlite3.IntegrityError as exc:
+                raise HTTPException(status_code=400, detail="Folder not found") from exc
+            repo.set_labels(tool_id, request.labelIds)
+            tool = _fetch_tool(conn, tool_id)
+            if tool is None:
+                raise HTTPException(status_code=500, detail="Tool update failed")
+            return tool
 
     @app.delete("/api/tools/{tool_id}", response_class=Response, status_code=204)
     def delete_tool(tool_id: int) -> Response:
-        repo = ToolRepository(conn)
-        row = repo.get(tool_id)
-        if row is None:
-            raise HTTPException(status_code=404, detail="Tool not found")
-        repo.delete(tool_id)
-        return Response(status_code=204)
+        with db.transaction() as conn:
+            repo = ToolRepository(conn)
+            row = repo.get(tool_id)
+            if row is None:
+                raise HTTPException(status_code=404, detail="Tool not found")
+            repo.delete(tool_id)
+            return Response(status_code=204)
 
     @app.post("/api/tools/{tool_id}/move")
     def move_tool(tool_id: int, request: MoveToolRequest) -> dict:
-        repo = ToolRepository(conn)
-        row = repo.get(tool_id)
-        if row is None:
-            raise HTTPException(status_code=404, detail="Tool not found")
+        with db.transaction() as conn:
+            repo = ToolRepository(conn)
+            row = repo.get(tool_id)
+            if row is None:
+                raise HTTPException(status_code=404, detail="Tool not found")
+            try:
+                repo.move(tool_id, request.folderId or 1)
+            except sqlite3.IntegrityError as exc:
+                raise HTTPException(status_code=400, detail="Folder not found") from exc
+            tool = _fetch_tool(conn, tool_id)
+            if tool is None:
+                raise HTTPException(status_code=500, detail="Tool move failed")
+            return tool
+
+    @app.get("/api/export")
+    def export_catalog() -> StreamingResponse:
+        def stream():
+            with db.snapshot() as conn:
+                yield from export_lines(conn)
+
+        return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+    @app.post("/api/import")
+    async def import_catalog(request: Request) -> dict:
+        imported = dict.fromkeys(RECORD_TYPES, 0)
+
+        def apply(records: list[Record]) -> None:
+            with db.transaction() as conn:
+                for kind, count in import_records(conn, records).items():
+                    imported[kind] += count
+
+        chunk: list[Record] = []
         try:
-            repo.move(tool_id, request.folderId or 1)
-        except sqlite3.IntegrityError as exc:
-            raise HTTPException(status_code=400, detail="Folder not found") from exc
-        tool_labels = _load_tool_labels(conn)
-        tool = _fetch_tool(
-            conn,
-            tool_id,
-            folder_paths=folder_paths(),
-            tool_labels=tool_labels,
-        )
-        if tool is None:
-            raise HTTPException(status_code=500, detail="Tool move failed")
-        return tool
+            async for line_number, line in iter_lines(request.stream()):
+                chunk.append(parse_record(line_number, line))
+                if len(chunk) >= IMPORT_CHUNK_SIZE:
+                    await run_in_threadpool(apply, chunk)
+                    chunk = []
+            if chunk:
+                await run_in_threadpool(apply, chunk)
+        except ImportFormatError as exc:
+            # Earlier chunks stay committed; report how far the import got.
+            raise HTTPException(
+                status_code=400, detail={"error": str(exc), "imported": imported}
+            ) from exc
+        return {"imported": imported}
 
     return app
 
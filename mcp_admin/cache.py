@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Callable, Hashable, Iterable, TypeVar
+
+T = TypeVar("T")
+
+
+class CatalogCache:
+    """Read-through cache for catalog lookups, keyed by catalog generation.
+
+    Writers call ``bump()`` after committing, which moves the catalog to a new
+    generation and drops every cached entry. A value loaded while a bump was in
+    flight is returned to its caller but never stored, so readers cannot see
+    data older than the last committed write.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # Distinguishes generations of this process from those of earlier runs.
+        self._epoch = uuid.uuid4().hex[:12]
+        self._generation = 0
+        self._values: dict[Hashable, object] = {}
+        self._maps: dict[Hashable, dict[Hashable, object]] = {}
+        self._bounded: dict[Hashable, OrderedDict[Hashable, object]] = {}
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    @property
+    def version(self) -> str:
+        return f"{self._epoch}-{self._generation}"
+
+    def bump(self) -> int:
+        with self._lock:
+            self._generation += 1
+            self._values = {}
+            self._maps = {}
+            self._bounded = {}
+            return self._generation
+
+    def get(self, key: Hashable, loader: Callable[[], T]) -> T:
+        generation = self._generation
+        values = self._values
+        if key in values:
+            return values[key]  # type: ignore[return-value]
+        value = loader()
+        with self._lock:
+            if self._generation == generation:
+                self._values[key] = value
+        return value
+
+    def get_bounded(
+        self, namespace: Hashable, key: Hashable, loader: Callable[[], T], *, maxsize: int
+    ) -> T:
+        """Like ``get``, but keep at most ``maxsize`` entries in ``namespace``.
+
+        For keys built from client input, which must not grow the cache
+        without limit; the least recently used entry is evicted first.
+        """
+        generation = self._generation
+        with self._lock:
+            entries = self._bounded.get(namespace)
+            if entries is not None and key in entries:
+                entries.move_to_end(key)
+                return entries[key]  # type: ignore[return-value]
+        value = loader()
+        with self._lock:
+            if self._generation == generation:
+                entries = self._bounded.setdefault(namespace, OrderedDict())
+                entries[key] = value
+                if len(entries) > maxsize:
+                    entries.popitem(last=False)
+        return value
+
+    def get_many(
+        self,
+        namespace: Hashable,
+        keys: Iterable[Hashable],
+        loader: Callable[[list], dict],
+        default: object = None,
+    ) -> dict:
+        """Return cached entries for ``keys``, loading only the missing ones.
+
+        ``loader`` receives the missing keys and returns a mapping for those it
+        found; keys it omits are cached as ``default``.
+        """
+        generation = self._generation
+        cached = self._maps.get(namespace, {})
+        found: dict = {}
+        missing: list = []
+        for key in keys:
+            if key in cached:
+                found[key] = cached[key]
+            else:
+                missing.append(key)
+        if not missing:
+            return found
+        loaded = loader(missing)
+        fresh = {key: loaded.get(key, default) for key in missing}
+        found.update(fresh)
+        with self._lock:
+            if self._generation == generation:
+                self._maps.setdefault(namespace, {}).update(fresh)
+        return found
@@ -1,22 +1,342 @@
+import heapq
 import sqlite3
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
-from typing import Iterable
+from typing import Callable, Iterable, Iterator
 
 BASE_DIR = Path(__file__).resolve().parent
 MIGRATIONS_DIR = BASE_DIR / "migrations"
 
+DEFAULT_BUSY_TIMEOUT_MS = 5000
+# Negative values are KiB, per SQLite's cache_size pragma.
+DEFAULT_CACHE_SIZE = -16000
+DEFAULT_SLOW_QUERY_MS = 50.0
+
+
+def _is_memory(path: str | Path) -> bool:
+    return str(path) == ":memory:" or str(path).startswith("file::memory:")
+
+
+class StatementTiming:
+    __slots__ = ("sql", "seconds")
+
+    def __init__(self, sql: str) -> None:
+        self.sql = sql
+        self.seconds = 0.0
+
+
+class QueryStats:
+    """Statements run, and the time spent in them, while tracking is active."""
+
+    def __init__(self) -> None:
+        self.statements: list[StatementTiming] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    @property
+    def seconds(self) -> float:
+        return sum(statement.seconds for statement in self.statements)
+
+    def slowest(self, limit: int) -> list[StatementTiming]:
+        return heapq.nlargest(limit, self.statements, key=lambda statement: statement.seconds)
+
+
+_active_stats: ContextVar[QueryStats | None] = ContextVar("mcp_admin_query_stats", default=None)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Collect timings from instrumented connections used in this context.
+
+    The context is inherited by threadpool calls made from it, so one request
+    is tracked across the event loop and its worker threads.
+    """
+    stats = QueryStats()
+    token = _active_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _active_stats.reset(token)
+
+
+class InstrumentedCursor(sqlite3.Cursor):
+    """Cursor that charges execute and fetch time to the active ``QueryStats``."""
+
+    _timing: StatementTiming | None = None
+
+    def _start(self, sql: str) -> StatementTiming | None:
+        stats = _active_stats.get()
+        if stats is None:
+            self._timing = None
+        else:
+            self._timing = StatementTiming(sql)
+            stats.statements.append(self._timing)
+        return self._timing
+
+    def _timed(self, timing: StatementTiming | None, call: Callable, *args: object):
+        if timing is None:
+            return call(*args)
+        start = time.perf_counter()
+        try:
+            return call(*args)
+        finally:
+            timing.seconds += time.perf_counter() - start
+
+    def execute(self, sql: str, parameters: object = (), /):  # type: ignore[override]
+        return self._timed(self._start(sql), super().execute, sql, parameters)
+
+    def executemany(self, sql: str, seq_of_parameters: object, /):  # type: ignore[override]
+        return self._timed(self._start(sql), super().executemany, sql, seq_of_parameters)
+
+    def executescript(self, sql_script: str, /):  # type: ignore[override]
+        return self._timed(self._start(sql_script), super().executescript, sql_script)
+
+    def fetchone(self):
+        return self._timed(self._timing, super().fetchone)
+
+    def fetchmany(self, size: int | None = None):
+        size = self.arraysize if size is None else size
+        return self._timed(self._timing, super().fetchmany, size)
+
+    def fetchall(self):
+        return self._timed(self._timing, super().fetchall)
+
+    def __next__(self):
+        return self._timed(self._timing, super().__next__)
+
+
+class InstrumentedConnection(sqlite3.Connection):
+    """Connection whose statements are timed by ``track_queries()``."""
+
+    def cursor(self, factory: type[sqlite3.Cursor] = InstrumentedCursor):  # type: ignore[override]
+        return super().cursor(factory)
+
+    def execute(self, sql: str, parameters: object = (), /):  # type: ignore[override]
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql: str, seq_of_parameters: object, /):  # type: ignore[override]
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def executescript(self, sql_script: str, /):  # type: ignore[override]
+        return self.cursor().executescript(sql_script)
+
+
+class SlowQueryLog:
+    """Rolling log of statements slower than a threshold, oldest first."""
+
+    def __init__(self, threshold_ms: float = DEFAULT_SLOW_QUERY_MS, capacity: int = 200) -> None:
+        self.threshold_ms = threshold_ms
+        self._lock = threading.Lock()
+        self._entries: deque[dict] = deque(maxlen=capacity)
+
+    def record(self, stats: QueryStats, *, route: str) -> None:
+        threshold = self.threshold_ms / 1000
+        slow = [statement for statement in stats.statements if statement.seconds >= threshold]
+        if not slow:
+            return
+        now = time.time()
+        with self._lock:
+            self._entries.extend(
+                {
+                    "route": route,
+                    "sql": " ".join(statement.sql.split()),
+                    "ms": round(statement.seconds * 1000, 3),
+                    "at": now,
+                }
+                for statement in slow
+            )
+
+    def entries(self) -> list[dict]:
+        with self._lock:
+            return list(self._entries)
+
 
 def get_connection(
     path: str | Path = ":memory:",
     *,
     check_same_thread: bool = True,
+    read_only: bool = False,
+    busy_timeout_ms: int = DEFAULT_BUSY_TIMEOUT_MS,
+    cache_size: int = DEFAULT_CACHE_SIZE,
+    instrumented: bool = False,
 ) -> sqlite3.Connection:
-    conn = sqlite3.connect(path, check_same_thread=check_same_thread)
+    factory = InstrumentedConnection if instrumented else sqlite3.Connection
+    if read_only:
+        uri = f"{Path(path).resolve().as_uri()}?mode=ro"
+        # Autocommit, so a reader never holds a snapshot open between statements.
+        conn = sqlite3.connect(
+            uri,
+            uri=True,
+            check_same_thread=check_same_thread,
+            isolation_level=None,
+            factory=factory,
+        )
+    else:
+        conn = sqlite3.connect(path, check_same_thread=check_same_thread, factory=factory)
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA foreign_keys = ON;")
+    conn.execute(f"PRAGMA busy_timeout = {int(busy_timeout_ms)};")
+    conn.execute(f"PRAGMA cache_size = {int(cache_size)};")
+    if read_only:
+        conn.execute("PRAGMA query_only = ON;")
     return conn
 
 
+@contextmanager
+def transaction(conn: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """Run the enclosed statements as one unit of work.
+
+    Commits on success and rolls back on any exception. Entering while a
+    transaction is already open joins it, leaving the outer scope to commit.
+    """
+    if conn.in_transaction:
+        yield conn
+        return
+    conn.execute("BEGIN IMMEDIATE;")
+    try:
+        yield conn
+    except BaseException:
+        conn.rollback()
+        raise
+    conn.commit()
+
+
+class ConnectionManager:
+    """Owns the writer connection and one read-only connection per thread.
+
+    File databases run in WAL mode so readers never wait on the writer. An
+    in-memory database cannot be shared between connections, so there every
+    caller gets the writer connection.
+    """
+
+    def __init__(
+        self,
+        path: str | Path = ":memory:",
+        *,
+        busy_timeout_ms: int = DEFAULT_BUSY_TIMEOUT_MS,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        instrumented: bool = False,
+    ) -> None:
+        self.path = path
+        self.busy_timeout_ms = busy_timeout_ms
+        self.cache_size = cache_size
+        self.instrumented = instrumented
+        self.shared = _is_memory(path)
+        self._writer = get_connection(
+            path,
+            check_same_thread=False,
+            busy_timeout_ms=busy_timeout_ms,
+            cache_size=cache_size,
+            instrumented=instrumented,
+        )
+        if not self.shared:
+            self._writer.execute("PRAGMA journal_mode = WAL;")
+            self._writer.execute("PRAGMA synchronous = NORMAL;")
+        self._write_lock = threading.RLock()
+        self._readers_lock = threading.Lock()
+        self._readers: dict[threading.Thread, sqlite3.Connection] = {}
+        self._change_listeners: list[Callable[[], None]] = []
+        # Updated under the write lock.
+        self._transactions = 0
+        self._write_wait_seconds = 0.0
+
+    def on_change(self, listener: Callable[[], None]) -> None:
+        """Call ``listener`` after every unit of work that modified rows."""
+        self._change_listeners.append(listener)
+
+    def reader(self) -> sqlite3.Connection:
+        if self.shared:
+            return self._writer
+        thread = threading.current_thread()
+        conn = self._readers.get(thread)
+        if conn is not None:
+            return conn
+        conn = get_connection(
+            self.path,
+            check_same_thread=False,
+            read_only=True,
+            busy_timeout_ms=self.busy_timeout_ms,
+            cache_size=self.cache_size,
+            instrumented=self.instrumented,
+        )
+        with self._readers_lock:
+            for stale in [other for other in self._readers if not other.is_alive()]:
+                self._readers.pop(stale).close()
+            self._readers[thread] = conn
+        return conn
+
+    @contextmanager
+    def snapshot(self) -> Iterator[sqlite3.Connection]:
+        """Yield a dedicated reader holding one read transaction.
+
+        For long scans such as exports: the connection may be used from any
+        thread, and every statement sees the same committed state.
+        """
+        if self.shared:
+            yield self._writer
+            return
+        conn = get_connection(
+            self.path,
+            check_same_thread=False,
+            read_only=True,
+            busy_timeout_ms=self.busy_timeout_ms,
+            cache_size=self.cache_size,
+            instrumented=self.instrumented,
+        )
+        try:
+            conn.execute("BEGIN;")
+            yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        with self._write_lock:
+            yield self._writer
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        start = time.perf_counter()
+        with self._write_lock:
+            self._write_wait_seconds += time.perf_counter() - start
+            self._transactions += 1
+            conn = self._writer
+            changes = conn.total_changes
+            try:
+                with transaction(conn):
+                    yield conn
+            finally:
+                # Rolled-back changes notify too: on a shared in-memory
+                # connection readers may have seen them before the rollback.
+                if conn.total_changes != changes:
+                    for listener in self._change_listeners:
+                        listener()
+
+    def stats(self) -> dict[str, int | float]:
+        """Connection pool counters, for metrics."""
+        with self._readers_lock:
+            readers = len(self._readers)
+        return {
+            "readers": readers,
+            "transactions": self._transactions,
+            "write_wait_seconds": self._write_wait_seconds,
+        }
+
+    def close(self) -> None:
+        with self._readers_lock:
+            for conn in self._readers.values():
+                conn.close()
+            self._readers.clear()
+        with self._write_lock:
+            self._writer.close()
+
+
 def _ensure_schema_table(conn: sqlite3.Connection) -> None:
     conn.execute(
         """
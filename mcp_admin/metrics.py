@@ -0,0 +1,211 @@
+"""Prometheus text-format metrics for the FastAPI apps.
+
+Each thread records into its own shard, so the hot path takes no lock:
+requests are counted on the event loop thread and threadpool work never
+contends with it. ``render()`` sums the shards when ``/metrics`` is scraped.
+"""
+
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+from typing import Callable, Iterable
+
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+# Requests that matched no route share one label instead of one per raw path.
+UNMATCHED_ROUTE = "<unmatched>"
+
+Labels = tuple[tuple[str, str], ...]
+# name, type, help, samples
+MetricFamily = tuple[str, str, str, dict[Labels, float]]
+
+
+def route_template(scope: Scope) -> str | None:
+    """Return the path template of the route that handled ``scope``, if any."""
+    endpoint = scope.get("endpoint")
+    if endpoint is None:
+        return None
+    for route in scope["app"].routes:
+        if getattr(route, "endpoint", None) is endpoint:
+            return route.path
+    return None
+
+
+class _Shard:
+    __slots__ = ("in_flight", "requests", "errors", "histograms")
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.requests: dict[Labels, int] = {}
+        self.errors: dict[Labels, int] = {}
+        # labels -> [bucket counts..., +Inf count, sum]
+        self.histograms: dict[Labels, list[float]] = {}
+
+
+class MetricsRecorder:
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self._local = threading.local()
+        self._shards_lock = threading.Lock()
+        self._shards: list[_Shard] = []
+        self._collectors: list[Callable[[], Iterable[MetricFamily]]] = []
+
+    def _shard(self) -> _Shard:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = _Shard()
+            with self._shards_lock:
+                self._shards.append(shard)
+        return shard
+
+    def add_collector(self, collector: Callable[[], Iterable[MetricFamily]]) -> None:
+        """Register a callback that reports extra metric families at scrape time."""
+        self._collectors.append(collector)
+
+    def request_started(self) -> None:
+        self._shard().in_flight += 1
+
+    def request_finished(
+        self, method: str, route: str, status: int, seconds: float, *, failed: bool = False
+    ) -> None:
+        shard = self._shard()
+        shard.in_flight -= 1
+        key = (("method", method), ("route", route), ("status", str(status)))
+        shard.requests[key] = shard.requests.get(key, 0) + 1
+        route_key = (("method", method), ("route", route))
+        if failed or status >= 500:
+            shard.errors[route_key] = shard.errors.get(route_key, 0) + 1
+        histogram = shard.histograms.get(route_key)
+        if histogram is None:
+            histogram = shard.histograms[route_key] = [0.0] * (len(self.buckets) + 2)
+        histogram[bisect.bisect_left(self.buckets, seconds)] += 1
+        histogram[-1] += seconds
+
+    def render(self) -> str:
+        with self._shards_lock:
+            shards = list(self._shards)
+        in_flight = 0
+        requests: dict[Labels, float] = {}
+        errors: dict[Labels, float] = {}
+        histograms: dict[Labels, list[float]] = {}
+        for shard in shards:
+            in_flight += shard.in_flight
+            # Copies, since the owning threads keep writing while we read.
+            for key, value in list(shard.requests.items()):
+                requests[key] = requests.get(key, 0) + value
+            for key, value in list(shard.errors.items()):
+                errors[key] = errors.get(key, 0) + value
+            for key, values in list(shard.histograms.items()):
+                total = histograms.setdefault(key, [0.0] * len(values))
+                for index, value in enumerate(list(values)):
+                    total[index] += value
+
+        lines: list[str] = []
+        _family(
+            lines, "http_requests_in_flight", "gauge", "Requests being handled.", {(): in_flight}
+        )
+        _family(lines, "http_requests_total", "counter", "Requests handled.", requests)
+        _family(
+            lines,
+            "http_request_errors_total",
+            "counter",
+            "Requests that failed with a 5xx status or an unhandled exception.",
+            errors,
+        )
+        lines.append("# HELP http_request_duration_seconds Request latency by route.")
+        lines.append("# TYPE http_request_duration_seconds histogram")
+        bounds = (*(f"{bucket:g}" for bucket in self.buckets), "+Inf")
+        for key in sorted(histograms):
+            values = histograms[key]
+            cumulative = 0.0
+            for bound, count in zip(bounds, values[:-1], strict=True):
+                cumulative += count
+                bucket = _labels((*key, ("le", bound)))
+                lines.append(f"http_request_duration_seconds_bucket{bucket} {cumulative:g}")
+            lines.append(f"http_request_duration_seconds_sum{_labels(key)} {values[-1]:g}")
+            lines.append(f"http_request_duration_seconds_count{_labels(key)} {cumulative:g}")
+        for collector in self._collectors:
+            for name, kind, help_text, samples in collector():
+                _family(lines, name, kind, help_text, samples)
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels) + "}"
+
+
+def _family(
+    lines: list[str], name: str, kind: str, help_text: str, samples: dict[Labels, float]
+) -> None:
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} {kind}")
+    for labels in sorted(samples):
+        lines.append(f"{name}{_labels(labels)} {samples[labels]:g}")
+
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp, *, recorder: MetricsRecorder) -> None:
+        self.app = app
+        self.recorder = recorder
+        self._routes: dict[object, str] = {}
+
+    def _route(self, scope: Scope) -> str:
+        endpoint = scope.get("endpoint")
+        route = self._routes.get(endpoint)
+        if route is None:
+            route = route_template(scope) or UNMATCHED_ROUTE
+            if endpoint is not None:
+                self._routes[endpoint] = route
+        return route
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        status = 500
+        failed = True
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        self.recorder.request_started()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+            failed = False
+        finally:
+            self.recorder.request_finished(
+                scope["method"],
+                self._route(scope),
+                status,
+                time.perf_counter() - start,
+                failed=failed,
+            )
+
+
+def install_metrics(app: FastAPI, *, path: str = "/metrics") -> MetricsRecorder:
+    """Record request metrics for ``app`` and serve them at ``path``."""
+    recorder = MetricsRecorder()
+    app.state.metrics = recorder
+    app.add_middleware(MetricsMiddleware, recorder=recorder)
+
+    @app.get(path, include_in_schema=False)
+    def metrics() -> PlainTextResponse:
+        return PlainTextResponse(recorder.render(), media_type=CONTENT_TYPE)
+
+    return recorder
@@ -0,0 +1,31 @@
+CREATE VIRTUAL TABLE IF NOT EXISTS tools_fts USING fts5(
+    name,
+    description,
+    content='tools',
+    content_rowid='id'
+);
+
+INSERT INTO tools_fts (tools_fts) VALUES ('rebuild');
+
+CREATE TRIGGER IF NOT EXISTS tools_fts_after_insert
+AFTER INSERT ON tools
+BEGIN
+    INSERT INTO tools_fts (rowid, name, description)
+    VALUES (NEW.id, NEW.name, NEW.description);
+END;
+
+CREATE TRIGGER IF NOT EXISTS tools_fts_after_delete
+AFTER DELETE ON tools
+BEGIN
+    INSERT INTO tools_fts (tools_fts, rowid, name, description)
+    VALUES ('delete', OLD.id, OLD.name, OLD.description);
+END;
+
+CREATE TRIGGER IF NOT EXISTS tools_fts_after_update
+AFTER UPDATE OF name, description ON tools
+BEGIN
+    INSERT INTO tools_fts (tools_fts, rowid, name, description)
+    VALUES ('delete', OLD.id, OLD.name, OLD.description);
+    INSERT INTO tools_fts (rowid, name, description)
+    VALUES (NEW.id, NEW.name, NEW.description);
+END;
@@ -0,0 +1,18 @@
+ALTER TABLE folder_tree ADD COLUMN path TEXT NOT NULL DEFAULT '';
+
+WITH RECURSIVE folder_paths(id, path) AS (
+    SELECT folder_tree.folder_id, folders.name
+    FROM folder_tree
+    JOIN folders ON folders.id = folder_tree.folder_id
+    WHERE folder_tree.parent_id IS NULL
+    UNION ALL
+    SELECT folder_tree.folder_id, folder_paths.path || ' / ' || folders.name
+    FROM folder_tree
+    JOIN folders ON folders.id = folder_tree.folder_id
+    JOIN folder_paths ON folder_tree.parent_id = folder_paths.id
+)
+UPDATE folder_tree
+SET path = COALESCE(
+    (SELECT path FROM folder_paths WHERE folder_paths.id = folder_tree.folder_id),
+    (SELECT name FROM folders WHERE folders.id = folder_tree.folder_id)
+);
@@ -0,0 +1,53 @@
+CREATE TABLE IF NOT EXISTS label_closure (
+    ancestor_id INTEGER NOT NULL,
+    descendant_id INTEGER NOT NULL,
+    depth INTEGER NOT NULL,
+    PRIMARY KEY (ancestor_id, descendant_id),
+    FOREIGN KEY(ancestor_id) REFERENCES labels(id) ON DELETE CASCADE,
+    FOREIGN KEY(descendant_id) REFERENCES labels(id) ON DELETE CASCADE
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS label_closure_descendant
+ON label_closure (descendant_id, ancestor_id);
+
+WITH RECURSIVE closure(ancestor_id, descendant_id, depth) AS (
+    SELECT label_id, label_id, 0
+    FROM label_tree
+    UNION ALL
+    SELECT closure.ancestor_id, label_tree.label_id, closure.depth + 1
+    FROM closure
+    JOIN label_tree ON label_tree.parent_id = closure.descendant_id
+)
+INSERT OR IGNORE INTO label_closure (ancestor_id, descendant_id, depth)
+SELECT ancestor_id, descendant_id, depth
+FROM closure;
+
+CREATE TRIGGER IF NOT EXISTS label_tree_closure_insert
+AFTER INSERT ON label_tree
+BEGIN
+    INSERT INTO label_closure (ancestor_id, descendant_id, depth)
+    SELECT ancestor_id, NEW.label_id, depth + 1
+    FROM label_closure
+    WHERE descendant_id = NEW.parent_id
+    UNION ALL
+    SELECT NEW.label_id, NEW.label_id, 0;
+END;
+
+CREATE TRIGGER IF NOT EXISTS label_tree_closure_move
+AFTER UPDATE OF parent_id ON label_tree
+WHEN OLD.parent_id IS NOT NEW.parent_id
+BEGIN
+    DELETE FROM label_closure
+    WHERE descendant_id IN (
+        SELECT descendant_id FROM label_closure WHERE ancestor_id = NEW.label_id
+    )
+    AND ancestor_id NOT IN (
+        SELECT descendant_id FROM label_closure WHERE ancestor_id = NEW.label_id
+    );
+
+    INSERT INTO label_closure (ancestor_id, descendant_id, depth)
+    SELECT ancestors.ancestor_id, subtree.descendant_id, ancestors.depth + subtree.depth + 1
+    FROM label_closure AS ancestors
+    JOIN label_closure AS subtree ON subtree.ancestor_id = NEW.label_id
+    WHERE ancestors.descendant_id = NEW.parent_id;
+END;
@@ -0,0 +1,18 @@
+-- Secondary indexes for the parent/child walks, folder listings, label
+-- lookups and name-ordered pagination. The delete triggers in 0001 look up
+-- children by parent_id and tools by folder_id, so they use these too.
+
+CREATE INDEX IF NOT EXISTS folder_tree_parent
+ON folder_tree (parent_id, folder_id);
+
+CREATE INDEX IF NOT EXISTS label_tree_parent
+ON label_tree (parent_id, label_id);
+
+CREATE INDEX IF NOT EXISTS tools_folder_name
+ON tools (folder_id, name, id);
+
+CREATE INDEX IF NOT EXISTS tools_name
+ON tools (name, id);
+
+CREATE INDEX IF NOT EXISTS tool_labels_label
+ON tool_labels (label_id, tool_id);
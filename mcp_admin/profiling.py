@@ -0,0 +1,228 @@
+"""Sampling profiler for live traffic.
+
+A fraction of requests (plus any request carrying the profile header) is
+profiled: while one is in flight, a background thread snapshots every
+thread's stack with ``sys._current_frames()`` at a fixed interval. Stacks
+are attributed to a profiled request when they run under its middleware
+frame (event loop work) or inside its endpoint function (threadpool work).
+A concurrent unprofiled request to the same endpoint can contribute
+samples too, which does not skew a profile that is aggregated per route.
+
+Samples are folded per route into the collapsed-stack format read by
+``flamegraph.pl`` and speedscope. Requests that are not profiled cost one
+random draw and a header scan; nothing samples while none are in flight.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from types import CodeType, FrameType
+from typing import Any, AsyncIterator, Mapping
+
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from mcp_admin.metrics import UNMATCHED_ROUTE, route_template
+
+PROFILE_HEADER = "x-profile"
+DEFAULT_INTERVAL = 0.005
+
+Stack = tuple[CodeType, ...]
+
+
+class _ActiveRequest:
+    __slots__ = ("scope", "frame", "stacks")
+
+    def __init__(self, scope: Scope) -> None:
+        self.scope = scope
+        self.frame: FrameType | None = None
+        self.stacks: Counter[Stack] = Counter()
+
+
+@functools.cache
+def _frame_label(code: CodeType) -> str:
+    path = code.co_filename
+    for prefix in sorted(sys.path, key=len, reverse=True):
+        if prefix and path.startswith(prefix + os.sep):
+            path = path[len(prefix) + 1 :]
+            break
+    # ';' separates frames in the collapsed format.
+    return f"{code.co_qualname} ({path}:{code.co_firstlineno})".replace(";", ",")
+
+
+class Profiler:
+    def __init__(self, *, interval: float = DEFAULT_INTERVAL) -> None:
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)
+        self._active: list[_ActiveRequest] = []
+        self._routes: dict[str, Counter[Stack]] = {}
+        self._thread: threading.Thread | None = None
+        self._closed = False
+
+    def start(self, scope: Scope) -> _ActiveRequest:
+        request = _ActiveRequest(scope)
+        with self._wake:
+            self._active.append(request)
+            if self._thread is None and not self._closed:
+                self._thread = threading.Thread(
+                    target=self._run, name="request-profiler", daemon=True
+                )
+                self._thread.start()
+            self._wake.notify()
+        return request
+
+    def finish(self, request: _ActiveRequest, route: str) -> None:
+        with self._lock:
+            self._active.remove(request)
+            self._routes.setdefault(route, Counter()).update(request.stacks)
+
+    def close(self) -> None:
+        """Stop the sampler thread; the next profiled request starts a new one."""
+        with self._wake:
+            thread, self._thread = self._thread, None
+            self._closed = True
+            self._wake.notify()
+        if thread is not None:
+            thread.join()
+        with self._lock:
+            self._closed = False
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        while True:
+            with self._wake:
+                while not self._active and not self._closed:
+                    self._wake.wait()
+                if self._closed:
+                    return
+                active = list(self._active)
+            self._sample(active, own_id)
+            time.sleep(self.interval)
+
+    def _sample(self, active: list[_ActiveRequest], own_id: int) -> None:
+        by_frame = {id(request.frame): request for request in active if request.frame is not None}
+        by_code: dict[CodeType, _ActiveRequest] = {}
+        for request in active:
+            code = getattr(request.scope.get("endpoint"), "__code__", None)
+            if code is not None:
+                by_code.setdefault(code, request)
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own_id:
+                continue
+            stack: list[CodeType] = []
+            owner: _ActiveRequest | None = None
+            depth = 0
+            current: FrameType | None = frame
+            while current is not None:
+                stack.append(current.f_code)
+                match = by_frame.get(id(current)) or by_code.get(current.f_code)
+                if match is not None:
+                    # Keep the outermost match so the middleware frame wins.
+                    owner, depth = match, len(stack)
+                current = current.f_back
+            if owner is not None:
+                owner.stacks[tuple(reversed(stack[:depth]))] += 1
+
+    def collapsed(self) -> str:
+        """Render ``route;outer;...;inner count`` lines, one per distinct stack."""
+        with self._lock:
+            routes = {route: Counter(stacks) for route, stacks in self._routes.items()}
+        lines = []
+        for route in sorted(routes):
+            for stack, count in sorted(routes[route].items(), key=lambda item: -item[1]):
+                frames = [_frame_label(code) for code in stack]
+                lines.append(f"{';'.join([route.replace(';', ','), *frames])} {count}")
+        return "\n".join(lines) + ("\n" if lines else "")
+
+    def reset(self) -> None:
+        with self._lock:
+            self._routes.clear()
+
+
+class ProfilerMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        profiler: Profiler,
+        sample_rate: float = 0.0,
+        header: str = PROFILE_HEADER,
+    ) -> None:
+        self.app = app
+        self.profiler = profiler
+        self.sample_rate = sample_rate
+        self.header = header.lower().encode("latin-1")
+
+    def _wanted(self, scope: Scope) -> bool:
+        if self.sample_rate and random.random() < self.sample_rate:
+            return True
+        return any(name == self.header for name, _ in scope["headers"])
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self._wanted(scope):
+            await self.app(scope, receive, send)
+            return
+        await self._profile(scope, receive, send)
+
+    async def _profile(self, scope: Scope, receive: Receive, send: Send) -> None:
+        request = self.profiler.start(scope)
+        # The sampler attributes loop-thread stacks by this coroutine's frame.
+        request.frame = sys._getframe()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            route = route_template(scope) or UNMATCHED_ROUTE
+            self.profiler.finish(request, f"{scope['method']} {route}")
+
+
+def install_profiler(
+    app: FastAPI,
+    *,
+    sample_rate: float = 0.0,
+    header: str = PROFILE_HEADER,
+    path: str = "/debug/profile",
+    interval: float = DEFAULT_INTERVAL,
+) -> Profiler:
+    """Profile ``sample_rate`` of requests, plus any sent with ``header``.
+
+    ``GET path`` returns the collapsed stacks gathered so far; ``?reset=true``
+    clears them after reading.
+    """
+    if not 0.0 <= sample_rate <= 1.0:
+        raise ValueError("sample_rate must be between 0 and 1")
+    profiler = Profiler(interval=interval)
+    app.state.profiler = profiler
+    app.add_middleware(
+        ProfilerMiddleware, profiler=profiler, sample_rate=sample_rate, header=header
+    )
+
+    app_lifespan = app.router.lifespan_context
+
+    @contextlib.asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[Mapping[str, Any] | None]:
+        # Wraps the app's own lifespan, so its startup and shutdown still run.
+        try:
+            async with app_lifespan(app) as state:
+                yield state
+        finally:
+            profiler.close()
+
+    app.router.lifespan_context = lifespan
+
+    @app.get(path, include_in_schema=False)
+    def profile(reset: bool = False) -> PlainTextResponse:
+        text = profiler.collapsed()
+        if reset:
+            profiler.reset()
+        return PlainTextResponse(text)
+
+    return profiler
@@ -1,5 +1,5 @@
 from .folders import FolderRepository
 from .labels import LabelRepository
-from .tools import ToolRepository
+from .tools import ToolQuery, ToolRepository
 
-__all__ = ["FolderRepository", "LabelRepository", "ToolRepository"]
+__all__ = ["FolderRepository", "LabelRepository", "ToolQuery", "ToolRepository"]
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from typing import Iterable
+
+
+class Repository:
+    """Base for repositories; callers own the transaction and commit."""
+
+    table: str
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self.conn = conn
+
+    def existing_ids(self, ids: Iterable[int]) -> set[int]:
+        rows = self.conn.execute(
+            f"SELECT id FROM {self.table} WHERE id IN (SELECT value FROM json_each(?));",
+            (json.dumps(sorted(set(ids))),),
+        ).fetchall()
+        return {row["id"] for row in rows}
+
+    def _last_id(self, table: str | None = None) -> int:
+        """Return the highest id ever allocated by a table's AUTOINCREMENT sequence."""
+        row = self.conn.execute(
+            "SELECT seq FROM sqlite_sequence WHERE name = ?;",
+            (table or self.table,),
+        ).fetchone()
+        return 0 if row is None else int(row["seq"])
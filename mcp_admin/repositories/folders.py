@@ -1,30 +1,37 @@
 from __future__ import annotations
 
 import sqlite3
-from typing import Iterable
+from typing import Iterable, Sequence
 
+from mcp_admin.repositories.base import Repository
 
-class FolderRepository:
-    def __init__(self, conn: sqlite3.Connection) -> None:
-        self.conn = conn
+
+class FolderRepository(Repository):
+    table = "folders"
 
     def create(self, name: str, parent_id: int = 1) -> int:
-        cur = self.conn.execute(
-            "INSERT INTO folders (name) VALUES (?);",
-            (name,),
-        )
-        folder_id = cur.lastrowid
-        self.conn.execute(
-            "INSERT INTO folder_tree (folder_id, parent_id) VALUES (?, ?);",
-            (folder_id, parent_id),
-        )
-        self.conn.commit()
-        return int(folder_id)
+        return self._insert(None, name, parent_id)
+
+    def upsert(self, folder_id: int, name: str, parent_id: int | None) -> None:
+        """Create or update the folder with a known id, e.g. when importing a catalog."""
+        row = self.get(folder_id)
+        if row is None:
+            self._insert(folder_id, name, parent_id)
+            return
+        if row["name"] != name:
+            self.update(folder_id, name)
+        if parent_id is not None and row["parent_id"] != parent_id:
+            self.move(folder_id, parent_id)
 
     def get(self, folder_id: int) -> sqlite3.Row | None:
         return self.conn.execute(
             """
-            SELECT folders.id, folders.name, folder_tree.parent_id, folders.created_at
+            SELECT
+                folders.id,
+                folders.name,
+                folder_tree.parent_id,
+                folder_tree.path,
+                folders.created_at
             FROM folders
             JOIN folder_tree ON folder_tree.folder_id = folders.id
             WHERE folders.id = ?;
@@ -35,7 +42,12 @@ class FolderRepository:
     def list_children(self, parent_id: int) -> Iterable[sqlite3.Row]:
         return self.conn.execute(
             """
-            SELECT folders.id, folders.name, folder_tree.parent_id, folders.created_at
+            SELECT
+                folders.id,
+                folders.name,
+                folder_tree.parent_id,
+                folder_tree.path,
+                folders.created_at
             FROM folders
             JOIN folder_tree ON folder_tree.folder_id = folders.id
             WHERE folder_tree.parent_id = ?
@@ -44,16 +56,42 @@ class FolderRepository:
             (parent_id,),
         ).fetchall()
 
+    def paths(self, folder_ids: Sequence[int]) -> dict[int, str]:
+        if not folder_ids:
+            return {}
+        placeholders = ", ".join("?" for _ in folder_ids)
+        rows = self.conn.execute(
+            f"""
+            SELECT folder_id, path
+            FROM folder_tree
+            WHERE folder_id IN ({placeholders});
+            """,
+            list(folder_ids),
+        ).fetchall()
+        return {row["folder_id"]: row["path"] for row in rows}
+
     def update(self, folder_id: int, name: str) -> None:
         self.conn.execute(
             "UPDATE folders SET name = ? WHERE id = ?;",
             (name, folder_id),
         )
-        self.conn.commit()
+        self._refresh_paths(folder_id)
 
     def delete(self, folder_id: int) -> None:
+        row = self.conn.execute(
+            """
+            SELECT folder_tree.path, parent.path AS parent_path
+            FROM folder_tree
+            LEFT JOIN folder_tree AS parent ON parent.folder_id = folder_tree.parent_id
+            WHERE folder_tree.folder_id = ?;
+            """,
+            (folder_id,),
+        ).fetchone()
+        if row is not None and row["parent_path"] is not None:
+            # Children are re-parented by the delete trigger, so their paths
+            # lose this folder's segment.
+            self._rewrite_paths(folder_id, row["path"], row["parent_path"])
         self.conn.execute("DELETE FROM folders WHERE id = ?;", (folder_id,))
-        self.conn.commit()
 
     def move(self, folder_id: int, new_parent_id: int) -> None:
         if folder_id == new_parent_id or self._is_descendant(new_parent_id, folder_id):
@@ -62,13 +100,168 @@ class FolderRepository:
             "UPDATE folder_tree SET parent_id = ? WHERE folder_id = ?;",
             (new_parent_id, folder_id),
         )
-        self.conn.commit()
+        self._refresh_paths(folder_id)
 
     def copy(self, folder_id: int, new_parent_id: int) -> int:
+        """Copy a folder with its subfolders, tools and tool labels under ``new_parent_id``.
+
+        Each table is copied with a single ``INSERT ... SELECT`` driven by
+        temporary old-to-new id maps, so the cost does not grow with round
+        trips. Only the copied root is renamed. The caller owns the transaction.
+        """
         row = self.get(folder_id)
         if row is None:
             raise ValueError(f"Folder {folder_id} not found")
-        return self.create(f"{row['name']} (copy)", new_parent_id)
+        parent = self.get(new_parent_id)
+        if parent is None:
+            raise sqlite3.IntegrityError(f"Folder {new_parent_id} not found")
+        new_path = f"{parent['path']} / {row['name']} (copy)"
+        self._create_copy_maps()
+        # The temp maps have no statistics, so CROSS JOIN pins them as the
+        # outer loop and the copied tables are reached through their indexes.
+        try:
+            # The maps are filled before anything is inserted, so copying a
+            # folder into its own subtree cannot pick up the new rows.
+            self.conn.execute(
+                """
+                WITH RECURSIVE subtree(id) AS (
+                    SELECT ?
+                    UNION ALL
+                    SELECT folder_tree.folder_id
+                    FROM folder_tree
+                    JOIN subtree ON folder_tree.parent_id = subtree.id
+                )
+                INSERT INTO temp.folder_copy_map (old_id, new_id)
+                SELECT id, ? + row_number() OVER (ORDER BY id)
+                FROM subtree;
+                """,
+                (folder_id, self._last_id()),
+            )
+            self.conn.execute(
+                """
+                INSERT INTO folders (id, name)
+                SELECT
+                    map.new_id,
+                    CASE WHEN map.old_id = ? THEN folders.name || ' (copy)' ELSE folders.name END
+                FROM temp.folder_copy_map AS map
+                JOIN folders ON folders.id = map.old_id;
+                """,
+                (folder_id,),
+            )
+            self.conn.execute(
+                """
+                INSERT INTO folder_tree (folder_id, parent_id, path)
+                SELECT
+                    map.new_id,
+                    COALESCE(parent_map.new_id, ?),
+                    ? || substr(folder_tree.path, ?)
+                FROM temp.folder_copy_map AS map
+                JOIN folder_tree ON folder_tree.folder_id = map.old_id
+                LEFT JOIN temp.folder_copy_map AS parent_map
+                    ON parent_map.old_id = folder_tree.parent_id;
+                """,
+                (new_parent_id, new_path, len(row["path"]) + 1),
+            )
+            self.conn.execute(
+                """
+                INSERT INTO temp.tool_copy_map (old_id, new_id)
+                SELECT tools.id, ? + row_number() OVER (ORDER BY tools.id)
+                FROM temp.folder_copy_map AS map
+                CROSS JOIN tools ON tools.folder_id = map.old_id;
+                """,
+                (self._last_id("tools"),),
+            )
+            self.conn.execute(
+                """
+                INSERT INTO tools (id, name, description, enabled, folder_id)
+                SELECT tool_map.new_id, tools.name, tools.description, tools.enabled, map.new_id
+                FROM temp.tool_copy_map AS tool_map
+                JOIN tools ON tools.id = tool_map.old_id
+                JOIN temp.folder_copy_map AS map ON map.old_id = tools.folder_id;
+                """
+            )
+            self.conn.execute(
+                """
+                INSERT INTO tool_labels (tool_id, label_id)
+                SELECT tool_map.new_id, tool_labels.label_id
+                FROM temp.tool_copy_map AS tool_map
+                CROSS JOIN tool_labels ON tool_labels.tool_id = tool_map.old_id;
+                """
+            )
+            return int(
+                self.conn.execute(
+                    "SELECT new_id FROM temp.folder_copy_map WHERE old_id = ?;",
+                    (folder_id,),
+                ).fetchone()["new_id"]
+            )
+        finally:
+            self.conn.execute("DELETE FROM temp.folder_copy_map;")
+            self.conn.execute("DELETE FROM temp.tool_copy_map;")
+
+    def _create_copy_maps(self) -> None:
+        # Plain CREATE statements rather than executescript(), which would
+        # commit the caller's open transaction.
+        for name in ("folder_copy_map", "tool_copy_map"):
+            self.conn.execute(
+                f"""
+                CREATE TEMP TABLE IF NOT EXISTS {name} (
+                    old_id INTEGER PRIMARY KEY,
+                    new_id INTEGER NOT NULL
+                );
+                """
+            )
+
+    def _insert(self, folder_id: int | None, name: str, parent_id: int | None) -> int:
+        cur = self.conn.execute(
+            "INSERT INTO folders (id, name) VALUES (?, ?);",
+            (folder_id, name),
+        )
+        folder_id = int(cur.lastrowid)
+        self.conn.execute(
+            """
+            INSERT INTO folder_tree (folder_id, parent_id, path)
+            VALUES (
+                ?,
+                ?,
+                COALESCE((SELECT path FROM folder_tree WHERE folder_id = ?) || ' / ', '') || ?
+            );
+            """,
+            (folder_id, parent_id, parent_id, name),
+        )
+        return folder_id
+
+    def _refresh_paths(self, folder_id: int) -> None:
+        row = self.conn.execute(
+            """
+            SELECT
+                folder_tree.path AS old_path,
+                COALESCE(parent.path || ' / ', '') || folders.name AS new_path
+            FROM folder_tree
+            JOIN folders ON folders.id = folder_tree.folder_id
+            LEFT JOIN folder_tree AS parent ON parent.folder_id = folder_tree.parent_id
+            WHERE folder_tree.folder_id = ?;
+            """,
+            (folder_id,),
+        ).fetchone()
+        if row is not None and row["old_path"] != row["new_path"]:
+            self._rewrite_paths(folder_id, row["old_path"], row["new_path"])
+
+    def _rewrite_paths(self, folder_id: int, old_prefix: str, new_prefix: str) -> None:
+        self.conn.execute(
+            """
+            WITH RECURSIVE subtree(id) AS (
+                SELECT ?
+                UNION ALL
+                SELECT folder_tree.folder_id
+                FROM folder_tree
+                JOIN subtree ON folder_tree.parent_id = subtree.id
+            )
+            UPDATE folder_tree
+            SET path = ? || substr(path, ?)
+            WHERE folder_id IN (SELECT id FROM subtree);
+            """,
+            (folder_id, new_prefix, len(old_prefix) + 1),
+        )
 
     def _is_descendant(self, candidate_id: int, folder_id: int) -> bool:
         row = self.conn.execute(
@@ -3,23 +3,25 @@ from __future__ import annotations
 import sqlite3
 from typing import Iterable
 
+from mcp_admin.repositories.base import Repository
 
-class LabelRepository:
-    def __init__(self, conn: sqlite3.Connection) -> None:
-        self.conn = conn
+
+class LabelRepository(Repository):
+    table = "labels"
 
     def create(self, name: str, parent_id: int = 1) -> int:
-        cur = self.conn.execute(
-            "INSERT INTO labels (name) VALUES (?);",
-            (name,),
-        )
-        label_id = cur.lastrowid
-        self.conn.execute(
-            "INSERT INTO label_tree (label_id, parent_id) VALUES (?, ?);",
-            (label_id, parent_id),
-        )
-        self.conn.commit()
-        return int(label_id)
+        return self._insert(None, name, parent_id)
+
+    def upsert(self, label_id: int, name: str, parent_id: int | None) -> None:
+        """Create or update the label with a known id, e.g. when importing a catalog."""
+        row = self.get(label_id)
+        if row is None:
+            self._insert(label_id, name, parent_id)
+            return
+        if row["name"] != name:
+            self.update(label_id, name)
+        if parent_id is not None and row["parent_id"] != parent_id:
+            self.move(label_id, parent_id)
 
     def get(self, label_id: int) -> sqlite3.Row | None:
         return self.conn.execute(
@@ -49,11 +51,9 @@ class LabelRepository:
             "UPDATE labels SET name = ? WHERE id = ?;",
             (name, label_id),
         )
-        self.conn.commit()
 
     def delete(self, label_id: int) -> None:
         self.conn.execute("DELETE FROM labels WHERE id = ?;", (label_id,))
-        self.conn.commit()
 
     def move(self, label_id: int, new_parent_id: int) -> None:
         if label_id == new_parent_id or self._is_descendant(new_parent_id, label_id):
@@ -62,7 +62,6 @@ class LabelRepository:
             "UPDATE label_tree SET parent_id = ? WHERE label_id = ?;",
             (new_parent_id, label_id),
         )
-        self.conn.commit()
 
     def copy(self, label_id: int, new_parent_id: int) -> int:
         row = self.get(label_id)
@@ -70,22 +69,24 @@ class LabelRepository:
             raise ValueError(f"Label {label_id} not found")
         return self.create(f"{row['name']} (copy)", new_parent_id)
 
+    def _insert(self, label_id: int | None, name: str, parent_id: int | None) -> int:
+        cur = self.conn.execute(
+            "INSERT INTO labels (id, name) VALUES (?, ?);",
+            (label_id, name),
+        )
+        label_id = int(cur.lastrowid)
+        self.conn.execute(
+            "INSERT INTO label_tree (label_id, parent_id) VALUES (?, ?);",
+            (label_id, parent_id),
+        )
+        return label_id
+
     def _is_descendant(self, candidate_id: int, label_id: int) -> bool:
         row = self.conn.execute(
             """
-            WITH RECURSIVE descendants(id) AS (
-                SELECT label_id
-                FROM label_tree
-                WHERE label_id = ?
-                UNION ALL
-                SELECT label_tree.label_id
-                FROM label_tree
-                JOIN descendants ON label_tree.parent_id = descendants.id
-            )
             SELECT 1
-            FROM descendants
-            WHERE id = ?
-            LIMIT 1;
+            FROM label_closure
+            WHERE ancestor_id = ? AND descendant_id = ?;
             """,
             (label_id, candidate_id),
         ).fetchone()
@@ -1,12 +1,144 @@
 from __future__ import annotations
 
+import re
 import sqlite3
-from typing import Iterable
+from dataclasses import dataclass
+from typing import Iterable, Sequence
 
+from mcp_admin.repositories.base import Repository
 
-class ToolRepository:
-    def __init__(self, conn: sqlite3.Connection) -> None:
-        self.conn = conn
+# Name matches outrank description matches when ordering search results.
+SEARCH_WEIGHTS = (10.0, 1.0)
+
+_SEARCH_TOKEN = re.compile(r"\w+")
+
+
+def _placeholders(values: Sequence[object]) -> str:
+    return ", ".join("?" for _ in values)
+
+
+def match_expression(search: str) -> str | None:
+    tokens = _SEARCH_TOKEN.findall(search)
+    if not tokens:
+        return None
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+TOOL_COLUMNS = ("id", "name", "description", "enabled", "folder_id", "created_at")
+
+
+@dataclass
+class ToolQuery:
+    search: str | None = None
+    folder_path: str | None = None
+    label_ids: Sequence[int] = ()
+    include_descendant_labels: bool = False
+    after: tuple[str | float, int] | None = None
+    limit: int | None = None
+    # id and name are always selected: the cursor is built from them.
+    columns: Sequence[str] = TOOL_COLUMNS
+
+    @property
+    def ranked(self) -> bool:
+        return bool(self.search) and match_expression(self.search) is not None
+
+    def sort_key(self, row: sqlite3.Row) -> tuple[str | float, int]:
+        if self.ranked:
+            return row["rank"], row["id"]
+        return row["name"], row["id"]
+
+    def _filters(self) -> tuple[list[str], str, list[str], list[object]]:
+        """Return the CTEs, FROM source, WHERE clauses and parameters of the filters."""
+        ctes: list[str] = []
+        clauses: list[str] = []
+        params: list[object] = []
+        source = "tools"
+        if self.ranked:
+            ctes.append(
+                f"""
+                matches(id, rank) AS MATERIALIZED (
+                    SELECT rowid, bm25(tools_fts, {SEARCH_WEIGHTS[0]}, {SEARCH_WEIGHTS[1]})
+                    FROM tools_fts
+                    WHERE tools_fts MATCH ?
+                )
+                """
+            )
+            params.append(match_expression(self.search))
+            source = "tools JOIN matches ON matches.id = tools.id"
+        elif self.search:
+            # A search without word characters (say "!!!") has nothing to look
+            # up in the index; it matches no tools rather than dropping the filter.
+            clauses.append("0")
+        if self.folder_path:
+            clauses.append(
+                "tools.folder_id IN "
+                "(SELECT folder_id FROM folder_tree WHERE instr(lower(path), ?) > 0)"
+            )
+            params.append(self.folder_path.lower())
+        # IN (subquery) rather than a correlated EXISTS, so the planner can
+        # start from the labelled tools instead of testing every tool.
+        if self.label_ids and self.include_descendant_labels:
+            clauses.append(
+                "tools.id IN (SELECT tool_labels.tool_id FROM label_closure "
+                "JOIN tool_labels ON tool_labels.label_id = label_closure.descendant_id "
+                f"WHERE label_closure.ancestor_id IN ({_placeholders(self.label_ids)}))"
+            )
+            params.extend(self.label_ids)
+        elif self.label_ids:
+            clauses.append(
+                "tools.id IN (SELECT tool_id FROM tool_labels "
+                f"WHERE label_id IN ({_placeholders(self.label_ids)}))"
+            )
+            params.extend(self.label_ids)
+        return ctes, source, clauses, params
+
+    def to_sql(self) -> tuple[str, list[object]]:
+        selected = dict.fromkeys(("id", "name", *self.columns))
+        unknown = [column for column in selected if column not in TOOL_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown tool columns: {', '.join(unknown)}")
+        columns = ", ".join(f"tools.{column}" for column in selected)
+        ctes, source, clauses, params = self._filters()
+        if self.ranked:
+            if self.after is not None and not isinstance(self.after[0], float):
+                raise ValueError("Cursor does not match the search ordering")
+            columns += ", matches.rank AS rank"
+            order = "matches.rank, tools.id"
+        else:
+            if self.after is not None and not isinstance(self.after[0], str):
+                raise ValueError("Cursor does not match the name ordering")
+            order = "tools.name, tools.id"
+        if self.after is not None:
+            clauses.append(f"({order}) > (?, ?)")
+            params.extend(self.after)
+        sql = f"SELECT {columns} FROM {source}"
+        if ctes:
+            sql = f"WITH {', '.join(ctes)} {sql}"
+        if clauses:
+            sql += f" WHERE {' AND '.join(clauses)}"
+        sql += f" ORDER BY {order}"
+        if self.limit is not None:
+            sql += " LIMIT ?"
+            params.append(self.limit)
+        return sql + ";", params
+
+    def matched_cte(self) -> tuple[str, list[object]]:
+        """Return CTE definitions ending in ``matched(id, folder_id)``.
+
+        ``matched`` holds every tool passing the filters; the cursor and limit
+        are ignored.
+        """
+        ctes, source, clauses, params = self._filters()
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        ctes.append(
+            "matched(id, folder_id) AS MATERIALIZED "
+            f"(SELECT tools.id, tools.folder_id FROM {source}{where})"
+        )
+        return ", ".join(ctes), params
+
+
+class ToolRepository(Repository):
+    table = "tools"
 
     def create(
         self,
@@ -19,9 +151,54 @@ class ToolRepository:
             "INSERT INTO tools (name, description, enabled, folder_id) VALUES (?, ?, ?, ?);",
             (name, description, int(enabled), folder_id),
         )
-        self.conn.commit()
         return int(cur.lastrowid)
 
+    def create_many(self, tools: Sequence[tuple[str, str, bool, int]]) -> list[int]:
+        """Insert ``(name, description, enabled, folder_id)`` rows, returning their ids.
+
+        Must run inside a write transaction: ids are derived from the AUTOINCREMENT
+        sequence, which no other writer can advance while the lock is held.
+        """
+        if not tools:
+            return []
+        first_id = self._last_id() + 1
+        self.conn.executemany(
+            "INSERT INTO tools (name, description, enabled, folder_id) VALUES (?, ?, ?, ?);",
+            [
+                (name, description, int(enabled), folder_id)
+                for name, description, enabled, folder_id in tools
+            ],
+        )
+        last_id = self._last_id()
+        if last_id - first_id + 1 != len(tools):
+            raise RuntimeError("Tool ids were not allocated contiguously")
+        return list(range(first_id, last_id + 1))
+
+    def upsert_many(self, tools: Sequence[tuple[int, str, str, bool, int]]) -> None:
+        """Create or replace ``(id, name, description, enabled, folder_id)`` rows.
+
+        Replaced tools lose their labels; imports re-add them afterwards.
+        """
+        self.conn.executemany(
+            """
+            INSERT INTO tools (id, name, description, enabled, folder_id)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET
+                name = excluded.name,
+                description = excluded.description,
+                enabled = excluded.enabled,
+                folder_id = excluded.folder_id;
+            """,
+            [
+                (tool_id, name, description, int(enabled), folder_id)
+                for tool_id, name, description, enabled, folder_id in tools
+            ],
+        )
+        self.conn.executemany(
+            "DELETE FROM tool_labels WHERE tool_id = ?;",
+            [(tool[0],) for tool in tools],
+        )
+
     def get(self, tool_id: int) -> sqlite3.Row | None:
         return self.conn.execute(
             """
@@ -43,6 +220,69 @@ class ToolRepository:
             (folder_id,),
         ).fetchall()
 
+    def list_matching(self, query: ToolQuery) -> list[sqlite3.Row]:
+        sql, params = query.to_sql()
+        return self.conn.execute(sql, params).fetchall()
+
+    def folder_counts(self, query: ToolQuery) -> list[sqlite3.Row]:
+        """Count matching tools per folder, directly and across each subtree.
+
+        Only folders holding a match and their ancestors are returned.
+        """
+        ctes, params = query.matched_cte()
+        return self.conn.execute(
+            f"""
+            WITH RECURSIVE {ctes},
+            direct(folder_id, tools) AS (
+                SELECT folder_id, count(*)
+                FROM matched
+                GROUP BY folder_id
+            ),
+            ancestry(folder_id, ancestor_id) AS (
+                SELECT folder_id, folder_id
+                FROM direct
+                UNION ALL
+                SELECT ancestry.folder_id, folder_tree.parent_id
+                FROM ancestry
+                JOIN folder_tree ON folder_tree.folder_id = ancestry.ancestor_id
+                WHERE folder_tree.parent_id IS NOT NULL
+            )
+            SELECT
+                ancestry.ancestor_id AS folder_id,
+                coalesce(
+                    sum(CASE WHEN ancestry.ancestor_id = ancestry.folder_id THEN direct.tools END),
+                    0
+                ) AS direct,
+                sum(direct.tools) AS total
+            FROM ancestry
+            JOIN direct ON direct.folder_id = ancestry.folder_id
+            GROUP BY ancestry.ancestor_id
+            ORDER BY ancestry.ancestor_id;
+            """,
+            params,
+        ).fetchall()
+
+    def label_counts(self, query: ToolQuery) -> list[sqlite3.Row]:
+        """Count matching tools per label, directly and including descendant labels."""
+        ctes, params = query.matched_cte()
+        # CROSS JOIN keeps the matched tools as the outer loop; otherwise the
+        # planner walks label_closure in GROUP BY order.
+        return self.conn.execute(
+            f"""
+            WITH {ctes}
+            SELECT
+                label_closure.ancestor_id AS label_id,
+                count(CASE WHEN label_closure.depth = 0 THEN 1 END) AS direct,
+                count(DISTINCT tool_labels.tool_id) AS total
+            FROM matched
+            CROSS JOIN tool_labels ON tool_labels.tool_id = matched.id
+            CROSS JOIN label_closure ON label_closure.descendant_id = tool_labels.label_id
+            GROUP BY label_closure.ancestor_id
+            ORDER BY label_closure.ancestor_id;
+            """,
+            params,
+        ).fetchall()
+
     def update(
         self,
         tool_id: int,
@@ -68,18 +308,48 @@ class ToolRepository:
             f"UPDATE tools SET {', '.join(fields)} WHERE id = ?;",
             params,
         )
-        self.conn.commit()
+
+    def update_many(
+        self,
+        tools: Sequence[tuple[int, str, str | None, bool | None, int | None]],
+    ) -> None:
+        """Apply ``(id, name, description, enabled, folder_id)`` updates; ``None`` keeps a value."""
+        self.conn.executemany(
+            """
+            UPDATE tools
+            SET name = ?,
+                description = COALESCE(?, description),
+                enabled = COALESCE(?, enabled),
+                folder_id = COALESCE(?, folder_id)
+            WHERE id = ?;
+            """,
+            [
+                (name, description, None if enabled is None else int(enabled), folder_id, tool_id)
+                for tool_id, name, description, enabled, folder_id in tools
+            ],
+        )
 
     def delete(self, tool_id: int) -> None:
         self.conn.execute("DELETE FROM tools WHERE id = ?;", (tool_id,))
-        self.conn.commit()
+
+    def delete_many(self, tool_ids: Sequence[int]) -> None:
+        self.conn.executemany(
+            "DELETE FROM tools WHERE id = ?;",
+            [(tool_id,) for tool_id in tool_ids],
+        )
 
     def move(self, tool_id: int, new_folder_id: int) -> None:
         self.conn.execute(
             "UPDATE tools SET folder_id = ? WHERE id = ?;",
             (new_folder_id, tool_id),
         )
-        self.conn.commit()
+
+    def move_many(self, moves: Sequence[tuple[int, int]]) -> None:
+        """Apply ``(tool_id, folder_id)`` moves."""
+        self.conn.executemany(
+            "UPDATE tools SET folder_id = ? WHERE id = ?;",
+            [(folder_id, tool_id) for tool_id, folder_id in moves],
+        )
 
     def copy(self, tool_id: int, target_folder_id: int) -> int:
         row = self.get(tool_id)
@@ -90,16 +360,15 @@ class ToolRepository:
             (f"{row['name']} (copy)", row["description"], row["enabled"], target_folder_id),
         )
         new_tool_id = int(cur.lastrowid)
-        labels = self.conn.execute(
-            "SELECT label_id FROM tool_labels WHERE tool_id = ?;",
-            (tool_id,),
-        ).fetchall()
-        for label in labels:
-            self.conn.execute(
-                "INSERT INTO tool_labels (tool_id, label_id) VALUES (?, ?);",
-                (new_tool_id, label["label_id"]),
-            )
-        self.conn.commit()
+        self.conn.execute(
+            """
+            INSERT INTO tool_labels (tool_id, label_id)
+            SELECT ?, label_id
+            FROM tool_labels
+            WHERE tool_id = ?;
+            """,
+            (new_tool_id, tool_id),
+        )
         return new_tool_id
 
     def add_label(self, tool_id: int, label_id: int) -> None:
@@ -107,14 +376,56 @@ class ToolRepository:
             "INSERT OR IGNORE INTO tool_labels (tool_id, label_id) VALUES (?, ?);",
             (tool_id, label_id),
         )
-        self.conn.commit()
+
+    def add_labels_many(self, pairs: Sequence[tuple[int, int]]) -> None:
+        """Attach ``(tool_id, label_id)`` pairs, ignoring ones already present."""
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO tool_labels (tool_id, label_id) VALUES (?, ?);",
+            pairs,
+        )
+
+    def set_labels(self, tool_id: int, label_ids: Sequence[int]) -> None:
+        self.conn.execute("DELETE FROM tool_labels WHERE tool_id = ?;", (tool_id,))
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO tool_labels (tool_id, label_id) VALUES (?, ?);",
+            [(tool_id, label_id) for label_id in label_ids],
+        )
+
+    def set_labels_many(self, assignments: Sequence[tuple[int, Sequence[int]]]) -> None:
+        """Replace each tool's labels; a tool listed twice keeps its last assignment."""
+        latest = dict(assignments)
+        self.conn.executemany(
+            "DELETE FROM tool_labels WHERE tool_id = ?;",
+            [(tool_id,) for tool_id in latest],
+        )
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO tool_labels (tool_id, label_id) VALUES (?, ?);",
+            [
+                (tool_id, label_id)
+                for tool_id, label_ids in latest.items()
+                for label_id in label_ids
+            ],
+        )
 
     def remove_label(self, tool_id: int, label_id: int) -> None:
         self.conn.execute(
             "DELETE FROM tool_labels WHERE tool_id = ? AND label_id = ?;",
             (tool_id, label_id),
         )
-        self.conn.commit()
+
+    def list_labels_for(self, tool_ids: Sequence[int]) -> list[sqlite3.Row]:
+        if not tool_ids:
+            return []
+        return self.conn.execute(
+            f"""
+            SELECT tool_labels.tool_id, labels.id, labels.name
+            FROM tool_labels
+            JOIN labels ON labels.id = tool_labels.label_id
+            WHERE tool_labels.tool_id IN ({_placeholders(tool_ids)})
+            ORDER BY labels.name;
+            """,
+            list(tool_ids),
+        ).fetchall()
 
     def list_labels(self, tool_id: int) -> Iterable[sqlite3.Row]:
         return self.conn.execute(
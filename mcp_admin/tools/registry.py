@@ -1,40 +1,87 @@
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass, field
-from typing import Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional
 
+# Guards cache fills against a concurrent toggle_tool, so a subtree rendered
+# from the old state is never stored after its invalidation.
+_serialize_lock = threading.RLock()
 
-@dataclass
+
+@dataclass(slots=True)
 class ToolNode:
     name: str
     label: str
     enabled: bool = True
     children: List["ToolNode"] = field(default_factory=list)
+    parent: Optional["ToolNode"] = field(default=None, repr=False, compare=False)
+    # Name -> node for the whole tree; only set on the root.
+    index: Optional[Dict[str, "ToolNode"]] = field(default=None, repr=False, compare=False)
+    _serialized: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self) -> dict:
-        return {
-            "name": self.name,
-            "label": self.label,
-            "enabled": self.enabled,
-            "children": [child.to_dict() for child in self.children],
-        }
-
-
-def _build_node(definition: dict) -> ToolNode:
-    return ToolNode(
+        """Return the serialized subtree, cached until it is invalidated.
+
+        The result is shared between callers and must not be modified.
+        """
+        serialized = self._serialized
+        if serialized is not None:
+            return serialized
+        with _serialize_lock:
+            if self._serialized is None:
+                self._serialized = {
+                    "name": self.name,
+                    "label": self.label,
+                    "enabled": self.enabled,
+                    "children": [child.to_dict() for child in self.children],
+                }
+            return self._serialized
+
+    def invalidate(self) -> None:
+        """Drop the cached form of this node and of every ancestor."""
+        node: Optional[ToolNode] = self
+        while node is not None and node._serialized is not None:
+            node._serialized = None
+            node = node.parent
+
+
+def _register(index: Dict[str, ToolNode], node: ToolNode) -> None:
+    if node.name in index:
+        raise ValueError(f"Duplicate tool name: {node.name}")
+    index[node.name] = node
+
+
+def _build_node(definition: dict, parent: ToolNode, index: Dict[str, ToolNode]) -> ToolNode:
+    node = ToolNode(
         name=definition["name"],
         label=definition.get("label", definition["name"].title()),
         enabled=definition.get("enabled", True),
-        children=[_build_node(child) for child in definition.get("children", [])],
+        parent=parent,
     )
+    _register(index, node)
+    node.children = [_build_node(child, node, index) for child in definition.get("children", [])]
+    return node
 
 
 def discover_tools(definitions: List[dict]) -> ToolNode:
-    root = ToolNode(name="root", label="Root", enabled=True)
-    root.children = [_build_node(definition) for definition in definitions]
+    root = ToolNode(name="root", label="Root", enabled=True, index={})
+    _register(root.index, root)
+    root.children = [_build_node(definition, root, root.index) for definition in definitions]
     return root
 
 
+def _index(root: ToolNode) -> Dict[str, ToolNode]:
+    if root.index is None:
+        # Trees assembled by hand are linked and indexed on first lookup.
+        root.index = {}
+        for node in iter_tree(root):
+            _register(root.index, node)
+            for child in node.children:
+                child.parent = node
+    return root.index
+
+
 def iter_tree(root: ToolNode) -> Iterable[ToolNode]:
     yield root
     for child in root.children:
@@ -42,29 +89,26 @@ def iter_tree(root: ToolNode) -> Iterable[ToolNode]:
 
 
 def find_tool(root: ToolNode, name: str) -> Optional[ToolNode]:
-    for node in iter_tree(root):
-        if node.name == name:
-            return node
-    return None
+    return _index(root).get(name)
 
 
 def toggle_tool(root: ToolNode, name: str, enabled: bool) -> bool:
     node = find_tool(root, name)
     if not node:
         return False
-    node.enabled = enabled
+    with _serialize_lock:
+        node.enabled = enabled
+        node.invalidate()
     return True
 
 
 def get_label_path(root: ToolNode, name: str) -> List[str]:
-    def walk(node: ToolNode, labels: List[str]) -> Optional[List[str]]:
-        if node.name == name:
-            return labels + [node.label]
-        for child in node.children:
-            result = walk(child, labels + [node.label])
-            if result:
-                return result
-        return None
-
-    result = walk(root, [])
-    return result or []
+    node = find_tool(root, name)
+    labels: List[str] = []
+    while node is not None:
+        labels.append(node.label)
+        if node is root:
+            break
+        node = node.parent
+    labels.reverse()
+    return labels
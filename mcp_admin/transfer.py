@@ -0,0 +1,155 @@
+"""NDJSON export and import of the whole catalog.
+
+A snapshot is one JSON object per line, each with a ``type`` of ``folder``,
+``label``, ``tool`` or ``tool_label``. Exports list parents before children
+and tools before their label links, which is the order imports expect.
+Imports upsert by id; a replaced tool keeps only the label links that follow
+it in the stream.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import sqlite3
+from typing import AsyncIterator, Iterator
+
+from mcp_admin.repositories import FolderRepository, LabelRepository, ToolRepository
+
+RECORD_TYPES = ("folder", "label", "tool", "tool_label")
+
+Record = tuple[int, str, tuple]
+
+
+class ImportFormatError(ValueError):
+    def __init__(self, line_number: int, message: str, *, last_line: int | None = None) -> None:
+        if last_line is None or last_line == line_number:
+            where = f"Line {line_number}"
+        else:
+            where = f"Lines {line_number}-{last_line}"
+        super().__init__(f"{where}: {message}")
+        self.line_number = line_number
+
+
+def _tree_sql(table: str, tree: str, key: str) -> str:
+    # Parents first, so an import can insert every node under an existing parent.
+    return f"""
+        WITH RECURSIVE ordered(id, depth) AS (
+            SELECT {key}, 0 FROM {tree} WHERE parent_id IS NULL
+            UNION ALL
+            SELECT {tree}.{key}, ordered.depth + 1
+            FROM {tree}
+            JOIN ordered ON {tree}.parent_id = ordered.id
+        )
+        SELECT {table}.id, {table}.name, {tree}.parent_id
+        FROM ordered
+        JOIN {table} ON {table}.id = ordered.id
+        JOIN {tree} ON {tree}.{key} = ordered.id
+        ORDER BY ordered.depth, ordered.id;
+    """
+
+
+def export_records(conn: sqlite3.Connection) -> Iterator[dict]:
+    for kind, table, tree, key in (
+        ("folder", "folders", "folder_tree", "folder_id"),
+        ("label", "labels", "label_tree", "label_id"),
+    ):
+        for row in conn.execute(_tree_sql(table, tree, key)):
+            yield {
+                "type": kind,
+                "id": row["id"],
+                "name": row["name"],
+                "parentId": row["parent_id"],
+            }
+    for row in conn.execute(
+        "SELECT id, name, description, enabled, folder_id FROM tools ORDER BY id;"
+    ):
+        yield {
+            "type": "tool",
+            "id": row["id"],
+            "name": row["name"],
+            "description": row["description"],
+            "enabled": bool(row["enabled"]),
+            "folderId": row["folder_id"],
+        }
+    for row in conn.execute(
+        "SELECT tool_id, label_id FROM tool_labels ORDER BY tool_id, label_id;"
+    ):
+        yield {"type": "tool_label", "toolId": row["tool_id"], "labelId": row["label_id"]}
+
+
+def export_lines(conn: sqlite3.Connection) -> Iterator[bytes]:
+    for record in export_records(conn):
+        yield json.dumps(record, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[tuple[int, bytes]]:
+    """Split a byte stream into numbered, non-blank lines."""
+    buffer = b""
+    line_number = 0
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            line_number += 1
+            if line.strip():
+                yield line_number, line
+    if buffer.strip():
+        yield line_number + 1, buffer
+
+
+def parse_record(line_number: int, line: bytes | str) -> Record:
+    try:
+        record = json.loads(line)
+        kind = record["type"]
+        if kind in ("folder", "label"):
+            parent_id = record.get("parentId")
+            values: tuple = (
+                int(record["id"]),
+                str(record["name"]),
+                None if parent_id is None else int(parent_id),
+            )
+        elif kind == "tool":
+            values = (
+                int(record["id"]),
+                str(record["name"]),
+                str(record.get("description") or ""),
+                bool(record.get("enabled", True)),
+                int(record["folderId"]),
+            )
+        elif kind == "tool_label":
+            values = (int(record["toolId"]), int(record["labelId"]))
+        else:
+            raise ImportFormatError(line_number, f"Unknown record type {kind!r}")
+    except (KeyError, TypeError, ValueError) as exc:
+        if isinstance(exc, ImportFormatError):
+            raise
+        raise ImportFormatError(line_number, "Malformed record") from exc
+    return line_number, kind, values
+
+
+def import_records(conn: sqlite3.Connection, records: list[Record]) -> dict[str, int]:
+    """Apply parsed records; the caller owns the transaction."""
+    counts = dict.fromkeys(RECORD_TYPES, 0)
+    folders = FolderRepository(conn)
+    labels = LabelRepository(conn)
+    tools = ToolRepository(conn)
+    for kind, group in itertools.groupby(records, key=lambda record: record[1]):
+        run = list(group)
+        if kind in ("folder", "label"):
+            repo = folders if kind == "folder" else labels
+            for line_number, _, values in run:
+                try:
+                    repo.upsert(*values)
+                except (sqlite3.IntegrityError, ValueError) as exc:
+                    raise ImportFormatError(line_number, str(exc)) from exc
+        else:
+            try:
+                if kind == "tool":
+                    tools.upsert_many([values for _, _, values in run])
+                else:
+                    tools.add_labels_many([values for _, _, values in run])
+            except sqlite3.IntegrityError as exc:
+                raise ImportFormatError(run[0][0], str(exc), last_line=run[-1][0]) from exc
+        counts[kind] += len(run)
+    return counts
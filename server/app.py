@@ -3,6 +3,7 @@ from typing import Optional
 from fastapi import FastAPI, HTTPException
 from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
 
+from mcp_admin.metrics import install_metrics
 from server import config, storage
 from server.oauth import (
     build_auth_url,
@@ -15,6 +16,7 @@ from server.tools import all_tool_metadata
 
 
 app = FastAPI(title="MCP Admin")
+install_metrics(app)
 
 
 @app.on_event("startup")
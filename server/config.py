@@ -12,3 +12,12 @@ GMAIL_OAUTH_SCOPES = [
 ]
 
 DB_PATH = os.environ.get("MCP_ADMIN_DB_PATH", "/workspace/mcp_admin/server/mcp_admin.sqlite")
+
+# Fraction of tool server requests to profile; unset disables the profiler.
+PROFILE_RATE = float(os.environ["MCP_PROFILE_RATE"]) if "MCP_PROFILE_RATE" in os.environ else None
+# Threads shared by blocking tool calls, apart from the web server's threadpool.
+TOOL_WORKERS = int(os.environ.get("MCP_TOOL_WORKERS", "16"))
+# Import tool modules on first use instead of at startup.
+LAZY_TOOLS = os.environ.get("MCP_LAZY_TOOLS", "").lower() in {"1", "true", "yes"}
+# Written by `python -m server.tool_manifest`; unset scans every tool module.
+TOOL_MANIFEST = os.environ.get("MCP_TOOL_MANIFEST") or None
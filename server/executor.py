@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from typing import Any, Dict
+
+import anyio
+import anyio.to_thread
+
+from server.tools.base import BaseTool
+
+DEFAULT_MAX_WORKERS = 16
+
+
+class ToolExecutor:
+    """Runs tool calls without tying up the web server's own threadpool.
+
+    Blocking tools share ``max_workers`` threads, separate from the limiter
+    FastAPI uses for sync endpoints. A tool whose metadata sets
+    ``max_concurrency`` also gets its own limiter, so extra calls to a slow
+    tool queue behind it instead of taking every worker.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.max_workers = max_workers
+        self._workers = anyio.CapacityLimiter(max_workers)
+        self._limiters: Dict[str, anyio.CapacityLimiter] = {}
+
+    def _limiter(self, tool: BaseTool) -> anyio.CapacityLimiter | None:
+        limit = tool.metadata.max_concurrency
+        if limit is None:
+            return None
+        limiter = self._limiters.get(tool.metadata.name)
+        if limiter is None:
+            limiter = self._limiters[tool.metadata.name] = anyio.CapacityLimiter(limit)
+        return limiter
+
+    async def run(self, tool: BaseTool, payload: Dict[str, Any]) -> Dict[str, Any]:
+        limiter = self._limiter(tool)
+        if limiter is None:
+            return await self._call(tool, payload)
+        async with limiter:
+            return await self._call(tool, payload)
+
+    async def _call(self, tool: BaseTool, payload: Dict[str, Any]) -> Dict[str, Any]:
+        if tool.is_async:
+            return await tool.run(payload)
+        # Not cancellable: a disconnected client must not free the slot while
+        # the thread is still running the tool.
+        return await anyio.to_thread.run_sync(tool.run, payload, limiter=self._workers)
@@ -0,0 +1,74 @@
+"""JSON-RPC 2.0 batches of tool calls.
+
+Each request names a tool as its ``method`` and passes the tool payload as
+``params``. Calls in a batch run concurrently; responses come back in
+request order, and requests without an ``id`` (notifications) get none.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+import anyio
+
+from server.executor import ToolExecutor
+from server.mcp_registry import MCPRegistry
+
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+TOOL_ERROR = -32000
+# Calls accepted in one batch; each may take a tool executor slot.
+MAX_BATCH_SIZE = 50
+
+
+def error_response(request_id: Any, code: int, message: str) -> Dict[str, Any]:
+    return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+
+
+async def _call(
+    registry: MCPRegistry, executor: ToolExecutor, request: Any
+) -> Optional[Dict[str, Any]]:
+    if not isinstance(request, dict):
+        return error_response(None, INVALID_REQUEST, "Invalid Request")
+    request_id = request.get("id")
+    if not isinstance(request_id, (str, int, type(None))) or isinstance(request_id, bool):
+        return error_response(None, INVALID_REQUEST, "Invalid Request")
+    if request.get("jsonrpc") != "2.0" or not isinstance(request.get("method"), str):
+        return error_response(request_id, INVALID_REQUEST, "Invalid Request")
+    params = request.get("params", {})
+    try:
+        # Inside the try: a lazily registered tool is imported here.
+        tool = await registry.resolve(request["method"])
+        if tool is None:
+            response = error_response(request_id, METHOD_NOT_FOUND, "Tool not found")
+        elif not isinstance(params, dict):
+            response = error_response(request_id, INVALID_PARAMS, "params must be an object")
+        else:
+            result = await executor.run(tool, params)
+            response = {"jsonrpc": "2.0", "id": request_id, "result": result}
+    except Exception as exc:
+        response = error_response(request_id, TOOL_ERROR, str(exc) or type(exc).__name__)
+    return response if "id" in request else None
+
+
+async def handle(registry: MCPRegistry, executor: ToolExecutor, body: Any) -> Any:
+    """Answer a single request or a batch; None means nothing to send back."""
+    if not isinstance(body, list):
+        return await _call(registry, executor, body)
+    if not body:
+        return error_response(None, INVALID_REQUEST, "Invalid Request")
+    if len(body) > MAX_BATCH_SIZE:
+        return error_response(None, INVALID_REQUEST, f"Batch exceeds {MAX_BATCH_SIZE} calls")
+
+    responses: List[Optional[Dict[str, Any]]] = [None] * len(body)
+
+    async def run(index: int, request: Any) -> None:
+        responses[index] = await _call(registry, executor, request)
+
+    async with anyio.create_task_group() as group:
+        for index, request in enumerate(body):
+            group.start_soon(run, index, request)
+    answered = [response for response in responses if response is not None]
+    return answered or None
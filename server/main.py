@@ -1,30 +1,75 @@
 from __future__ import annotations
 
+import json
+from pathlib import Path
 from typing import Any, Dict
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import JSONResponse
 
+from mcp_admin.metrics import install_metrics
+from mcp_admin.profiling import install_profiler
+from server import config, jsonrpc
+from server.executor import DEFAULT_MAX_WORKERS, ToolExecutor
 from server.mcp_registry import MCPRegistry
-from server.tool_loader import instantiate_tools
+from server.tool_loader import discover_tool_specs, instantiate_tools, load_tools
+from server.tool_manifest import load_tool_specs
 
 
-def create_app() -> FastAPI:
+def create_app(
+    *,
+    profile_rate: float | None = None,
+    tool_workers: int = DEFAULT_MAX_WORKERS,
+    lazy_tools: bool = False,
+    tool_manifest: str | Path | None = None,
+) -> FastAPI:
     app = FastAPI(title="MCP Tool Server")
+    install_metrics(app)
+    if profile_rate is not None:
+        install_profiler(app, sample_rate=profile_rate)
     registry = MCPRegistry()
-    registry.register_many(instantiate_tools())
+    if tool_manifest is not None:
+        specs = load_tool_specs(tool_manifest)
+        if lazy_tools:
+            registry.register_lazy(specs)
+        else:
+            registry.register_many(load_tools(specs))
+    elif lazy_tools:
+        registry.register_lazy(discover_tool_specs())
+    else:
+        registry.register_many(instantiate_tools())
+    executor = ToolExecutor(tool_workers)
+    app.state.executor = executor
 
     @app.get("/mcp/tools")
     def list_tools() -> Dict[str, Any]:
         return {"tools": registry.list_tools()}
 
     @app.post("/mcp/tools/{tool_name}")
-    def run_tool(tool_name: str, payload: Dict[str, Any]) -> Dict[str, Any]:
-        tool = registry.tool(tool_name)
+    async def run_tool(tool_name: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        tool = await registry.resolve(tool_name)
         if tool is None:
             raise HTTPException(status_code=404, detail="Tool not found")
-        return tool.run(payload)
+        return await executor.run(tool, payload)
+
+    # JSON-RPC 2.0: a request or batch of requests, one tool call each.
+    @app.post("/mcp/batch")
+    async def run_batch(request: Request) -> Response:
+        try:
+            body = json.loads(await request.body())
+        except ValueError:
+            return JSONResponse(jsonrpc.error_response(None, jsonrpc.PARSE_ERROR, "Parse error"))
+        result = await jsonrpc.handle(registry, executor, body)
+        if result is None:
+            return Response(status_code=204)
+        return JSONResponse(result)
 
     return app
 
 
-app = create_app()
+app = create_app(
+    profile_rate=config.PROFILE_RATE,
+    tool_workers=config.TOOL_WORKERS,
+    lazy_tools=config.LAZY_TOOLS,
+    tool_manifest=config.TOOL_MANIFEST,
+)
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
-from typing import Dict, List
+import threading
+from typing import Dict, List, Union
 
-from server.tools.base import BaseTool
+import anyio.to_thread
+
+from server.tool_loader import ToolSpec, load_tools
+from server.tools.base import BaseTool, describe_tool
 
 
 class MCPRegistry:
     def __init__(self) -> None:
-        self._tools: Dict[str, BaseTool] = {}
+        # Lazily registered tools stay ToolSpecs until first looked up.
+        self._tools: Dict[str, Union[BaseTool, ToolSpec]] = {}
+        self._load_lock = threading.Lock()
 
     def register(self, tool: BaseTool) -> None:
         self._tools[tool.metadata.name] = tool
@@ -16,8 +22,38 @@ class MCPRegistry:
         for tool in tools:
             self.register(tool)
 
+    def register_lazy(self, specs: List[ToolSpec]) -> None:
+        """Register tools by spec; each module is imported on its first lookup.
+
+        Specs without static metadata are loaded now, since their name is
+        only known once the tool is constructed; those that turn out not to
+        be tools are skipped.
+        """
+        for spec in specs:
+            if spec.metadata is not None:
+                self._tools[spec.metadata.name] = spec
+            else:
+                self.register_many(load_tools([spec]))
+
     def list_tools(self) -> List[Dict[str, object]]:
-        return [tool.as_mcp_tool() for tool in self._tools.values()]
+        return [
+            describe_tool(entry.metadata) if isinstance(entry, ToolSpec) else entry.as_mcp_tool()
+            for entry in self._tools.values()
+        ]
+
+    async def resolve(self, name: str) -> BaseTool | None:
+        """``tool()`` for async callers: a first lookup imports on a worker thread."""
+        entry = self._tools.get(name)
+        if not isinstance(entry, ToolSpec):
+            return entry
+        return await anyio.to_thread.run_sync(self.tool, name)
 
     def tool(self, name: str) -> BaseTool | None:
-        return self._tools.get(name)
+        entry = self._tools.get(name)
+        if not isinstance(entry, ToolSpec):
+            return entry
+        with self._load_lock:
+            entry = self._tools[name]
+            if isinstance(entry, ToolSpec):
+                entry = self._tools[name] = entry.load()
+            return entry
@@ -1,10 +1,46 @@
 from __future__ import annotations
 
+import ast
 import importlib
+import importlib.util
 import pkgutil
-from typing import Iterable, List, Type
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, List, Optional, Type
 
-from server.tools.base import BaseTool
+from server.tools.base import BaseTool, Tool
+
+
+@dataclass
+class ToolSpec:
+    """A tool class found without importing its module.
+
+    ``metadata`` is None when the class does not build its ``Tool`` from
+    literals; such tools have to be loaded to learn their name.
+    """
+
+    module: str
+    class_name: str
+    metadata: Optional[Tool] = None
+
+    def tool_class(self) -> Optional[Type[BaseTool]]:
+        """Import the class; None if it turns out not to be a ``BaseTool`` subclass."""
+        attribute = getattr(importlib.import_module(self.module), self.class_name)
+        if isinstance(attribute, type) and issubclass(attribute, BaseTool):
+            return attribute
+        return None
+
+    def load(self) -> BaseTool:
+        tool_class = self.tool_class()
+        if tool_class is None:
+            raise TypeError(f"{self.module}.{self.class_name} is not a BaseTool subclass")
+        tool = tool_class()
+        if self.metadata is not None and tool.metadata.name != self.metadata.name:
+            raise ValueError(
+                f"{self.module}.{self.class_name} registered as {tool.metadata.name!r}, "
+                f"but its source declares {self.metadata.name!r}"
+            )
+        return tool
 
 
 def discover_tool_classes(package: str = "server.tools") -> List[Type[BaseTool]]:
@@ -27,3 +63,96 @@ def instantiate_tools(package: str = "server.tools") -> List[BaseTool]:
 def iter_tools(package: str = "server.tools") -> Iterable[BaseTool]:
     for tool in instantiate_tools(package):
         yield tool
+
+
+def _base_name(node: ast.expr) -> str | None:
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return None
+
+
+def _literal_metadata(class_node: ast.ClassDef) -> Optional[Tool]:
+    calls = [
+        node
+        for node in ast.walk(class_node)
+        if isinstance(node, ast.Call) and _base_name(node.func) == "Tool"
+    ]
+    if len(calls) != 1 or any(keyword.arg is None for keyword in calls[0].keywords):
+        return None
+    try:
+        args = [ast.literal_eval(arg) for arg in calls[0].args]
+        kwargs = {keyword.arg: ast.literal_eval(keyword.value) for keyword in calls[0].keywords}
+        return Tool(*args, **kwargs)
+    except (TypeError, ValueError):
+        return None
+
+
+def _imported_names(tree: ast.Module) -> set[str]:
+    names: set[str] = set()
+    for node in tree.body:
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            for alias in node.names:
+                names.add((alias.asname or alias.name).split(".")[0])
+    return names
+
+
+def scan_module(path: str | Path, module: str, source: bytes | None = None) -> List[ToolSpec]:
+    """Find the ``BaseTool`` subclasses defined in a module's source.
+
+    A class built on an imported base other than ``BaseTool`` (say, a shared
+    base class from another module) may or may not be a tool. It gets a spec
+    without metadata, so it is imported and checked when registered.
+    """
+    if source is None:
+        source = Path(path).read_bytes()
+    tree = ast.parse(source, filename=str(path))
+    imported = _imported_names(tree)
+    tool_classes = {"BaseTool"}
+    unresolved: set[str] = set()
+    specs: List[ToolSpec] = []
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        if any(_base_name(base) in tool_classes for base in node.bases):
+            tool_classes.add(node.name)
+            specs.append(ToolSpec(module, node.name, _literal_metadata(node)))
+        elif any(
+            isinstance(base, ast.Attribute) or _base_name(base) in imported | unresolved
+            for base in node.bases
+        ):
+            unresolved.add(node.name)
+            specs.append(ToolSpec(module, node.name))
+    return specs
+
+
+def load_tools(specs: Iterable[ToolSpec]) -> List[BaseTool]:
+    """Load every spec, skipping unresolved classes that are not tools after all."""
+    return [
+        spec.load() for spec in specs if spec.metadata is not None or spec.tool_class() is not None
+    ]
+
+
+def module_files(package: str) -> Iterable[tuple[str, str]]:
+    """Yield ``(module name, source path)`` for each top-level module of ``package``."""
+    # find_spec locates the package without running its __init__.
+    package_spec = importlib.util.find_spec(package)
+    if package_spec is None or package_spec.submodule_search_locations is None:
+        raise ModuleNotFoundError(f"No package named {package!r}")
+    for module_info in pkgutil.iter_modules(package_spec.submodule_search_locations):
+        directory = Path(module_info.module_finder.path)
+        if module_info.ispkg:
+            path = directory / module_info.name / "__init__.py"
+        else:
+            path = directory / f"{module_info.name}.py"
+        if path.is_file():
+            yield f"{package}.{module_info.name}", str(path)
+
+
+def discover_tool_specs(package: str = "server.tools") -> List[ToolSpec]:
+    """Like ``discover_tool_classes``, but reads source instead of importing it."""
+    specs: List[ToolSpec] = []
+    for module, path in module_files(package):
+        specs.extend(scan_module(path, module))
+    return specs
@@ -0,0 +1,123 @@
+"""Precompiled tool discovery manifest.
+
+``python -m server.tool_manifest --output tools.json`` records every tool
+module's source fingerprint and the specs found in it. At startup,
+``load_tool_specs`` uses a module's manifest entry when its size and mtime
+still match, or when its sha256 does after a touch. Other modules (changed,
+new, or every module when the manifest is missing or unreadable) are
+scanned as usual.
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from server.tool_loader import ToolSpec, module_files, scan_module
+from server.tools.base import Tool
+
+MANIFEST_VERSION = 1
+
+
+def _spec_to_json(spec: ToolSpec) -> Dict[str, Any]:
+    return {
+        "name": spec.metadata.name if spec.metadata is not None else None,
+        "target": f"{spec.module}:{spec.class_name}",
+        "metadata": dataclasses.asdict(spec.metadata) if spec.metadata is not None else None,
+    }
+
+
+def _spec_from_json(entry: Dict[str, Any]) -> ToolSpec:
+    module, class_name = entry["target"].split(":", 1)
+    metadata = entry["metadata"]
+    return ToolSpec(module, class_name, Tool(**metadata) if metadata is not None else None)
+
+
+def _module_entry(path: str, module: str) -> tuple[Dict[str, Any], List[ToolSpec]]:
+    source = Path(path).read_bytes()
+    stat = os.stat(path)
+    specs = scan_module(path, module, source)
+    entry = {
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": hashlib.sha256(source).hexdigest(),
+        "tools": [_spec_to_json(spec) for spec in specs],
+    }
+    return entry, specs
+
+
+def build_manifest(package: str = "server.tools") -> Dict[str, Any]:
+    modules = {module: _module_entry(path, module)[0] for module, path in module_files(package)}
+    return {"version": MANIFEST_VERSION, "package": package, "modules": modules}
+
+
+def write_manifest(path: str | Path, package: str = "server.tools") -> Dict[str, Any]:
+    manifest = build_manifest(package)
+    Path(path).write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n")
+    return manifest
+
+
+def _read_manifest(path: str | Path | None, package: str) -> Dict[str, Any]:
+    if path is None:
+        return {}
+    try:
+        manifest = json.loads(Path(path).read_text())
+    except (OSError, ValueError):
+        return {}
+    if manifest.get("version") != MANIFEST_VERSION or manifest.get("package") != package:
+        return {}
+    return manifest.get("modules", {})
+
+
+def _cached_specs(path: str, entry: Optional[Dict[str, Any]]) -> Optional[List[ToolSpec]]:
+    if entry is None:
+        return None
+    stat = os.stat(path)
+    if (stat.st_size, stat.st_mtime_ns) != (entry["size"], entry["mtime_ns"]):
+        # A checkout or copy can move mtimes without changing the source.
+        source = Path(path).read_bytes()
+        if hashlib.sha256(source).hexdigest() != entry["sha256"]:
+            return None
+    return [_spec_from_json(tool) for tool in entry["tools"]]
+
+
+def load_tool_specs(
+    manifest_path: str | Path | None, package: str = "server.tools"
+) -> List[ToolSpec]:
+    """``discover_tool_specs`` that trusts the manifest for unchanged modules."""
+    cached = _read_manifest(manifest_path, package)
+    specs: List[ToolSpec] = []
+    for module, path in module_files(package):
+        try:
+            module_specs = _cached_specs(path, cached.get(module))
+        except (KeyError, TypeError, ValueError):
+            module_specs = None
+        if module_specs is None:
+            module_specs = scan_module(path, module)
+        specs.extend(module_specs)
+    return specs
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m server.tool_manifest",
+        description="Write the tool discovery manifest read at server startup.",
+    )
+    parser.add_argument("--package", default="server.tools")
+    parser.add_argument("--output", type=Path, required=True)
+    args = parser.parse_args(argv)
+
+    manifest = write_manifest(args.output, args.package)
+    count = sum(len(entry["tools"]) for entry in manifest["modules"].values())
+    sys.stdout.write(f"Wrote {count} tools from {len(manifest['modules'])} modules\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
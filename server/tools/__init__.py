@@ -1,7 +1,9 @@
 """Tool implementations for MCP server."""
 
-from server.tools.gmail import tool_metadata as gmail_metadata
-
 
 def all_tool_metadata() -> list[dict]:
+    # Imported here so that loading one tool module does not pull in the
+    # Gmail tools and their httpx and cryptography dependencies.
+    from server.tools.gmail import tool_metadata as gmail_metadata
+
     return gmail_metadata()
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import inspect
 from dataclasses import dataclass, field
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 
 @dataclass
@@ -12,6 +13,13 @@ class Tool:
     labels: List[str] = field(default_factory=list)
     enabled: bool = True
     hidden: bool = False
+    # Most calls of this tool allowed to run at once; None leaves only the
+    # executor's overall bound.
+    max_concurrency: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        if self.max_concurrency is not None and self.max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
 
 
 class BaseTool:
@@ -21,14 +29,25 @@ class BaseTool:
         self.metadata = metadata
 
     def run(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle one call. Define it with ``async def`` for non-blocking tools."""
         raise NotImplementedError("Tools must implement run().")
 
+    @property
+    def is_async(self) -> bool:
+        # Blocking tools run on the tool executor's threads; async ones on the
+        # event loop, so they must not block.
+        return inspect.iscoroutinefunction(self.run)
+
     def as_mcp_tool(self) -> Dict[str, Any]:
-        return {
-            "name": self.metadata.name,
-            "description": self.metadata.description,
-            "folder_id": self.metadata.folder_id,
-            "labels": list(self.metadata.labels),
-            "enabled": self.metadata.enabled,
-            "hidden": self.metadata.hidden,
-        }
+        return describe_tool(self.metadata)
+
+
+def describe_tool(metadata: Tool) -> Dict[str, Any]:
+    return {
+        "name": metadata.name,
+        "description": metadata.description,
+        "folder_id": metadata.folder_id,
+        "labels": list(metadata.labels),
+        "enabled": metadata.enabled,
+        "hidden": metadata.hidden,
+    }
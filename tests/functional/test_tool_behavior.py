@@ -31,3 +31,23 @@ def test_toggle_tool_returns_false_for_missing_tool() -> None:
     result = toggle_tool(root, "missing", False)
 
     assert result is False
+
+
+def test_toggle_tool_invalidates_only_the_ancestor_chain() -> None:
+    definitions = [
+        {"name": "messaging", "children": [{"name": "echo"}, {"name": "ping"}]},
+        {"name": "analytics", "children": [{"name": "report"}]},
+    ]
+    root = discover_tools(definitions)
+    messaging, analytics = root.children
+    before = root.to_dict()
+    ping = messaging.children[1].to_dict()
+    report = analytics.to_dict()
+
+    toggle_tool(root, "echo", False)
+    after = root.to_dict()
+
+    assert after is not before
+    assert after["children"][0]["children"][0]["enabled"] is False
+    assert after["children"][0]["children"][1] is ping
+    assert after["children"][1] is report
@@ -1,9 +1,11 @@
+import re
+
 import pytest
 
 pytest.importorskip("fastapi")
 from fastapi.testclient import TestClient
 
-from mcp_admin.api import create_app
+from mcp_admin.api import FACET_CACHE_SIZE, create_app
 
 
 def test_health_endpoint() -> None:
@@ -35,6 +37,21 @@ def test_toggle_tool_endpoint() -> None:
     assert response.json() == {"name": "echo", "enabled": False}
 
 
+def test_list_tools_reflects_toggles() -> None:
+    client = TestClient(create_app())
+    client.get("/tools")
+
+    client.post("/tools/echo/enable", json={"enabled": False})
+
+    messaging = client.get("/tools").json()["tools"][0]
+    assert messaging["children"][0] == {
+        "name": "echo",
+        "label": "Echo",
+        "enabled": False,
+        "children": [],
+    }
+
+
 def test_tool_label_endpoint() -> None:
     client = TestClient(create_app())
 
@@ -58,3 +75,433 @@ def test_tool_label_endpoint_returns_404_for_missing_tool() -> None:
     response = client.get("/tools/missing/labels")
 
     assert response.status_code == 404
+
+
+def test_api_tools_pages_with_cursor() -> None:
+    client = TestClient(create_app())
+    for name in ["delta", "alpha", "charlie", "bravo", "alpha"]:
+        assert client.post("/api/tools", json={"name": name}).status_code == 200
+
+    first = client.get("/api/tools", params={"limit": 2}).json()
+    second = client.get("/api/tools", params={"limit": 2, "after": first["nextCursor"]}).json()
+    third = client.get("/api/tools", params={"limit": 2, "after": second["nextCursor"]}).json()
+
+    names = [tool["name"] for page in (first, second, third) for tool in page["tools"]]
+    assert names == ["alpha", "alpha", "bravo", "charlie", "delta"]
+    assert third["nextCursor"] is None
+
+
+def test_api_tools_paginates_filtered_results() -> None:
+    client = TestClient(create_app())
+    for name in ["agent-a", "other-a", "agent-b", "other-b", "agent-c"]:
+        client.post("/api/tools", json={"name": name})
+
+    first = client.get("/api/tools", params={"search": "agent", "limit": 2}).json()
+    second = client.get(
+        "/api/tools", params={"search": "agent", "limit": 2, "after": first["nextCursor"]}
+    ).json()
+
+    assert [tool["name"] for tool in first["tools"]] == ["agent-a", "agent-b"]
+    assert [tool["name"] for tool in second["tools"]] == ["agent-c"]
+    assert second["nextCursor"] is None
+
+
+def test_api_tools_punctuation_only_search_matches_nothing() -> None:
+    client = TestClient(create_app())
+    client.post("/api/tools", json={"name": "alpha"})
+
+    for search in ("!!!", "++"):
+        listed = client.get("/api/tools", params={"search": search}).json()
+        facets = client.get("/api/tools/facets", params={"search": search}).json()
+
+        assert listed == {"tools": [], "nextCursor": None}
+        assert all(folder["total"] == 0 for folder in facets["folders"])
+
+
+def test_api_tools_search_cursor_expires_after_a_write() -> None:
+    client = TestClient(create_app())
+    for name in ["agent-a", "agent-b", "agent-c"]:
+        client.post("/api/tools", json={"name": name})
+    first = client.get("/api/tools", params={"search": "agent", "limit": 1}).json()
+    params = {"search": "agent", "limit": 1, "after": first["nextCursor"]}
+
+    # Without writes in between, the same cursor keeps working.
+    assert client.get("/api/tools", params=params).status_code == 200
+    assert client.get("/api/tools", params=params).json()["tools"][0]["name"] == "agent-b"
+
+    client.post("/api/tools", json={"name": "agent-d"})
+    response = client.get("/api/tools", params=params)
+
+    assert response.status_code == 409
+    name_cursor = client.get("/api/tools", params={"limit": 1}).json()["nextCursor"]
+    client.post("/api/tools", json={"name": "zulu"})
+    assert client.get("/api/tools", params={"after": name_cursor}).status_code == 200
+
+
+def test_api_tools_returns_sparse_fieldsets() -> None:
+    client = TestClient(create_app())
+    folder = client.post("/api/folders", json={"name": "ops"}).json()
+    client.post("/api/tools", json={"name": "alpha", "folderId": folder["id"]})
+    client.post("/api/tools", json={"name": "beta", "folderId": folder["id"]})
+
+    first = client.get("/api/tools", params={"fields": "id,name,enabled", "limit": 1}).json()
+    second = client.get(
+        "/api/tools", params={"fields": "name", "limit": 1, "after": first["nextCursor"]}
+    ).json()
+
+    assert set(first["tools"][0]) == {"id", "name", "enabled"}
+    assert second["tools"] == [{"name": "beta"}]
+    assert client.get("/api/tools", params={"fields": "id,secret"}).status_code == 400
+    assert client.get("/api/tools", params={"fields": ""}).status_code == 400
+
+
+def test_api_tool_facets_follow_filters_and_writes() -> None:
+    client = TestClient(create_app())
+    folder = client.post("/api/folders", json={"name": "ops"}).json()
+    label = client.post("/api/labels", json={"name": "tag"}).json()
+    client.post(
+        "/api/tools",
+        json={"name": "deploy", "folderId": folder["id"], "labelIds": [label["id"]]},
+    )
+    client.post("/api/tools", json={"name": "audit", "folderId": folder["id"]})
+
+    facets = client.get("/api/tools/facets").json()
+    filtered = client.get("/api/tools/facets", params={"labels": str(label["id"])}).json()
+    client.post("/api/tools", json={"name": "rollback", "folderId": folder["id"]})
+    refreshed = client.get("/api/tools/facets").json()
+
+    assert {"id": folder["id"], "count": 2, "total": 2} in facets["folders"]
+    assert {"id": 1, "count": 0, "total": 2} in facets["folders"]
+    assert facets["labels"] == [
+        {"id": 1, "count": 0, "total": 1},
+        {"id": label["id"], "count": 1, "total": 1},
+    ]
+    assert {"id": folder["id"], "count": 1, "total": 1} in filtered["folders"]
+    assert {"id": folder["id"], "count": 3, "total": 3} in refreshed["folders"]
+
+
+def test_api_tools_rejects_invalid_cursor() -> None:
+    client = TestClient(create_app())
+
+    response = client.get("/api/tools", params={"after": "not-a-cursor"})
+
+    assert response.status_code == 400
+
+
+def test_api_tools_filters_by_folder_path_and_labels() -> None:
+    client = TestClient(create_app())
+    eng = client.post("/api/folders", json={"name": "eng"}).json()
+    infra = client.post("/api/folders", json={"name": "infra", "parentId": eng["id"]}).json()
+    label = client.post("/api/labels", json={"name": "prod"}).json()
+    client.post(
+        "/api/tools",
+        json={"name": "deploy", "folderId": infra["id"], "labelIds": [label["id"]]},
+    )
+    client.post("/api/tools", json={"name": "build", "folderId": infra["id"]})
+    client.post("/api/tools", json={"name": "notes", "labelIds": [label["id"]]})
+
+    by_path = client.get("/api/tools", params={"folderPath": "ENG / infra"}).json()
+    by_label = client.get("/api/tools", params={"labels": str(label["id"])}).json()
+    combined = client.get(
+        "/api/tools", params={"folderPath": "infra", "labels": str(label["id"])}
+    ).json()
+
+    assert [tool["name"] for tool in by_path["tools"]] == ["build", "deploy"]
+    assert by_path["tools"][0]["folderPath"] == "root / eng / infra"
+    assert [tool["name"] for tool in by_label["tools"]] == ["deploy", "notes"]
+    assert [tool["name"] for tool in combined["tools"]] == ["deploy"]
+    assert combined["tools"][0]["labels"] == [{"id": label["id"], "name": "prod"}]
+
+
+def test_api_tools_search_ranks_name_matches_first() -> None:
+    client = TestClient(create_app())
+    client.post("/api/tools", json={"name": "archive", "description": "Moves mail to archive"})
+    client.post("/api/tools", json={"name": "mailer", "description": "Sends messages"})
+    client.post("/api/tools", json={"name": "report", "description": "Weekly summary"})
+
+    response = client.get("/api/tools", params={"search": "mail"})
+
+    assert response.status_code == 200
+    assert [tool["name"] for tool in response.json()["tools"]] == ["mailer", "archive"]
+
+
+def test_api_tools_search_rejects_name_cursor() -> None:
+    client = TestClient(create_app())
+    client.post("/api/tools", json={"name": "alpha"})
+    client.post("/api/tools", json={"name": "bravo"})
+    cursor = client.get("/api/tools", params={"limit": 1}).json()["nextCursor"]
+
+    response = client.get("/api/tools", params={"search": "alpha", "after": cursor})
+
+    assert response.status_code == 400
+
+
+def test_api_tools_label_filter_can_include_descendants() -> None:
+    client = TestClient(create_app())
+    parent = client.post("/api/labels", json={"name": "cloud"}).json()
+    child = client.post("/api/labels", json={"name": "aws", "parentId": parent["id"]}).json()
+    client.post("/api/tools", json={"name": "s3", "labelIds": [child["id"]]})
+    client.post("/api/tools", json={"name": "billing", "labelIds": [parent["id"]]})
+    client.post("/api/tools", json={"name": "local"})
+
+    exact = client.get("/api/tools", params={"labels": str(parent["id"])}).json()
+    nested = client.get(
+        "/api/tools", params={"labels": str(parent["id"]), "includeDescendants": "true"}
+    ).json()
+
+    assert [tool["name"] for tool in exact["tools"]] == ["billing"]
+    assert [tool["name"] for tool in nested["tools"]] == ["billing", "s3"]
+
+
+def test_api_reads_reflect_writes_after_caching() -> None:
+    client = TestClient(create_app())
+    folder = client.post("/api/folders", json={"name": "ops"}).json()
+    label = client.post("/api/labels", json={"name": "beta"}).json()
+    tool = client.post(
+        "/api/tools", json={"name": "pager", "folderId": folder["id"], "labelIds": [label["id"]]}
+    ).json()
+    client.get("/api/folders")
+    client.get("/api/tools")
+
+    client.put(f"/api/folders/{folder['id']}", json={"name": "sre"})
+    client.put(f"/api/labels/{label['id']}", json={"name": "stable"})
+
+    folders = {item["id"]: item for item in client.get("/api/folders").json()}
+    listed = client.get("/api/tools").json()["tools"]
+    assert folders[folder["id"]]["path"] == "root / sre"
+    assert listed[0]["id"] == tool["id"]
+    assert listed[0]["folderPath"] == "root / sre"
+    assert listed[0]["labels"] == [{"id": label["id"], "name": "stable"}]
+
+
+def test_catalog_lists_answer_if_none_match_with_304() -> None:
+    client = TestClient(create_app())
+    client.post("/api/tools", json={"name": "pager"})
+
+    for path in ("/api/tools", "/api/folders", "/api/labels"):
+        first = client.get(path)
+        etag = first.headers["etag"]
+        repeat = client.get(path, headers={"If-None-Match": etag})
+
+        assert repeat.status_code == 304
+        assert repeat.headers["etag"] == etag
+        assert repeat.content == b""
+
+
+def test_catalog_etag_changes_with_writes_and_query() -> None:
+    client = TestClient(create_app())
+    etag = client.get("/api/tools").headers["etag"]
+
+    assert client.get("/api/tools", params={"search": "x"}).headers["etag"] != etag
+
+    client.post("/api/tools", json={"name": "pager"})
+    response = client.get("/api/tools", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert [tool["name"] for tool in response.json()["tools"]] == ["pager"]
+
+
+def test_api_runs_against_a_file_database(tmp_path) -> None:
+    client = TestClient(create_app(db_path=tmp_path / "catalog.db"))
+
+    created = client.post("/api/tools", json={"name": "pager"})
+    listed = client.get("/api/tools")
+
+    assert created.status_code == 200
+    assert [tool["name"] for tool in listed.json()["tools"]] == ["pager"]
+
+
+def test_sql_timing_adds_server_timing_and_slow_query_log(tmp_path) -> None:
+    app = create_app(db_path=tmp_path / "catalog.db", sql_timing=True, slow_query_ms=0)
+    client = TestClient(app)
+    client.post("/api/tools", json={"name": "alpha"})
+
+    response = client.get("/api/tools")
+
+    timing = response.headers["server-timing"]
+    assert timing.startswith("app;dur=")
+    assert re.search(r'db;dur=[0-9.]+;desc="[0-9]+ queries"', timing)
+    assert "sql-1;dur=" in timing
+    slow = client.get("/api/debug/slow-queries").json()
+    assert slow["thresholdMs"] == 0
+    assert "GET /api/tools" in {entry["route"] for entry in slow["queries"]}
+
+
+def test_sql_timing_is_off_by_default() -> None:
+    client = TestClient(create_app())
+
+    assert "server-timing" not in client.get("/api/tools").headers
+    assert client.get("/api/debug/slow-queries").status_code == 404
+
+
+def test_failed_folder_update_rolls_back_rename() -> None:
+    client = TestClient(create_app())
+    parent = client.post("/api/folders", json={"name": "parent"}).json()
+    child = client.post("/api/folders", json={"name": "child", "parentId": parent["id"]}).json()
+
+    response = client.put(
+        f"/api/folders/{parent['id']}", json={"name": "renamed", "parentId": child["id"]}
+    )
+
+    assert response.status_code == 400
+    names = {folder["id"]: folder["name"] for folder in client.get("/api/folders").json()}
+    assert names[parent["id"]] == "parent"
+
+
+def test_copy_folder_endpoint_copies_subtree() -> None:
+    client = TestClient(create_app())
+    parent = client.post("/api/folders", json={"name": "template"}).json()
+    child = client.post("/api/folders", json={"name": "child", "parentId": parent["id"]}).json()
+    client.post("/api/tools", json={"name": "tool", "folderId": child["id"]})
+
+    response = client.post(f"/api/folders/{parent['id']}/copy", json={})
+
+    assert response.status_code == 200
+    copy = response.json()
+    assert copy["name"] == "template (copy)"
+    assert copy["parentId"] == 1
+    tools = client.get("/api/tools", params={"folderPath": "root / template (copy)"}).json()
+    assert [tool["name"] for tool in tools["tools"]] == ["tool"]
+    assert client.post("/api/folders/999/copy", json={}).status_code == 404
+    missing_parent = client.post(f"/api/folders/{parent['id']}/copy", json={"parentId": 999})
+    assert missing_parent.status_code == 400
+
+
+def test_bulk_tool_operations_report_per_item_results() -> None:
+    client = TestClient(create_app())
+    folder = client.post("/api/folders", json={"name": "ops"}).json()
+    label = client.post("/api/labels", json={"name": "beta"}).json()
+    existing = client.post("/api/tools", json={"name": "legacy"}).json()
+    client.get("/api/tools")
+
+    response = client.post(
+        "/api/tools/bulk",
+        json={
+            "operations": [
+                {"op": "create", "name": "pager", "labelIds": [label["id"]]},
+                {"op": "create", "name": "dialer", "folderId": folder["id"]},
+                {"op": "create", "name": "broken", "folderId": 999},
+                {"op": "update", "id": existing["id"], "name": "modern", "enabled": False},
+                {"op": "move", "id": existing["id"], "folderId": folder["id"]},
+                {"op": "delete", "id": 999},
+            ]
+        },
+    )
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [result["status"] for result in results] == ["ok", "ok", "error", "ok", "ok", "error"]
+    assert results[2]["error"] == "Folder not found"
+    assert results[5]["error"] == "Tool not found"
+    tools = {tool["name"]: tool for tool in client.get("/api/tools").json()["tools"]}
+    assert set(tools) == {"dialer", "modern", "pager"}
+    assert tools["pager"]["id"] == results[0]["id"]
+    assert tools["pager"]["labelIds"] == [label["id"]]
+    assert tools["dialer"]["folderId"] == folder["id"]
+    assert tools["modern"]["enabled"] is False
+    assert tools["modern"]["folderId"] == folder["id"]
+
+
+def test_bulk_operations_apply_in_order() -> None:
+    client = TestClient(create_app())
+    tool = client.post("/api/tools", json={"name": "pager"}).json()
+
+    response = client.post(
+        "/api/tools/bulk",
+        json={
+            "operations": [
+                {"op": "delete", "id": tool["id"]},
+                {"op": "update", "id": tool["id"], "name": "revived"},
+            ]
+        },
+    )
+
+    assert [result["status"] for result in response.json()["results"]] == ["ok", "error"]
+    assert client.get("/api/tools").json()["tools"] == []
+
+
+def test_bulk_update_of_the_same_tool_twice_keeps_the_last_labels() -> None:
+    client = TestClient(create_app())
+    first = client.post("/api/labels", json={"name": "alpha"}).json()
+    second = client.post("/api/labels", json={"name": "beta"}).json()
+    tool = client.post("/api/tools", json={"name": "pager"}).json()
+
+    response = client.post(
+        "/api/tools/bulk",
+        json={
+            "operations": [
+                {"op": "update", "id": tool["id"], "name": "first", "labelIds": [first["id"]]},
+                {"op": "update", "id": tool["id"], "name": "second", "labelIds": [second["id"]]},
+            ]
+        },
+    )
+
+    assert [result["status"] for result in response.json()["results"]] == ["ok", "ok"]
+    updated = client.get("/api/tools").json()["tools"][0]
+    assert updated["name"] == "second"
+    assert updated["labelIds"] == [second["id"]]
+
+
+def test_bulk_repeated_delete_reports_the_tool_as_gone() -> None:
+    client = TestClient(create_app())
+    tool = client.post("/api/tools", json={"name": "pager"}).json()
+
+    response = client.post(
+        "/api/tools/bulk",
+        json={
+            "operations": [
+                {"op": "delete", "id": tool["id"]},
+                {"op": "delete", "id": tool["id"]},
+            ]
+        },
+    )
+
+    results = response.json()["results"]
+    assert [result["status"] for result in results] == ["ok", "error"]
+    assert results[1]["error"] == "Tool not found"
+    assert client.get("/api/tools").json()["tools"] == []
+
+
+def test_export_streams_catalog_that_imports_into_a_new_app(tmp_path) -> None:
+    source = TestClient(create_app(db_path=tmp_path / "source.db"))
+    outer = source.post("/api/folders", json={"name": "outer"}).json()
+    inner = source.post("/api/folders", json={"name": "inner"}).json()
+    source.put(f"/api/folders/{outer['id']}", json={"name": "outer", "parentId": inner["id"]})
+    label = source.post("/api/labels", json={"name": "beta"}).json()
+    source.post(
+        "/api/tools",
+        json={"name": "pager", "folderId": outer["id"], "labelIds": [label["id"]]},
+    )
+
+    exported = source.get("/api/export")
+    assert exported.headers["content-type"].startswith("application/x-ndjson")
+    target = TestClient(create_app(db_path=tmp_path / "target.db"))
+    imported = target.post("/api/import", content=exported.content)
+
+    assert imported.status_code == 200
+    assert imported.json()["imported"] == {"folder": 3, "label": 2, "tool": 1, "tool_label": 1}
+    assert target.get("/api/folders").json() == source.get("/api/folders").json()
+    assert target.get("/api/labels").json() == source.get("/api/labels").json()
+    assert target.get("/api/tools").json() == source.get("/api/tools").json()
+
+
+def test_import_reports_malformed_line() -> None:
+    client = TestClient(create_app())
+    body = b'{"type": "folder", "id": 5, "name": "ops", "parentId": 1}\n{"type": "tool"}\n'
+
+    response = client.post("/api/import", content=body)
+
+    assert response.status_code == 400
+    assert response.json()["detail"]["error"].startswith("Line 2:")
+
+
+def test_api_tool_facets_cache_is_bounded() -> None:
+    app = create_app()
+    client = TestClient(app)
+    client.post("/api/tools", json={"name": "alpha"})
+
+    for index in range(FACET_CACHE_SIZE + 50):
+        client.get("/api/tools/facets", params={"search": f"term{index}"})
+
+    assert len(app.state.catalog._bounded["tool_facets"]) == FACET_CACHE_SIZE
@@ -0,0 +1,51 @@
+from benchmarks.catalog import CatalogSpec, generate_records, seed_database
+from benchmarks.runner import OPERATIONS, percentiles, run_benchmark
+from mcp_admin.db import get_connection
+
+
+def test_generator_is_seeded_and_follows_the_spec() -> None:
+    spec = CatalogSpec(tools=20, folder_depth=2, folder_fanout=3, labels=5, labels_per_tool=2)
+
+    records = list(generate_records(spec))
+
+    assert records == list(generate_records(spec))
+    assert records != list(generate_records(CatalogSpec(tools=20, seed=1)))
+    kinds = [record["type"] for record in records]
+    assert kinds.count("folder") == spec.folders == 12
+    assert kinds.count("label") == 5
+    assert kinds.count("tool") == 20
+    assert kinds.count("tool_label") == 40
+
+
+def test_seed_database_loads_the_catalog(tmp_path) -> None:
+    db_path = tmp_path / "catalog.db"
+
+    counts = seed_database(db_path, CatalogSpec(tools=30, folder_depth=2, folder_fanout=2))
+
+    conn = get_connection(db_path)
+    try:
+        assert conn.execute("SELECT count(*) FROM tools;").fetchone()[0] == 30
+    finally:
+        conn.close()
+    assert counts["folder"] == 6
+
+
+def test_percentiles_use_nearest_rank() -> None:
+    summary = percentiles([index / 1000 for index in range(1, 101)])
+
+    assert summary["count"] == 100
+    assert (summary["p50_ms"], summary["p95_ms"], summary["p99_ms"]) == (50.0, 95.0, 99.0)
+
+
+def test_run_benchmark_reports_every_operation(tmp_path) -> None:
+    report = run_benchmark(
+        CatalogSpec(tools=50, folder_depth=2, folder_fanout=2, labels=4),
+        iterations=3,
+        page_size=10,
+        db_path=tmp_path / "bench.db",
+    )
+
+    assert set(report["operations"]) == set(OPERATIONS)
+    for summary in report["operations"].values():
+        assert summary["count"] == 3
+        assert summary["p50_ms"] <= summary["p95_ms"] <= summary["p99_ms"]
@@ -0,0 +1,62 @@
+from mcp_admin.cache import CatalogCache
+
+
+def test_get_reuses_value_until_bump() -> None:
+    cache = CatalogCache()
+    calls: list[int] = []
+
+    def load() -> int:
+        calls.append(1)
+        return len(calls)
+
+    assert cache.get("folders", load) == 1
+    assert cache.get("folders", load) == 1
+    cache.bump()
+    assert cache.get("folders", load) == 2
+    assert cache.generation == 1
+
+
+def test_get_many_loads_only_missing_keys() -> None:
+    cache = CatalogCache()
+    requested: list[list[int]] = []
+
+    def load(keys: list[int]) -> dict[int, str]:
+        requested.append(sorted(keys))
+        return {key: f"tool-{key}" for key in keys if key != 3}
+
+    assert cache.get_many("tools", [1, 2], load) == {1: "tool-1", 2: "tool-2"}
+    assert cache.get_many("tools", [2, 3], load, default="none") == {2: "tool-2", 3: "none"}
+    assert cache.get_many("tools", [1, 3], load) == {1: "tool-1", 3: "none"}
+    assert requested == [[1, 2], [3]]
+
+
+def test_value_loaded_across_a_bump_is_not_stored() -> None:
+    cache = CatalogCache()
+
+    def load() -> str:
+        cache.bump()
+        return "stale"
+
+    assert cache.get("labels", load) == "stale"
+    assert cache.get("labels", lambda: "fresh") == "fresh"
+
+
+def test_get_bounded_evicts_least_recently_used() -> None:
+    cache = CatalogCache()
+    loads: list[str] = []
+
+    def loader(key: str):
+        def load() -> str:
+            loads.append(key)
+            return key.upper()
+
+        return load
+
+    for key in ("a", "b", "a", "c", "a", "b"):
+        assert cache.get_bounded("facets", key, loader(key), maxsize=2) == key.upper()
+
+    # "b" was evicted by "c", since "a" had been used more recently.
+    assert loads == ["a", "b", "c", "b"]
+    cache.bump()
+    cache.get_bounded("facets", "a", loader("a"), maxsize=2)
+    assert loads[-1] == "a"
@@ -0,0 +1,135 @@
+import sqlite3
+import threading
+from pathlib import Path
+
+import pytest
+
+from mcp_admin.db import (
+    ConnectionManager,
+    SlowQueryLog,
+    apply_migrations,
+    get_connection,
+    track_queries,
+    transaction,
+)
+from mcp_admin.repositories import ToolRepository
+from mcp_admin.services import ToolService
+
+
+@pytest.fixture()
+def manager(tmp_path: Path):
+    manager = ConnectionManager(tmp_path / "catalog.db", busy_timeout_ms=250, cache_size=-2000)
+    with manager.writer() as conn:
+        apply_migrations(conn)
+    yield manager
+    manager.close()
+
+
+def test_file_database_uses_wal_and_settings(manager: ConnectionManager) -> None:
+    reader = manager.reader()
+
+    assert reader.execute("PRAGMA journal_mode;").fetchone()[0] == "wal"
+    assert reader.execute("PRAGMA busy_timeout;").fetchone()[0] == 250
+    assert reader.execute("PRAGMA cache_size;").fetchone()[0] == -2000
+
+
+def test_reader_is_read_only_and_sees_commits(manager: ConnectionManager) -> None:
+    reader = manager.reader()
+
+    with pytest.raises(sqlite3.OperationalError):
+        reader.execute("INSERT INTO folders (name) VALUES ('nope');")
+    with manager.writer() as conn:
+        conn.execute("INSERT INTO folders (name) VALUES ('ops');")
+        assert reader.execute("SELECT count(*) FROM folders;").fetchone()[0] == 1
+        conn.commit()
+
+    assert reader.execute("SELECT count(*) FROM folders;").fetchone()[0] == 2
+
+
+def test_each_thread_gets_its_own_reader(manager: ConnectionManager) -> None:
+    seen: list[sqlite3.Connection] = []
+    thread = threading.Thread(target=lambda: seen.append(manager.reader()))
+    thread.start()
+    thread.join()
+
+    assert manager.reader() is manager.reader()
+    assert seen[0] is not manager.reader()
+
+
+def test_memory_database_shares_one_connection() -> None:
+    manager = ConnectionManager(":memory:")
+    with manager.writer() as conn:
+        assert manager.reader() is conn
+    manager.close()
+
+
+def test_transaction_commits_once_for_a_multi_step_write(manager: ConnectionManager) -> None:
+    statements: list[str] = []
+    changes: list[int] = []
+    manager.on_change(lambda: changes.append(1))
+
+    with manager.transaction() as conn:
+        conn.set_trace_callback(statements.append)
+        repo = ToolRepository(conn)
+        tool_id = repo.create("pager")
+        repo.set_labels(tool_id, [1])
+    conn.set_trace_callback(None)
+
+    assert [sql for sql in statements if sql.startswith("COMMIT")] == ["COMMIT"]
+    assert changes == [1]
+    assert manager.reader().execute("SELECT count(*) FROM tool_labels;").fetchone()[0] == 1
+
+
+def test_transaction_rolls_back_on_error(manager: ConnectionManager) -> None:
+    with pytest.raises(sqlite3.IntegrityError), manager.transaction() as conn:
+        ToolRepository(conn).create("pager")
+        ToolRepository(conn).create("orphan", folder_id=999)
+
+    assert manager.reader().execute("SELECT count(*) FROM tools;").fetchone()[0] == 0
+
+
+def test_nested_transaction_joins_the_outer_one() -> None:
+    conn = get_connection(":memory:")
+    apply_migrations(conn)
+    service = ToolService(conn)
+
+    with pytest.raises(RuntimeError), transaction(conn):
+        service.create_tool("pager")
+        raise RuntimeError("abort")
+
+    assert conn.execute("SELECT count(*) FROM tools;").fetchone()[0] == 0
+    conn.close()
+
+
+def test_instrumented_connection_times_statements_while_tracking() -> None:
+    conn = get_connection(":memory:", instrumented=True)
+    apply_migrations(conn)
+    conn.execute("SELECT 1;").fetchall()
+
+    with track_queries() as stats:
+        conn.executemany("INSERT INTO folders (name) VALUES (?);", [("a",), ("b",)])
+        names = [row["name"] for row in conn.execute("SELECT name FROM folders ORDER BY id;")]
+    conn.execute("SELECT 2;")
+    conn.close()
+
+    assert names == ["root", "a", "b"]
+    assert [statement.sql for statement in stats.statements] == [
+        "INSERT INTO folders (name) VALUES (?);",
+        "SELECT name FROM folders ORDER BY id;",
+    ]
+    assert stats.seconds > 0
+    assert stats.slowest(1)[0] in stats.statements
+
+
+def test_slow_query_log_keeps_statements_over_the_threshold() -> None:
+    log = SlowQueryLog(threshold_ms=0, capacity=2)
+    conn = get_connection(":memory:", instrumented=True)
+    with track_queries() as stats:
+        for number in range(3):
+            conn.execute(f"SELECT {number};")
+    conn.close()
+
+    log.record(stats, route="GET /test")
+
+    assert [entry["sql"] for entry in log.entries()] == ["SELECT 1;", "SELECT 2;"]
+    assert {entry["route"] for entry in log.entries()} == {"GET /test"}
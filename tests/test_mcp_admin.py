@@ -2,7 +2,7 @@ import sqlite3
 import unittest
 
 from mcp_admin.db import apply_migrations, get_connection
-from mcp_admin.repositories import FolderRepository, LabelRepository, ToolRepository
+from mcp_admin.repositories import FolderRepository, LabelRepository, ToolQuery, ToolRepository
 
 
 class MigrationTestCase(unittest.TestCase):
@@ -35,6 +35,7 @@ class FolderBehaviorTestCase(unittest.TestCase):
         self.conn = get_connection(":memory:")
         apply_migrations(self.conn)
         self.folders = FolderRepository(self.conn)
+        self.labels = LabelRepository(self.conn)
         self.tools = ToolRepository(self.conn)
 
     def tearDown(self) -> None:
@@ -63,6 +64,27 @@ class FolderBehaviorTestCase(unittest.TestCase):
         self.assertEqual(copy_row["parent_id"], 1)
         self.assertIn("copy", copy_row["name"])
 
+    def test_copy_folder_copies_subtree_tools_and_labels(self) -> None:
+        parent_id = self.folders.create("template")
+        child_id = self.folders.create("child", parent_id)
+        tool_id = self.tools.create("tool", child_id, description="desc")
+        label_id = self.labels.create("tag")
+        self.tools.add_label(tool_id, label_id)
+
+        copy_id = self.folders.copy(parent_id, child_id)
+
+        copy_row = self.folders.get(copy_id)
+        self.assertEqual(copy_row["parent_id"], child_id)
+        self.assertEqual(copy_row["path"], "root / template / child / template (copy)")
+        (child_copy,) = self.folders.list_children(copy_id)
+        self.assertEqual(child_copy["name"], "child")
+        self.assertEqual(child_copy["path"], "root / template / child / template (copy) / child")
+        (tool_copy,) = self.tools.list_in_folder(child_copy["id"])
+        self.assertNotEqual(tool_copy["id"], tool_id)
+        self.assertEqual(tool_copy["description"], "desc")
+        self.assertEqual([row["id"] for row in self.tools.list_labels(tool_copy["id"])], [label_id])
+        self.assertEqual(len(self.tools.list_in_folder(child_id)), 1)
+
     def test_move_folder_prevents_cycles(self) -> None:
         parent_id = self.folders.create("parent")
         child_id = self.folders.create("child", parent_id)
@@ -70,6 +92,40 @@ class FolderBehaviorTestCase(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.folders.move(parent_id, child_id)
 
+    def test_rename_and_move_rewrite_subtree_paths(self) -> None:
+        parent_id = self.folders.create("parent")
+        child_id = self.folders.create("child", parent_id)
+        grandchild_id = self.folders.create("grandchild", child_id)
+        other_id = self.folders.create("other")
+
+        self.folders.update(parent_id, "renamed")
+        self.assertEqual(
+            self.folders.paths([grandchild_id])[grandchild_id],
+            "root / renamed / child / grandchild",
+        )
+
+        self.folders.move(child_id, other_id)
+        self.assertEqual(
+            self.folders.paths([child_id, grandchild_id, parent_id]),
+            {
+                child_id: "root / other / child",
+                grandchild_id: "root / other / child / grandchild",
+                parent_id: "root / renamed",
+            },
+        )
+
+    def test_delete_folder_shortens_descendant_paths(self) -> None:
+        parent_id = self.folders.create("parent")
+        child_id = self.folders.create("child", parent_id)
+        grandchild_id = self.folders.create("grandchild", child_id)
+
+        self.folders.delete(parent_id)
+
+        self.assertEqual(
+            self.folders.paths([child_id, grandchild_id]),
+            {child_id: "root / child", grandchild_id: "root / child / grandchild"},
+        )
+
 
 class LabelBehaviorTestCase(unittest.TestCase):
     def setUp(self) -> None:
@@ -100,6 +156,43 @@ class LabelBehaviorTestCase(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.labels.move(parent_id, child_id)
 
+    def closure(self) -> set[tuple[int, int, int]]:
+        rows = self.conn.execute(
+            "SELECT ancestor_id, descendant_id, depth FROM label_closure;"
+        ).fetchall()
+        return {tuple(row) for row in rows}
+
+    def test_closure_tracks_moves_and_deletes(self) -> None:
+        parent_id = self.labels.create("parent")
+        child_id = self.labels.create("child", parent_id)
+        grandchild_id = self.labels.create("grandchild", child_id)
+        other_id = self.labels.create("other")
+
+        self.labels.move(child_id, other_id)
+        self.labels.delete(other_id)
+
+        self.assertEqual(
+            self.closure(),
+            {
+                (1, 1, 0),
+                (1, parent_id, 1),
+                (1, child_id, 1),
+                (1, grandchild_id, 2),
+                (parent_id, parent_id, 0),
+                (child_id, child_id, 0),
+                (child_id, grandchild_id, 1),
+                (grandchild_id, grandchild_id, 0),
+            },
+        )
+
+    def test_move_label_rejects_grandchild_parent(self) -> None:
+        parent_id = self.labels.create("parent")
+        child_id = self.labels.create("child", parent_id)
+        grandchild_id = self.labels.create("grandchild", child_id)
+
+        with self.assertRaises(ValueError):
+            self.labels.move(parent_id, grandchild_id)
+
     def test_copy_tool_includes_labels(self) -> None:
         tool_id = self.tools.create("tool")
         label_id = self.labels.create("label")
@@ -111,5 +204,98 @@ class LabelBehaviorTestCase(unittest.TestCase):
         self.assertEqual([row["id"] for row in labels], [label_id])
 
 
+class ToolSearchTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.conn = get_connection(":memory:")
+        apply_migrations(self.conn)
+        self.tools = ToolRepository(self.conn)
+
+    def tearDown(self) -> None:
+        self.conn.close()
+
+    def search(self, text: str) -> list[str]:
+        return [row["name"] for row in self.tools.list_matching(ToolQuery(search=text))]
+
+    def test_search_matches_token_prefixes(self) -> None:
+        self.tools.create("gmail_archive", description="Archive a message")
+        self.tools.create("calendar")
+
+        self.assertEqual(self.search("arch"), ["gmail_archive"])
+        self.assertEqual(self.search("gmail mess"), ["gmail_archive"])
+        self.assertEqual(self.search("cal"), ["calendar"])
+
+    def test_search_index_follows_updates_and_deletes(self) -> None:
+        tool_id = self.tools.create("draft")
+        self.tools.update(tool_id, "published", description="final copy")
+
+        self.assertEqual(self.search("draft"), [])
+        self.assertEqual(self.search("final"), ["published"])
+
+        self.tools.delete(tool_id)
+
+        self.assertEqual(self.search("published"), [])
+
+    def test_search_without_word_characters_matches_nothing(self) -> None:
+        tool_id = self.tools.create("calendar")
+        self.tools.create("c++ tools")
+        query = ToolQuery(search="++")
+
+        self.assertEqual(self.search("!!!"), [])
+        self.assertEqual(self.search("++"), [])
+        self.assertEqual(self.tools.folder_counts(query), [])
+        self.assertEqual(self.tools.label_counts(query), [])
+        self.assertEqual(self.tools.get(tool_id)["name"], "calendar")
+
+    def test_query_selects_only_requested_columns(self) -> None:
+        self.tools.create("calendar", description="Schedule")
+
+        (row,) = self.tools.list_matching(ToolQuery(columns=("enabled",)))
+
+        self.assertEqual(row.keys(), ["id", "name", "enabled"])
+        with self.assertRaises(ValueError):
+            self.tools.list_matching(ToolQuery(columns=("password",)))
+
+
+class ToolFacetTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.conn = get_connection(":memory:")
+        apply_migrations(self.conn)
+        self.folders = FolderRepository(self.conn)
+        self.labels = LabelRepository(self.conn)
+        self.tools = ToolRepository(self.conn)
+
+    def tearDown(self) -> None:
+        self.conn.close()
+
+    def test_counts_roll_up_folder_subtrees_and_label_descendants(self) -> None:
+        parent_id = self.folders.create("parent")
+        child_id = self.folders.create("child", parent_id)
+        self.folders.create("empty", parent_id)
+        label_id = self.labels.create("label")
+        child_label_id = self.labels.create("child", label_id)
+        mail_id = self.tools.create("mail", parent_id)
+        self.tools.create("mail_send", child_id)
+        sync_id = self.tools.create("sync", child_id)
+        self.tools.set_labels(mail_id, [label_id, child_label_id])
+        self.tools.set_labels(sync_id, [child_label_id])
+
+        folders = {
+            row["folder_id"]: (row["direct"], row["total"])
+            for row in self.tools.folder_counts(ToolQuery())
+        }
+        labels = {
+            row["label_id"]: (row["direct"], row["total"])
+            for row in self.tools.label_counts(ToolQuery())
+        }
+        searched = {
+            row["folder_id"]: row["total"]
+            for row in self.tools.folder_counts(ToolQuery(search="mail"))
+        }
+
+        self.assertEqual(folders, {1: (0, 3), parent_id: (1, 3), child_id: (2, 2)})
+        self.assertEqual(labels, {1: (0, 2), label_id: (1, 2), child_label_id: (2, 2)})
+        self.assertEqual(searched, {1: 2, parent_id: 2, child_id: 1})
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,72 @@
+import threading
+
+import pytest
+
+pytest.importorskip("fastapi")
+from fastapi.testclient import TestClient
+
+from mcp_admin.metrics import UNMATCHED_ROUTE, MetricsRecorder
+
+
+def test_recorder_renders_counters_and_cumulative_histograms() -> None:
+    recorder = MetricsRecorder(buckets=(0.1, 1.0))
+    recorder.request_started()
+    recorder.request_finished("GET", "/items", 200, 0.05)
+    recorder.request_started()
+    recorder.request_finished("GET", "/items", 500, 0.5)
+    recorder.request_started()
+
+    text = recorder.render()
+
+    assert "http_requests_in_flight 1\n" in text
+    assert 'http_requests_total{method="GET",route="/items",status="200"} 1\n' in text
+    assert 'http_request_errors_total{method="GET",route="/items"} 1\n' in text
+    assert 'http_request_duration_seconds_bucket{method="GET",route="/items",le="0.1"} 1\n' in text
+    assert 'http_request_duration_seconds_bucket{method="GET",route="/items",le="1"} 2\n' in text
+    assert 'http_request_duration_seconds_bucket{method="GET",route="/items",le="+Inf"} 2\n' in text
+    assert 'http_request_duration_seconds_count{method="GET",route="/items"} 2\n' in text
+
+
+def test_recorder_sums_per_thread_shards() -> None:
+    recorder = MetricsRecorder()
+
+    def work() -> None:
+        for _ in range(100):
+            recorder.request_started()
+            recorder.request_finished("POST", '/quote"d', 201, 0.001)
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    text = recorder.render()
+    assert 'http_requests_total{method="POST",route="/quote\\"d",status="201"} 400\n' in text
+    assert "http_requests_in_flight 0\n" in text
+
+
+def test_admin_api_exposes_route_and_pool_metrics() -> None:
+    from mcp_admin.api import create_app
+
+    client = TestClient(create_app())
+    client.post("/api/tools", json={"name": "alpha"})
+    client.get("/api/tools/1/missing")
+
+    text = client.get("/metrics").text
+
+    assert 'http_requests_total{method="POST",route="/api/tools",status="200"} 1\n' in text
+    assert f'route="{UNMATCHED_ROUTE}",status="404"' in text
+    assert "mcp_admin_db_transactions_total 1\n" in text
+    assert "# TYPE mcp_admin_db_readers gauge" in text
+
+
+def test_tool_server_apps_expose_metrics() -> None:
+    from server.app import app as oauth_app
+    from server.main import create_app
+
+    client = TestClient(create_app())
+    client.get("/mcp/tools")
+
+    assert 'route="/mcp/tools",status="200"' in client.get("/metrics").text
+    assert TestClient(oauth_app).get("/metrics").status_code == 200
@@ -0,0 +1,111 @@
+import contextlib
+import time
+
+import pytest
+
+pytest.importorskip("fastapi")
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from mcp_admin.profiling import PROFILE_HEADER, install_profiler
+
+
+def _busy_leaf(seconds: float) -> int:
+    deadline = time.perf_counter() + seconds
+    spins = 0
+    while time.perf_counter() < deadline:
+        spins += 1
+    return spins
+
+
+def _app(sample_rate: float = 0.0) -> FastAPI:
+    app = FastAPI()
+    install_profiler(app, sample_rate=sample_rate, interval=0.001)
+
+    @app.get("/sync/{item_id}")
+    def sync_work(item_id: int) -> dict:
+        return {"spins": _busy_leaf(0.05)}
+
+    @app.get("/async")
+    async def async_work() -> dict:
+        return {"spins": _busy_leaf(0.05)}
+
+    return app
+
+
+def _lines(client: TestClient, **params: str) -> list[str]:
+    return client.get("/debug/profile", params=params).text.splitlines()
+
+
+def test_header_tagged_requests_are_profiled_per_route() -> None:
+    with TestClient(_app()) as client:
+        client.get("/sync/1", headers={PROFILE_HEADER: "1"})
+        client.get("/sync/2", headers={PROFILE_HEADER: "1"})
+        client.get("/async", headers={PROFILE_HEADER: "1"})
+
+        lines = _lines(client)
+
+    sync_lines = [line for line in lines if line.startswith("GET /sync/{item_id};")]
+    async_lines = [line for line in lines if line.startswith("GET /async;")]
+    assert any("sync_work (" in line and "_busy_leaf (" in line for line in sync_lines)
+    assert any("async_work (" in line and "_busy_leaf (" in line for line in async_lines)
+    assert all(int(line.rsplit(" ", 1)[1]) > 0 for line in lines)
+
+
+def test_untagged_requests_are_not_profiled_when_sampling_is_off() -> None:
+    with TestClient(_app()) as client:
+        client.get("/sync/1")
+
+        assert _lines(client) == []
+        assert client.app.state.profiler._thread is None
+
+
+def test_sample_rate_and_reset() -> None:
+    with TestClient(_app(sample_rate=1.0)) as client:
+        client.get("/sync/1")
+
+        assert any("_busy_leaf (" in line for line in _lines(client, reset="true"))
+        assert _lines(client) == []
+
+
+def test_sample_rate_is_validated() -> None:
+    with pytest.raises(ValueError):
+        install_profiler(FastAPI(), sample_rate=2.0)
+
+
+def test_profiler_is_opt_in_for_both_apps() -> None:
+    from mcp_admin.api import create_app as create_admin_app
+    from server.main import create_app as create_tool_app
+
+    assert TestClient(create_admin_app()).get("/api/debug/profile").status_code == 404
+    assert TestClient(create_tool_app()).get("/debug/profile").status_code == 404
+
+    admin = TestClient(create_admin_app(profile_rate=0.0))
+    admin.get("/api/tools", headers={PROFILE_HEADER: "1"})
+    assert admin.get("/api/debug/profile").status_code == 200
+    tools = TestClient(create_tool_app(profile_rate=0.0))
+    assert tools.get("/debug/profile").status_code == 200
+
+
+def test_lifespan_stops_the_sampler_and_keeps_the_app_lifespan() -> None:
+    events: list[str] = []
+
+    @contextlib.asynccontextmanager
+    async def lifespan(app: FastAPI):
+        events.append("startup")
+        yield
+        events.append("shutdown")
+
+    app = FastAPI(lifespan=lifespan)
+    profiler = install_profiler(app)
+
+    @app.get("/work")
+    def work() -> dict:
+        return {"spins": _busy_leaf(0.01)}
+
+    with TestClient(app) as client:
+        client.get("/work", headers={PROFILE_HEADER: "1"})
+        assert profiler._thread is not None
+
+    assert events == ["startup", "shutdown"]
+    assert profiler._thread is None
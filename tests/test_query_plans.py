@@ -0,0 +1,257 @@
+"""EXPLAIN QUERY PLAN regression guard.
+
+Every statement the repositories and API issue during a representative
+workload is recorded with a trace callback, then planned. A plan step that
+walks a whole catalog table fails the test unless the statement is listed in
+``INTENTIONAL_SCANS`` or the table is allowed by ``INTENTIONAL_SCAN_FRAGMENTS``.
+Walking an index in order is allowed only under a ``LIMIT``, where keyset
+pagination stops after one page. Trigger bodies are planned too, since
+EXPLAIN on the statement that fires them does not cover them.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import sqlite3
+
+import pytest
+
+from mcp_admin.db import apply_migrations, get_connection
+from mcp_admin.repositories import FolderRepository, LabelRepository, ToolQuery, ToolRepository
+from mcp_admin.transfer import import_records, parse_record
+
+# Statements expected to read a whole table, matched exactly once whitespace
+# is collapsed.
+INTENTIONAL_SCANS = frozenset(
+    {
+        # Catalog-wide folder and label lists, cached per generation by the API.
+        "SELECT folders.id, folders.name, folder_tree.parent_id, folder_tree.path "
+        "FROM folders JOIN folder_tree ON folder_tree.folder_id = folders.id "
+        "ORDER BY folders.name;",
+        "SELECT labels.id, labels.name, label_tree.parent_id "
+        "FROM labels JOIN label_tree ON label_tree.label_id = labels.id "
+        "ORDER BY labels.name;",
+        # The streaming export reads everything by design.
+        "SELECT id, name, description, enabled, folder_id FROM tools ORDER BY id;",
+        "SELECT tool_id, label_id FROM tool_labels ORDER BY tool_id, label_id;",
+    }
+)
+# Filters composed into many statements: the fragment and the one table it
+# may scan. Other scans in the same statement are still reported.
+INTENTIONAL_SCAN_FRAGMENTS = (
+    # Substring match on the materialized path; reads folders, not tools.
+    ("instr(lower(path)", "folder_tree"),
+    # Unfiltered facets count every tool.
+    ("MATERIALIZED (SELECT tools.id, tools.folder_id FROM tools)", "tools"),
+)
+
+_ALIAS = re.compile(r"\b(?:\w+\.)?(\w+)\s+AS\s+(\w+)", re.IGNORECASE)
+_TRIGGER_BODY = re.compile(r"\bBEGIN\b(.*)\bEND\b", re.IGNORECASE | re.DOTALL)
+_ROW_REFERENCE = re.compile(r"\b(?:OLD|NEW)\.\w+\b")
+
+
+def _catalog_tables(conn: sqlite3.Connection) -> set[str]:
+    rows = conn.execute(
+        """
+        SELECT name
+        FROM sqlite_master
+        WHERE type = 'table'
+            AND name NOT LIKE 'sqlite_%'
+            AND name NOT LIKE 'tools_fts%'
+            AND name != 'schema_migrations';
+        """
+    ).fetchall()
+    return {row["name"] for row in rows}
+
+
+def _is_statement(sql: str) -> bool:
+    keyword = sql.lstrip().split(None, 1)[0].upper() if sql.strip() else ""
+    return keyword in {"SELECT", "INSERT", "UPDATE", "DELETE", "WITH"}
+
+
+def _full_scans(conn: sqlite3.Connection, sql: str, tables: set[str]) -> list[tuple[str, str]]:
+    aliases = {alias: table for table, alias in _ALIAS.findall(sql)}
+    limited = re.search(r"\bLIMIT\b", sql, re.IGNORECASE) is not None
+    scans = []
+    for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}"):
+        detail = row["detail"]
+        if not detail.startswith("SCAN ") or (limited and " USING " in detail):
+            continue
+        name = detail.split()[1]
+        table = aliases.get(name, name)
+        if table in tables:
+            scans.append((table, detail))
+    return scans
+
+
+def _unexpected_scans(conn: sqlite3.Connection, statements: list[str]) -> dict[str, list[str]]:
+    tables = _catalog_tables(conn)
+    failures: dict[str, list[str]] = {}
+    for sql in dict.fromkeys(statement.strip() for statement in statements):
+        normalized = " ".join(sql.split())
+        if not _is_statement(sql) or normalized in INTENTIONAL_SCANS:
+            continue
+        allowed = {table for fragment, table in INTENTIONAL_SCAN_FRAGMENTS if fragment in sql}
+        scans = [detail for table, detail in _full_scans(conn, sql, tables) if table not in allowed]
+        if scans:
+            failures[normalized] = scans
+    return failures
+
+
+def _trigger_statements(conn: sqlite3.Connection) -> list[str]:
+    statements = []
+    for row in conn.execute("SELECT sql FROM sqlite_master WHERE type = 'trigger';"):
+        body = _TRIGGER_BODY.search(row["sql"])
+        if body is None:
+            continue
+        # Row references become literals so the body can be planned on its own.
+        for statement in _ROW_REFERENCE.sub("1", body.group(1)).split(";"):
+            if _is_statement(statement) and "RAISE(" not in statement:
+                statements.append(statement)
+    return statements
+
+
+@pytest.fixture()
+def conn():
+    connection = get_connection(":memory:")
+    apply_migrations(connection)
+    yield connection
+    connection.close()
+
+
+def _run_repository_workload(conn: sqlite3.Connection) -> None:
+    folders = FolderRepository(conn)
+    labels = LabelRepository(conn)
+    tools = ToolRepository(conn)
+
+    parent_id = folders.create("parent")
+    child_id = folders.create("child", parent_id)
+    folders.update(child_id, "renamed")
+    folders.move(child_id, 1)
+    folders.move(child_id, parent_id)
+    folders.paths([parent_id, child_id])
+    folders.list_children(parent_id)
+
+    label_id = labels.create("label")
+    child_label_id = labels.create("child", label_id)
+    labels.update(child_label_id, "renamed")
+    labels.move(child_label_id, 1)
+    labels.move(child_label_id, label_id)
+    labels.list_children(label_id)
+
+    tool_ids = tools.create_many([("alpha", "", True, parent_id), ("beta", "", True, child_id)])
+    tool_id = tools.create("gamma", child_id, description="search me")
+    tools.get(tool_id)
+    tools.list_in_folder(child_id)
+    tools.add_label(tool_id, label_id)
+    tools.set_labels(tool_ids[0], [label_id, child_label_id])
+    tools.set_labels_many([(tool_ids[1], [child_label_id])])
+    tools.list_labels_for(tool_ids)
+    tools.list_labels(tool_id)
+    tools.update(tool_id, "gamma", description="updated")
+    tools.update_many([(tool_ids[0], "alpha", None, False, None)])
+    tools.move(tool_id, parent_id)
+    tools.move_many([(tool_id, child_id)])
+    tools.copy(tool_id, parent_id)
+    folders.copy(parent_id, 1)
+    labels.copy(child_label_id, 1)
+    folders.existing_ids([parent_id, child_id, 999])
+    labels.existing_ids([label_id, 999])
+    tools.existing_ids([*tool_ids, tool_id, 999])
+    # Import upserts, both replacing existing rows and creating new ones.
+    records = [
+        {"type": "folder", "id": child_id, "name": "imported", "parentId": parent_id},
+        {"type": "folder", "id": 500, "name": "new", "parentId": 1},
+        {"type": "label", "id": label_id, "name": "imported", "parentId": 1},
+        {"type": "label", "id": 500, "name": "new", "parentId": label_id},
+        {"type": "tool", "id": tool_ids[0], "name": "alpha", "folderId": 500},
+        {"type": "tool", "id": 500, "name": "new", "folderId": child_id},
+        {"type": "tool_label", "toolId": 500, "labelId": 500},
+    ]
+    import_records(
+        conn,
+        [parse_record(number, json.dumps(record)) for number, record in enumerate(records, 1)],
+    )
+    for query in (
+        ToolQuery(limit=10),
+        ToolQuery(limit=10, after=("alpha", tool_ids[0])),
+        ToolQuery(search="gam", limit=10),
+        ToolQuery(label_ids=[label_id], limit=10),
+        ToolQuery(label_ids=[label_id], include_descendant_labels=True, limit=10),
+    ):
+        tools.list_matching(query)
+        tools.folder_counts(query)
+        tools.label_counts(query)
+    tools.remove_label(tool_id, label_id)
+    tools.delete(tool_id)
+    tools.delete_many(tool_ids)
+    folders.delete(child_id)
+    labels.delete(child_label_id)
+
+
+def test_repository_queries_use_indexes(conn) -> None:
+    statements: list[str] = []
+    conn.set_trace_callback(statements.append)
+    _run_repository_workload(conn)
+    conn.set_trace_callback(None)
+
+    assert _unexpected_scans(conn, statements) == {}
+
+
+def test_trigger_statements_use_indexes(conn) -> None:
+    assert _unexpected_scans(conn, _trigger_statements(conn)) == {}
+
+
+def test_api_queries_use_indexes() -> None:
+    pytest.importorskip("fastapi")
+    from fastapi.testclient import TestClient
+
+    from mcp_admin.api import create_app
+
+    app = create_app()
+    client = TestClient(app)
+    statements: list[str] = []
+    with app.state.db.writer() as conn:
+        conn.set_trace_callback(statements.append)
+    folder = client.post("/api/folders", json={"name": "ops"}).json()
+    label = client.post("/api/labels", json={"name": "tag"}).json()
+    tool = client.post(
+        "/api/tools",
+        json={"name": "tool", "folderId": folder["id"], "labelIds": [label["id"]]},
+    ).json()
+    client.put(f"/api/tools/{tool['id']}", json={"name": "renamed", "folderId": folder["id"]})
+    client.get("/api/folders")
+    client.get("/api/labels")
+    client.get("/api/tools")
+    client.get("/api/tools", params={"search": "ren", "labels": str(label["id"])})
+    client.get("/api/tools", params={"folderPath": "ops"})
+    client.get("/api/tools/facets", params={"labels": str(label["id"])})
+    client.post(f"/api/folders/{folder['id']}/copy", json={})
+    client.get("/api/export")
+    with app.state.db.writer() as conn:
+        conn.set_trace_callback(None)
+        failures = _unexpected_scans(conn, statements)
+
+    assert statements
+    assert failures == {}
+
+
+def test_guard_reports_unindexed_queries(conn) -> None:
+    conn.execute("DROP INDEX tools_folder_name;")
+
+    failures = _unexpected_scans(conn, ["SELECT id FROM tools WHERE folder_id = 1 ORDER BY name;"])
+
+    assert list(failures.values()) == [["SCAN tools USING INDEX tools_name"]]
+
+
+def test_guard_checks_point_lookups_on_listed_tables(conn) -> None:
+    # Only the exact catalog listings are exempt, not every query on folders.
+    statements = [
+        "SELECT id, name\nFROM folders\nWHERE name = 'ops';",
+        "SELECT id, name\nFROM labels\nWHERE name = 'tag';",
+    ]
+
+    failures = _unexpected_scans(conn, statements)
+
+    assert list(failures.values()) == [["SCAN folders"], ["SCAN labels"]]
@@ -0,0 +1,150 @@
+import threading
+from typing import Any, Dict
+
+import anyio
+import pytest
+
+from server.executor import ToolExecutor
+from server.jsonrpc import INVALID_REQUEST, MAX_BATCH_SIZE, TOOL_ERROR, handle
+from server.mcp_registry import MCPRegistry
+from server.tool_loader import ToolSpec
+from server.tools.base import BaseTool, Tool
+from server.tools.example_tool import ExampleEchoTool
+
+pytest.importorskip("fastapi")
+from fastapi.testclient import TestClient
+
+from server.main import create_app
+
+
+class FailingTool(BaseTool):
+    def __init__(self) -> None:
+        super().__init__(Tool(name="tests.fail", description="", folder_id="tests"))
+
+    def run(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        raise RuntimeError("boom")
+
+
+class RendezvousTool(BaseTool):
+    def __init__(self, name: str, barrier: threading.Barrier) -> None:
+        super().__init__(Tool(name=name, description="", folder_id="tests"))
+        self.barrier = barrier
+
+    def run(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        # Only returns once both calls are running at the same time.
+        self.barrier.wait(timeout=5)
+        return {"name": self.metadata.name}
+
+
+def test_batch_endpoint_runs_calls_concurrently_and_answers_in_order() -> None:
+    app = create_app()
+    client = TestClient(app)
+
+    response = client.post(
+        "/mcp/batch",
+        json=[
+            {"jsonrpc": "2.0", "id": 1, "method": "example.echo", "params": {"n": 1}},
+            {"jsonrpc": "2.0", "id": "b", "method": "missing"},
+            {"jsonrpc": "2.0", "method": "example.echo", "params": {"n": 2}},
+            {"jsonrpc": "2.0", "id": 3, "method": "example.echo", "params": [1]},
+            {"id": 4, "method": "example.echo"},
+            {"jsonrpc": "2.0", "id": 5, "method": "example.echo"},
+        ],
+    )
+
+    assert response.status_code == 200
+    assert response.json() == [
+        {"jsonrpc": "2.0", "id": 1, "result": {"echo": {"n": 1}}},
+        {"jsonrpc": "2.0", "id": "b", "error": {"code": -32601, "message": "Tool not found"}},
+        {
+            "jsonrpc": "2.0",
+            "id": 3,
+            "error": {"code": -32602, "message": "params must be an object"},
+        },
+        {"jsonrpc": "2.0", "id": 4, "error": {"code": -32600, "message": "Invalid Request"}},
+        {"jsonrpc": "2.0", "id": 5, "result": {"echo": {}}},
+    ]
+
+
+def test_batch_endpoint_edge_cases() -> None:
+    client = TestClient(create_app())
+
+    single = {"jsonrpc": "2.0", "id": 7, "method": "example.echo", "params": {}}
+    assert client.post("/mcp/batch", json=single).json()["result"] == {"echo": {}}
+    assert client.post("/mcp/batch", json=[]).json()["error"]["code"] == -32600
+    notification = {"jsonrpc": "2.0", "method": "example.echo"}
+    assert client.post("/mcp/batch", json=[notification]).status_code == 204
+    headers = {"content-type": "application/json"}
+    malformed = client.post("/mcp/batch", content=b"[{", headers=headers)
+    assert malformed.json()["error"] == {"code": -32700, "message": "Parse error"}
+
+
+def test_batch_reports_tool_failures_per_call() -> None:
+    registry = MCPRegistry()
+    registry.register_many([FailingTool(), ExampleEchoTool()])
+    body = [
+        {"jsonrpc": "2.0", "id": 1, "method": "tests.fail"},
+        {"jsonrpc": "2.0", "id": 2, "method": "example.echo", "params": {"a": 1}},
+    ]
+
+    failed, ok = anyio.run(handle, registry, ToolExecutor(), body)
+
+    assert failed["error"] == {"code": TOOL_ERROR, "message": "boom"}
+    assert ok["result"] == {"echo": {"a": 1}}
+
+
+def test_batch_calls_run_concurrently() -> None:
+    barrier = threading.Barrier(2)
+    registry = MCPRegistry()
+    registry.register_many([RendezvousTool("a", barrier), RendezvousTool("b", barrier)])
+    body = [
+        {"jsonrpc": "2.0", "id": 1, "method": "a"},
+        {"jsonrpc": "2.0", "id": 2, "method": "b"},
+    ]
+
+    responses = anyio.run(handle, registry, ToolExecutor(), body)
+
+    assert [response["result"] for response in responses] == [{"name": "a"}, {"name": "b"}]
+
+
+def test_batch_reports_lazy_import_failures_per_call() -> None:
+    registry = MCPRegistry()
+    registry.register_many([ExampleEchoTool()])
+    broken = Tool(name="broken", description="", folder_id="tests")
+    registry.register_lazy([ToolSpec("tests.no_such_tool_module", "Missing", broken)])
+    body = [
+        {"jsonrpc": "2.0", "id": 1, "method": "broken"},
+        {"jsonrpc": "2.0", "id": 2, "method": "example.echo"},
+    ]
+
+    failed, ok = anyio.run(handle, registry, ToolExecutor(), body)
+
+    assert failed["id"] == 1
+    assert failed["error"]["code"] == TOOL_ERROR
+    assert "no_such_tool_module" in failed["error"]["message"]
+    assert ok["result"] == {"echo": {}}
+
+
+def test_batch_answers_invalid_ids_with_null() -> None:
+    client = TestClient(create_app())
+
+    response = client.post(
+        "/mcp/batch",
+        json=[
+            {"jsonrpc": "2.0", "id": [1], "method": "example.echo"},
+            {"jsonrpc": "2.0", "id": True, "method": "example.echo"},
+        ],
+    )
+
+    assert [entry["id"] for entry in response.json()] == [None, None]
+    assert {entry["error"]["code"] for entry in response.json()} == {INVALID_REQUEST}
+
+
+def test_batch_length_is_limited() -> None:
+    client = TestClient(create_app())
+    call = {"jsonrpc": "2.0", "id": 1, "method": "example.echo"}
+
+    assert len(client.post("/mcp/batch", json=[call] * MAX_BATCH_SIZE).json()) == MAX_BATCH_SIZE
+    response = client.post("/mcp/batch", json=[call] * (MAX_BATCH_SIZE + 1)).json()
+    assert response["id"] is None
+    assert response["error"]["code"] == INVALID_REQUEST
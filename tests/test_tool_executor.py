@@ -0,0 +1,128 @@
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import anyio
+import pytest
+
+from server.executor import ToolExecutor
+from server.tools.base import BaseTool, Tool
+
+
+def _metadata(name: str, max_concurrency: Optional[int] = None) -> Tool:
+    return Tool(name=name, description="", folder_id="tests", max_concurrency=max_concurrency)
+
+
+class SlowTool(BaseTool):
+    def __init__(self, max_concurrency: Optional[int] = None) -> None:
+        super().__init__(_metadata("tests.slow", max_concurrency))
+        self.release = threading.Event()
+        self.lock = threading.Lock()
+        self.running = 0
+        self.peak = 0
+
+    def run(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        self.release.wait(5)
+        with self.lock:
+            self.running -= 1
+        return {"thread": threading.get_ident()}
+
+
+class FastTool(BaseTool):
+    def __init__(self) -> None:
+        super().__init__(_metadata("tests.fast"))
+
+    def run(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        return {"thread": threading.get_ident()}
+
+
+class AsyncTool(BaseTool):
+    def __init__(self) -> None:
+        super().__init__(_metadata("tests.async"))
+
+    async def run(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        await anyio.sleep(0)
+        return {"thread": threading.get_ident()}
+
+
+def test_tools_declare_async_by_defining_run_as_a_coroutine() -> None:
+    assert AsyncTool().is_async
+    assert not FastTool().is_async
+
+
+def test_max_concurrency_must_be_positive() -> None:
+    with pytest.raises(ValueError):
+        _metadata("tests.bad", max_concurrency=0)
+    with pytest.raises(ValueError):
+        ToolExecutor(max_workers=0)
+
+
+def test_blocking_tools_run_off_the_loop_and_async_tools_on_it() -> None:
+    executor = ToolExecutor()
+
+    async def main() -> None:
+        loop_thread = threading.get_ident()
+        blocking = await executor.run(FastTool(), {})
+        native = await executor.run(AsyncTool(), {})
+        assert blocking["thread"] != loop_thread
+        assert native["thread"] == loop_thread
+
+    anyio.run(main)
+
+
+def test_slow_tool_is_capped_while_other_tools_stay_responsive() -> None:
+    executor = ToolExecutor(max_workers=3)
+    slow = SlowTool(max_concurrency=2)
+
+    async def main() -> None:
+        async with anyio.create_task_group() as group:
+            for _ in range(5):
+                group.start_soon(executor.run, slow, {})
+            for _ in range(50):
+                if slow.running == 2:
+                    break
+                await anyio.sleep(0.01)
+
+            start = time.perf_counter()
+            with anyio.fail_after(2):
+                await executor.run(FastTool(), {})
+                await executor.run(AsyncTool(), {})
+            assert time.perf_counter() - start < 1
+            assert slow.running == 2
+            slow.release.set()
+
+    anyio.run(main)
+    assert slow.peak == 2
+
+
+def test_tool_server_runs_tools_through_the_executor() -> None:
+    pytest.importorskip("fastapi")
+    from fastapi.testclient import TestClient
+
+    from server.main import create_app
+
+    app = create_app(tool_workers=2)
+    client = TestClient(app)
+
+    response = client.post("/mcp/tools/example.echo", json={"text": "hi"})
+
+    assert response.json() == {"echo": {"text": "hi"}}
+    assert app.state.executor.max_workers == 2
+    assert client.post("/mcp/tools/missing", json={}).status_code == 404
+
+
+def test_tool_server_can_load_tools_lazily() -> None:
+    pytest.importorskip("fastapi")
+    from fastapi.testclient import TestClient
+
+    from server.main import create_app
+
+    client = TestClient(create_app(lazy_tools=True))
+
+    names = [tool["name"] for tool in client.get("/mcp/tools").json()["tools"]]
+    assert "example.echo" in names
+    response = client.post("/mcp/tools/example.echo", json={"a": 1})
+    assert response.json() == {"echo": {"a": 1}}
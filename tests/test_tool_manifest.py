@@ -0,0 +1,159 @@
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from server import tool_manifest
+from server.mcp_registry import MCPRegistry
+from server.tool_loader import discover_tool_specs, instantiate_tools, load_tools
+from server.tool_manifest import load_tool_specs, main, write_manifest
+
+TOOL_SOURCE = """
+from server.tools.base import BaseTool, Tool
+
+
+class {cls}(BaseTool):
+    def __init__(self) -> None:
+        super().__init__(Tool(name="{name}", description="", folder_id="tests"))
+"""
+
+SHARED_CHILD_SOURCE = """
+import manifest_tools_pkg_base as base
+
+
+class Child(base.Shared):
+    pass
+"""
+
+
+@pytest.fixture()
+def package(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    root = tmp_path / "src"
+    package_dir = root / "manifest_tools_pkg"
+    package_dir.mkdir(parents=True)
+    (package_dir / "__init__.py").write_text("")
+    (package_dir / "alpha.py").write_text(TOOL_SOURCE.format(cls="Alpha", name="alpha"))
+    (package_dir / "beta.py").write_text(TOOL_SOURCE.format(cls="Beta", name="beta"))
+    monkeypatch.syspath_prepend(str(root))
+    yield package_dir
+    for name in [name for name in sys.modules if name.startswith("manifest_tools_pkg")]:
+        del sys.modules[name]
+
+
+@pytest.fixture()
+def scanned(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    modules: list[str] = []
+    scan = tool_manifest.scan_module
+
+    def recording_scan(path, module, source=None):
+        modules.append(module)
+        return scan(path, module, source)
+
+    monkeypatch.setattr(tool_manifest, "scan_module", recording_scan)
+    return modules
+
+
+def _names(specs) -> list[str]:
+    return [spec.metadata.name for spec in specs]
+
+
+def test_manifest_maps_tool_names_to_classes(package: Path, tmp_path: Path) -> None:
+    path = tmp_path / "manifest.json"
+
+    assert main(["--package", "manifest_tools_pkg", "--output", str(path)]) == 0
+
+    modules = json.loads(path.read_text())["modules"]
+    tool = modules["manifest_tools_pkg.alpha"]["tools"][0]
+    assert tool["name"] == "alpha"
+    assert tool["target"] == "manifest_tools_pkg.alpha:Alpha"
+    assert tool["metadata"]["folder_id"] == "tests"
+    assert len(modules["manifest_tools_pkg.beta"]["sha256"]) == 64
+
+
+def test_unchanged_modules_are_not_rescanned(package: Path, tmp_path: Path, scanned) -> None:
+    path = tmp_path / "manifest.json"
+    write_manifest(path, "manifest_tools_pkg")
+    scanned.clear()
+
+    specs = load_tool_specs(path, "manifest_tools_pkg")
+
+    assert scanned == []
+    assert specs == discover_tool_specs("manifest_tools_pkg")
+    assert specs[0].load().metadata.name == "alpha"
+
+
+def test_touched_but_identical_modules_match_by_hash(
+    package: Path, tmp_path: Path, scanned
+) -> None:
+    path = tmp_path / "manifest.json"
+    write_manifest(path, "manifest_tools_pkg")
+    scanned.clear()
+    stat = os.stat(package / "alpha.py")
+    os.utime(package / "alpha.py", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert _names(load_tool_specs(path, "manifest_tools_pkg")) == ["alpha", "beta"]
+    assert scanned == []
+
+
+def test_changed_and_new_modules_are_rescanned(package: Path, tmp_path: Path, scanned) -> None:
+    path = tmp_path / "manifest.json"
+    write_manifest(path, "manifest_tools_pkg")
+    scanned.clear()
+    (package / "beta.py").write_text(TOOL_SOURCE.format(cls="Beta", name="beta.renamed"))
+    (package / "gamma.py").write_text(TOOL_SOURCE.format(cls="Gamma", name="gamma"))
+    (package / "alpha.py").unlink()
+
+    specs = load_tool_specs(path, "manifest_tools_pkg")
+
+    assert _names(specs) == ["beta.renamed", "gamma"]
+    assert sorted(scanned) == ["manifest_tools_pkg.beta", "manifest_tools_pkg.gamma"]
+
+
+def test_manifest_keeps_tools_on_a_base_class_from_another_module(
+    package: Path, tmp_path: Path
+) -> None:
+    (package.parent / "manifest_tools_pkg_base.py").write_text(
+        TOOL_SOURCE.format(cls="Shared", name="shared")
+    )
+    (package / "child.py").write_text(SHARED_CHILD_SOURCE)
+    path = tmp_path / "manifest.json"
+    write_manifest(path, "manifest_tools_pkg")
+
+    specs = load_tool_specs(path, "manifest_tools_pkg")
+
+    assert specs == discover_tool_specs("manifest_tools_pkg")
+    assert ("Child", None) in [(spec.class_name, spec.metadata) for spec in specs]
+    registry = MCPRegistry()
+    registry.register_lazy(specs)
+    names = [tool.metadata.name for tool in instantiate_tools("manifest_tools_pkg")]
+    assert names == ["alpha", "beta", "shared"]
+    assert [tool["name"] for tool in registry.list_tools()] == names
+    assert [tool.metadata.name for tool in load_tools(specs)] == names
+
+
+@pytest.mark.parametrize("contents", [None, "not json", '{"version": 0, "modules": {}}'])
+def test_missing_or_unusable_manifest_falls_back_to_scanning(
+    package: Path, tmp_path: Path, contents: str | None
+) -> None:
+    path = tmp_path / "manifest.json"
+    if contents is not None:
+        path.write_text(contents)
+
+    assert _names(load_tool_specs(path, "manifest_tools_pkg")) == ["alpha", "beta"]
+
+
+def test_tool_server_starts_from_a_manifest(tmp_path: Path) -> None:
+    pytest.importorskip("fastapi")
+    from fastapi.testclient import TestClient
+
+    from server.main import create_app
+
+    path = tmp_path / "manifest.json"
+    write_manifest(path)
+
+    for lazy in (False, True):
+        client = TestClient(create_app(lazy_tools=lazy, tool_manifest=path))
+        response = client.post("/mcp/tools/example.echo", json={"a": 1})
+        assert response.json() == {"echo": {"a": 1}}
@@ -1,9 +1,85 @@
+import sys
+import tempfile
+import textwrap
+import time
 import unittest
+from pathlib import Path
+
+import anyio
 
 from server.mcp_registry import MCPRegistry
-from server.tool_loader import discover_tool_classes, instantiate_tools
+from server.tool_loader import (
+    ToolSpec,
+    discover_tool_classes,
+    discover_tool_specs,
+    instantiate_tools,
+)
+from server.tools.base import BaseTool
 from server.tools.example_tool import ExampleEchoTool
 
+LAZY_MODULE = """
+from server.tools.base import BaseTool, Tool
+
+IMPORTED = True
+
+
+class LazyTool(BaseTool):
+    def __init__(self) -> None:
+        super().__init__(Tool(name="lazy.tool", description="Lazy.", folder_id="lazy"))
+
+    def run(self, payload):
+        return {"lazy": True}
+
+
+class LazierTool(LazyTool):
+    def __init__(self) -> None:
+        BaseTool.__init__(self, Tool("lazy.lazier", "Lazier.", "lazy", labels=["x"]))
+"""
+
+DYNAMIC_MODULE = """
+from server.tools.base import BaseTool, Tool
+
+NAME = "dynamic.tool"
+
+
+class DynamicTool(BaseTool):
+    def __init__(self) -> None:
+        super().__init__(Tool(name=NAME, description="", folder_id="dynamic"))
+"""
+
+
+SHARED_BASE_MODULE = """
+from server.tools.base import BaseTool, Tool
+
+
+class EchoBase(BaseTool):
+    def __init__(self, name: str) -> None:
+        super().__init__(Tool(name=name, description="", folder_id="shared"))
+
+    def run(self, payload):
+        return {"echo": payload}
+"""
+
+SHARED_CHILD_MODULE = """
+from collections import OrderedDict
+
+import lazy_tools_pkg_base as shared
+
+
+class EchoTool(shared.EchoBase):
+    def __init__(self) -> None:
+        super().__init__("shared.echo")
+
+
+class LoudEchoTool(EchoTool):
+    def __init__(self) -> None:
+        shared.EchoBase.__init__(self, "shared.loud")
+
+
+class Cache(OrderedDict):
+    pass
+"""
+
 
 class ToolDiscoveryTests(unittest.TestCase):
     def test_discover_tool_classes_finds_example(self) -> None:
@@ -23,5 +99,137 @@ class ToolDiscoveryTests(unittest.TestCase):
         self.assertIn("example.echo", names)
 
 
+class LazyToolLoadingTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        package = Path(tmp.name) / "lazy_tools_pkg"
+        package.mkdir()
+        (package / "__init__.py").write_text("raise ImportError('package must not load')\n")
+        self.package = package
+        sys.path.insert(0, tmp.name)
+        self.addCleanup(sys.path.remove, tmp.name)
+        self.addCleanup(self._forget_modules)
+
+    def _forget_modules(self) -> None:
+        for name in [name for name in sys.modules if name.startswith("lazy_tools_pkg")]:
+            del sys.modules[name]
+
+    def _write(self, name: str, source: str) -> None:
+        (self.package / f"{name}.py").write_text(textwrap.dedent(source))
+
+    def test_specs_come_from_source_without_importing(self) -> None:
+        self._write("lazy", LAZY_MODULE)
+
+        specs = discover_tool_specs("lazy_tools_pkg")
+
+        self.assertEqual(
+            [(spec.module, spec.class_name, spec.metadata.name) for spec in specs],
+            [
+                ("lazy_tools_pkg.lazy", "LazyTool", "lazy.tool"),
+                ("lazy_tools_pkg.lazy", "LazierTool", "lazy.lazier"),
+            ],
+        )
+        self.assertEqual(specs[1].metadata.labels, ["x"])
+        self.assertNotIn("lazy_tools_pkg", sys.modules)
+
+    def test_registry_imports_module_on_first_lookup(self) -> None:
+        self._write("lazy", LAZY_MODULE)
+        (self.package / "__init__.py").write_text("")
+        registry = MCPRegistry()
+        registry.register_lazy(discover_tool_specs("lazy_tools_pkg"))
+
+        self.assertEqual(
+            [tool["name"] for tool in registry.list_tools()], ["lazy.tool", "lazy.lazier"]
+        )
+        self.assertNotIn("lazy_tools_pkg.lazy", sys.modules)
+
+        tool = registry.tool("lazy.tool")
+
+        self.assertIn("lazy_tools_pkg.lazy", sys.modules)
+        self.assertEqual(tool.run({}), {"lazy": True})
+        self.assertIs(registry.tool("lazy.tool"), tool)
+        self.assertIsNone(registry.tool("missing"))
+
+    def test_first_async_lookup_imports_off_the_event_loop(self) -> None:
+        self._write("lazy", "import time\ntime.sleep(0.3)\n" + LAZY_MODULE)
+        (self.package / "__init__.py").write_text("")
+        registry = MCPRegistry()
+        registry.register_lazy(discover_tool_specs("lazy_tools_pkg"))
+        gaps: list[float] = []
+
+        async def main() -> BaseTool | None:
+            done = anyio.Event()
+
+            async def tick(*, task_status=anyio.TASK_STATUS_IGNORED) -> None:
+                task_status.started()
+                last = time.perf_counter()
+                while not done.is_set():
+                    await anyio.sleep(0.01)
+                    now = time.perf_counter()
+                    gaps.append(now - last)
+                    last = now
+
+            async with anyio.create_task_group() as group:
+                await group.start(tick)
+                tool = await registry.resolve("lazy.tool")
+                done.set()
+            return tool
+
+        tool = anyio.run(main)
+
+        self.assertEqual(tool.metadata.name, "lazy.tool")
+        # The import sleeps 0.3s; the loop kept ticking through it.
+        self.assertLess(max(gaps), 0.2)
+
+    def test_tools_without_literal_metadata_load_eagerly(self) -> None:
+        self._write("dynamic", DYNAMIC_MODULE)
+        (self.package / "__init__.py").write_text("")
+        specs = discover_tool_specs("lazy_tools_pkg")
+        self.assertIsNone(specs[0].metadata)
+
+        registry = MCPRegistry()
+        registry.register_lazy(specs)
+
+        self.assertIn("lazy_tools_pkg.dynamic", sys.modules)
+        self.assertEqual([tool["name"] for tool in registry.list_tools()], ["dynamic.tool"])
+
+    def test_tools_on_a_base_class_from_another_module_are_not_dropped(self) -> None:
+        (self.package.parent / "lazy_tools_pkg_base.py").write_text(SHARED_BASE_MODULE)
+        self._write("child", SHARED_CHILD_MODULE)
+        (self.package / "__init__.py").write_text("")
+
+        specs = discover_tool_specs("lazy_tools_pkg")
+        self.assertEqual(
+            [(spec.class_name, spec.metadata) for spec in specs],
+            [("EchoTool", None), ("LoudEchoTool", None), ("Cache", None)],
+        )
+
+        registry = MCPRegistry()
+        registry.register_lazy(specs)
+        eager = [tool.metadata.name for tool in instantiate_tools("lazy_tools_pkg")]
+
+        self.assertEqual(eager, ["shared.echo", "shared.loud"])
+        self.assertEqual([tool["name"] for tool in registry.list_tools()], eager)
+        self.assertEqual(registry.tool("shared.loud").run({"a": 1}), {"echo": {"a": 1}})
+
+    def test_load_rejects_a_name_that_disagrees_with_the_source(self) -> None:
+        self._write("lazy", LAZY_MODULE)
+        (self.package / "__init__.py").write_text("")
+        spec = discover_tool_specs("lazy_tools_pkg")[0]
+        spec.metadata.name = "renamed"
+
+        with self.assertRaises(ValueError):
+            spec.load()
+
+    def test_repository_tools_are_discovered_lazily(self) -> None:
+        specs = discover_tool_specs()
+
+        self.assertIn(
+            ToolSpec("server.tools.example_tool", "ExampleEchoTool", ExampleEchoTool().metadata),
+            specs,
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
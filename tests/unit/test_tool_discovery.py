@@ -1,4 +1,6 @@
-from mcp_admin.tools.registry import discover_tools, find_tool
+import pytest
+
+from mcp_admin.tools.registry import ToolNode, discover_tools, find_tool, get_label_path
 
 
 def test_discover_tools_builds_hierarchy() -> None:
@@ -49,3 +51,38 @@ def test_iter_tree_includes_root_and_children() -> None:
     names = [node.name for node in iter_tree(root)]
 
     assert names == ["root", "messaging", "echo"]
+
+
+def test_discover_tools_links_parents_and_indexes_names() -> None:
+    definitions = [
+        {
+            "name": "messaging",
+            "label": "Messaging",
+            "children": [{"name": "echo", "label": "Echo"}],
+        }
+    ]
+    root = discover_tools(definitions)
+
+    echo = root.children[0].children[0]
+
+    assert echo.parent is root.children[0]
+    assert root.index["echo"] is echo
+    assert find_tool(root, "root") is root
+
+
+def test_discover_tools_rejects_duplicate_names() -> None:
+    definitions = [
+        {"name": "messaging", "children": [{"name": "echo"}]},
+        {"name": "echo"},
+    ]
+
+    with pytest.raises(ValueError, match="echo"):
+        discover_tools(definitions)
+
+
+def test_hand_built_tree_is_indexed_on_first_lookup() -> None:
+    echo = ToolNode(name="echo", label="Echo")
+    root = ToolNode(name="root", label="Root", children=[echo])
+
+    assert find_tool(root, "echo") is echo
+    assert get_label_path(root, "echo") == ["Root", "Echo"]
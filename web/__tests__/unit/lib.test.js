@@ -27,6 +27,12 @@ test("buildToolQueryParams includes provided filters", () => {
   assert.equal(params, "search=agent&folderPath=%2Feng&labels=alpha%2Cbeta");
 });
 
+test("buildToolQueryParams includes the page cursor", () => {
+  const params = buildToolQueryParams({ search: "agent", after: "WyJhIiwxXQ" });
+
+  assert.equal(params, "search=agent&after=WyJhIiwxXQ");
+});
+
 test("buildToolQueryParams returns empty string without filters", () => {
   assert.equal(buildToolQueryParams(), "");
 });
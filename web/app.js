@@ -299,10 +299,16 @@ async function loadData() {
 }
 
 async function loadTools(query = {}) {
-  const params = buildToolQueryParams(query);
-  const path = params ? `/api/tools?${params}` : "/api/tools";
   try {
-    const tools = await apiRequest(path, {}, API_BASE);
+    const tools = [];
+    let after = null;
+    do {
+      const params = buildToolQueryParams({ ...query, after });
+      const path = params ? `/api/tools?${params}` : "/api/tools";
+      const page = await apiRequest(path, {}, API_BASE);
+      tools.push(...page.tools);
+      after = page.nextCursor;
+    } while (after);
     state.tools = tools;
     renderTools();
     renderMoveTools();
@@ -14,7 +14,7 @@ export function buildFolderTree(folders) {
   return roots;
 }
 
-export function buildToolQueryParams({ search, folderPath, labels } = {}) {
+export function buildToolQueryParams({ search, folderPath, labels, after } = {}) {
   const params = new URLSearchParams();
   if (search) {
     params.set("search", search);
@@ -25,5 +25,8 @@ export function buildToolQueryParams({ search, folderPath, labels } = {}) {
   if (labels && labels.length > 0) {
     params.set("labels", labels.join(","));
   }
+  if (after) {
+    params.set("after", after);
+  }
   return params.toString();
 }